@@ -4,10 +4,12 @@ Asset yönetimi - Discord RPC için görsel asset'lerin yönetimi
 
 import os
 import logging
-import requests
 from typing import Optional, Dict
 from pathlib import Path
 
+import http_client
+import tiers
+
 class AssetManager:
     """Discord RPC asset yöneticisi"""
     
@@ -32,19 +34,7 @@ class AssetManager:
     
     def get_rank_asset(self, tier: int) -> str:
         """Rank tier'ına göre asset key döndür"""
-        rank_assets = {
-            0: "unranked",
-            3: "iron", 4: "iron", 5: "iron",
-            6: "bronze", 7: "bronze", 8: "bronze",
-            9: "silver", 10: "silver", 11: "silver",
-            12: "gold", 13: "gold", 14: "gold",
-            15: "platinum", 16: "platinum", 17: "platinum",
-            18: "diamond", 19: "diamond", 20: "diamond",
-            21: "ascendant", 22: "ascendant", 23: "ascendant",
-            24: "immortal", 25: "immortal", 26: "immortal",
-            27: "radiant"
-        }
-        return rank_assets.get(tier, "unranked")
+        return tiers.tier(tier).asset_key
     
     def get_map_asset(self, map_name: str) -> str:
         """Harita adına göre asset key döndür"""
@@ -90,7 +80,7 @@ class AssetManager:
             return False
         
         try:
-            response = requests.get(asset_url, timeout=10)
+            response = http_client.get(asset_url)
             if response.status_code == 200:
                 asset_path = self.assets_dir / asset_type / f"{asset_name}.png"
                 with open(asset_path, 'wb') as f:
@@ -127,14 +117,12 @@ class AssetManager:
         self.logger.info("Asset'ler indiriliyor...")
         
         try:
-            # Rank iconları
-            tier_url = "https://media.valorant-api.com/competitivetiers/03621f52-342b-cf4e-4f86-9350a49c6d04"
-            ranks = ['iron', 'bronze', 'silver', 'gold', 'platinum', 'diamond', 'ascendant', 'immortal', 'radiant']
-            
-            for i, rank in enumerate(ranks):
-                tier_num = (i * 3) + 3  # 3, 6, 9, etc.
-                icon_url = f"{tier_url}/{tier_num}/smallicon.png"
-                self.download_asset(icon_url, 'ranks', rank)
+            # Rank iconları - her bölümün ilk tier'ı, Discord asset key'i ile
+            downloaded = set()
+            for info in tiers.get_tiers():
+                if info.ranked and info.asset_key not in downloaded:
+                    downloaded.add(info.asset_key)
+                    self.download_asset(info.icon_url, 'ranks', info.asset_key)
             
             self.logger.info("Asset indirme tamamlandı!")
             
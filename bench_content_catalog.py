@@ -0,0 +1,132 @@
+"""
+İçerik kataloğu benchmark'ı - katalog yükleme süresi, arama başına maliyet
+ve map path / queue ID çözümlemesinin doğruluğu
+
+Kullanım:
+    python bench_content_catalog.py [tekrar]
+
+Eski yöntem (her çağrıda dict literal'lerini kurup sırayla alt dizgi
+aramak) katalogdaki aynı verilerle taklit edilir; böylece iki yöntem aynı
+girdilerde karşılaştırılır. Çözümleme girdileri fixtures/content/lookups.json'dadır.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from content_catalog import BUNDLED_CATALOG, ContentCatalog, KeyMatcher
+from valorant_client_v2 import ValorantClientV2
+
+
+def legacy_lookups(catalog: ContentCatalog):
+    """Eski ValorantClientV2 metotlarının maliyeti - her çağrıda tablo kurulur ve taranır"""
+    agent_rows = [(a.name.lower(), a.uuid, a.name) for a in catalog.agents]
+    # Eski tablolarda her harita önce adıyla, sonra codename'iyle yer alıyordu
+    map_rows = [(key, m.uuid, m.name) for m in catalog.maps for key in (m.name.lower(), m.codename.lower())]
+    queue_rows = [(q.id, q.mode, q.name) for q in catalog.queues]
+
+    def agent_name(agent_id):
+        uuids = {key: uuid for key, uuid, _ in agent_rows}
+        names = {key: name for key, _, name in agent_rows}
+        lower = agent_id.lower()
+        for key, uuid in uuids.items():
+            if uuid == lower:
+                return {key: name for key, _, name in agent_rows}.get(key)
+        for key, name in names.items():
+            if key in lower:
+                return name
+        return ''
+
+    def map_name(map_path):
+        names = {key: name for key, _, name in map_rows}
+        lower = map_path.lower()
+        for key, name in names.items():
+            if key in lower:
+                return name
+        return ''
+
+    def queue_name(queue_id):
+        names = {key: name for key, _, name in queue_rows}
+        lower = queue_id.lower()
+        if lower in names:
+            return names[lower]
+        for key, name in names.items():
+            if key in lower:
+                return name
+        return ''
+
+    return agent_name, map_name, queue_name
+
+
+def per_call(func, inputs, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in inputs:
+            func(value)
+    return (time.perf_counter() - start) / (repeat * len(inputs))
+
+
+LOOKUPS = Path(__file__).resolve().parent / 'fixtures' / 'content' / 'lookups.json'
+
+
+def resolution(catalog: ContentCatalog, repeat: int):
+    """Kayıtlı map path ve queue ID'lerinde eski alt dizgi taraması ile derlenmiş eşleştirici"""
+    lookups = json.loads(LOOKUPS.read_text(encoding='utf-8'))
+    _, legacy_map, legacy_queue = legacy_lookups(catalog)
+    map_matcher = KeyMatcher({key: m for m in catalog.maps for key in (m.codename, m.name)})
+    queue_matcher = KeyMatcher({q.id: q for q in catalog.queues})
+
+    def name(found):
+        return found.name if found else None
+
+    cases = [
+        ('map path', lookups['maps'], legacy_map, catalog.map, map_matcher),
+        ('queue ID', lookups['queues'], legacy_queue, catalog.queue, queue_matcher),
+    ]
+    for label, pairs, legacy, resolve, matcher in cases:
+        inputs = [value for value, _ in pairs]
+        old_ok = sum((legacy(value) or None) == expected for value, expected in pairs)
+        new_ok = sum(name(resolve(value)) == expected for value, expected in pairs)
+        for value, expected in pairs:
+            if (legacy(value) or None) != expected:
+                print(f"  eski yöntem yanlış: {value!r} → {legacy(value) or None!r} (beklenen {expected!r})")
+
+        old = per_call(legacy, inputs, repeat)
+        compiled = per_call(matcher.match, inputs, repeat)
+        memo = per_call(resolve, inputs, repeat)
+        print(f"{label:<10} doğru: eski {old_ok}/{len(pairs)}, yeni {new_ok}/{len(pairs)} | "
+              f"eski: {old * 1e6:5.2f} µs | derlenmiş: {compiled * 1e6:5.2f} µs | "
+              f"önbellekli: {memo * 1e6:5.2f} µs")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    start = time.perf_counter()
+    for _ in range(20):
+        catalog = ContentCatalog.load()
+    load = (time.perf_counter() - start) / 20
+    print(f"Katalog yükleme ({BUNDLED_CATALOG.stat().st_size / 1024:.0f} KB): {load * 1000:.2f} ms "
+          f"- {len(catalog.agents)} ajan, {len(catalog.maps)} harita, {len(catalog.queues)} queue")
+
+    client = ValorantClientV2()
+    legacy_agent, legacy_map, legacy_queue = legacy_lookups(catalog)
+    cases = [
+        ('ajan adı (UUID)', [a.uuid for a in catalog.agents], legacy_agent, client.get_agent_display_name),
+        ('harita adı (path)', [m.path for m in catalog.maps], legacy_map, client.get_map_display_name),
+        ('queue adı', [q.id for q in catalog.queues], legacy_queue, client.get_queue_display_name),
+    ]
+
+    print()
+    for label, inputs, legacy, current in cases:
+        old = per_call(legacy, inputs, repeat)
+        new = per_call(current, inputs, repeat)
+        print(f"{label:<20} eski: {old * 1e6:7.2f} µs | katalog: {new * 1e6:6.2f} µs | {old / new:5.1f}x hızlı")
+
+    print("\n--- Map path / queue ID çözümleme ---")
+    resolution(catalog, repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+HTTP bağlantı benchmark'ı - her istekte yeni bağlantı (requests.get) ile
+ortak istemcinin keep-alive havuzunu lokal bir HTTPS sunucusunda karşılaştırır
+
+Kullanım:
+    python bench_http.py [istek_sayısı]
+
+Kendinden imzalı sertifika için `openssl` gerekir.
+"""
+
+import os
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+from http_client import HttpClient
+from mock_henrik_server import MockHenrikServer
+
+
+class LocalHTTPSServer:
+    """Kendinden imzalı sertifikalı mock Henrik sunucusu (v1 account fixture'ı, gzip'li)"""
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp(prefix='bench_http_')
+        self.cert = os.path.join(self.directory, 'cert.pem')
+        key = os.path.join(self.directory, 'key.pem')
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+             '-keyout', key, '-out', self.cert, '-subj', '/CN=localhost',
+             '-addext', 'subjectAltName=DNS:localhost'],
+            check=True, capture_output=True,
+        )
+
+        self.mock = MockHenrikServer(host='localhost')
+        self.mock.compress = True
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.cert, key)
+        self.mock.httpd.socket = context.wrap_socket(self.mock.httpd.socket, server_side=True)
+        self.url = f"https://localhost:{self.mock.port}/valorant/v1/account/Player/EUW"
+
+    @property
+    def connections(self) -> int:
+        return self.mock.connections
+
+    def start(self):
+        self.mock.start()
+
+    def stop(self):
+        self.mock.stop()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def run(label: str, server: LocalHTTPSServer, get, count: int):
+    """`count` isteği sırayla yap, süre ve açılan bağlantı sayısını yazdır"""
+    before = server.connections
+    start = time.perf_counter()
+    for _ in range(count):
+        response = get(server.url, verify=server.cert)
+        response.raise_for_status()
+        response.content
+    elapsed = time.perf_counter() - start
+    handshakes = server.connections - before
+    print(f"{label:<28} {elapsed * 1000:8.1f} ms toplam | "
+          f"{elapsed * 1000 / count:6.2f} ms/istek | {handshakes:4d} TLS el sıkışması")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    server = LocalHTTPSServer()
+    server.start()
+    print(f"🔐 Lokal HTTPS sunucu: {server.url} | {count} istek\n")
+
+    try:
+        client = HttpClient()
+        # Isınma - import ve sertifika yükleme maliyetini ölçüme katma
+        requests.get(server.url, verify=server.cert)
+        client.get(server.url, verify=server.cert)
+
+        bare = run("requests.get (bağlantısız)", server, lambda url, **kw: requests.get(url, timeout=5, **kw), count)
+        pooled = run("HttpClient (keep-alive)", server, client.get, count)
+        print(f"\n⚡ Hızlanma: {bare / pooled:.1f}x")
+        client.close()
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+JSON ayrıştırma benchmark'ı - kayıtlı Henrik cevaplarında response.json()
+ile seçici okuyucuyu (json_extract) süre ve en yüksek bellek açısından
+karşılaştırır
+
+Kullanım:
+    python bench_json_extract.py [tekrar] [büyütme]
+
+`büyütme` v2 maç cevabındaki round listesini katlar; gerçek maç cevapları
+(kill konumları, round başına hasar olayları) kayıtlı fixture'dan büyüktür.
+Ağ ölçümü mock_henrik_server üzerinden, gövde bağlantıdan okunurken yapılır.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+import requests
+
+import json_extract
+from mock_henrik_server import FIXTURES_DIR, MockHenrikServer
+from valorant_api import MATCH_HISTORY_FIELDS
+from valorant_client_v2 import LIVE_MATCH_FIELDS
+
+
+def load_payloads(scale: int):
+    match = json.loads((FIXTURES_DIR / 'match.json').read_bytes())
+    match['data']['rounds'] = match['data']['rounds'] * scale
+    return [
+        ('v2 match (canlı skor)', LIVE_MATCH_FIELDS, (FIXTURES_DIR / 'match.json').read_bytes()),
+        (f'v2 match x{scale}', LIVE_MATCH_FIELDS, json.dumps(match).encode('utf-8')),
+        ('v3 matches (geçmiş)', MATCH_HISTORY_FIELDS, (FIXTURES_DIR / 'matches.json').read_bytes()),
+    ]
+
+
+def measure(func, repeat: int):
+    """(ortalama süre, en yüksek bellek) - bellek ayrı bir çalıştırmada ölçülür"""
+    func()  # ısınma
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def report(label: str, full, selective):
+    (full_time, full_peak), (sel_time, sel_peak) = full, selective
+    print(f"{label:<26} json: {full_time * 1000:7.2f} ms {full_peak / 1024:8.0f} KB | "
+          f"seçici: {sel_time * 1000:7.2f} ms {sel_peak / 1024:8.0f} KB | "
+          f"bellek {full_peak / max(sel_peak, 1):4.1f}x az, süre {sel_time / full_time:4.1f}x")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    scale = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    if json_extract.ijson is None:
+        print("⚠️ ijson yüklü değil - seçici okuyucu json'a düşüyor, fark ölçülemez (pip install ijson)")
+    else:
+        print(f"ijson backend: {json_extract.ijson.backend}")
+
+    print("\n--- Bellekteki gövde ---")
+    for label, extractor, body in load_payloads(scale):
+        assert extractor.extract(body) == extractor.select(json.loads(body)), label
+        report(f"{label} ({len(body) / 1024:.0f} KB)",
+               measure(lambda: json.loads(body.decode('utf-8')), repeat),
+               measure(lambda: extractor.extract(body), repeat))
+
+    print("\n--- Ağdan (mock Henrik, stream=True) ---")
+    with MockHenrikServer() as server:
+        session = requests.Session()
+        for label, extractor, body in load_payloads(scale):
+            server.overrides['match'] = body
+            url = f"{server.base_url}/v2/match/bench"
+            report(f"{label} ({len(body) / 1024:.0f} KB)",
+                   measure(lambda: session.get(url, timeout=5).json(), repeat),
+                   measure(lambda: extractor.extract(session.get(url, timeout=5, stream=True)), repeat))
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Devre kesiciler - Henrik, valorant-api CDN ve GitHub uç noktaları çöktüğünde
+her istek timeout'u beklemez, hemen hata döner
+
+Her uç nokta grubunun kendi kesicisi vardır; biri çökünce diğerleri
+etkilenmez. Durum değişiklikleri loglanır ve dinleyicilere (motor → GUI)
+bildirilir.
+"""
+
+import logging
+import re
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+import requests
+
+CLOSED = 'closed'        # Normal - istekler geçer
+OPEN = 'open'            # Çökmüş - istekler hemen reddedilir
+HALF_OPEN = 'half_open'  # Deneme - tek istek geçer, sonucu durumu belirler
+
+# (kesici adı, URL regex'i) - ilk eşleşen geçerlidir, eşleşmeyen URL'ler korunmaz
+ENDPOINTS: List[Tuple[str, str]] = [
+    ('henrik-account', r'^https?://[^/]+/valorant/v\d/(by-puuid/)?account/'),
+    ('henrik-mmr', r'^https?://[^/]+/valorant/v\d/(by-puuid/)?mmr(-history)?/'),
+    ('henrik-match', r'^https?://[^/]+/valorant/v\d/(by-puuid/)?(match|matches|stored-matches|raw)\b'),
+    ('valorant-api', r'^https://(media\.)?valorant-api\.com/'),
+    ('github-releases', r'^https://api\.github\.com/repos/[^/]+/[^/]+/releases'),
+]
+
+# callback(breaker) - durum değiştiğinde, değişikliği yapan thread'de çağrılır
+BreakerCallback = Callable[['CircuitBreaker'], None]
+
+
+class CircuitOpenError(requests.RequestException):
+    """Devre açık - istek gönderilmedi"""
+
+
+class CircuitBreaker:
+    """Ardışık hatalarda açılan, zamanı gelince tek deneme isteğine izin veren kesici
+
+    - CLOSED: `failure_threshold` ardışık hata (bağlantı hatası, timeout, 5xx) → OPEN
+    - OPEN: `reset_timeout` boyunca istekler CircuitOpenError ile reddedilir
+    - HALF_OPEN: süre dolunca gelen ilk istek deneme olarak geçer; başarılıysa
+      CLOSED, değilse tekrar OPEN ve bekleme süresi ikiye katlanır
+    """
+
+    FAILURE_THRESHOLD = 3
+    RESET_TIMEOUT = 15.0
+    MAX_RESET_TIMEOUT = 5 * 60.0
+
+    def __init__(self, name: str, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None,
+                 max_reset_timeout: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.failure_threshold = failure_threshold or self.FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or self.RESET_TIMEOUT
+        self.max_reset_timeout = max_reset_timeout or self.MAX_RESET_TIMEOUT
+        self.clock = clock
+
+        self.state = CLOSED
+        self.failures = 0
+        self.retry_at = 0.0
+        self.stats = {
+            'rejected': 0,   # Devre açıkken reddedilen istekler
+            'opened': 0,
+        }
+
+        self._open_timeout = self.reset_timeout
+        self._probing = False
+        self._listeners: List[BreakerCallback] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: BreakerCallback):
+        self._listeners.append(callback)
+
+    def available(self) -> bool:
+        """İstek şu an geçebilir mi? (durumu değiştirmez)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                return self.clock() >= self.retry_at
+            return not self._probing
+
+    def before_request(self):
+        """
+        İsteğe izin ver veya reddet
+
+        Raises:
+            CircuitOpenError: Devre açıksa veya deneme isteği zaten sürüyorsa
+        """
+        changed = False
+        with self._lock:
+            if self.state == OPEN and self.clock() >= self.retry_at:
+                self.state = HALF_OPEN
+                changed = True
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+            elif self.state != CLOSED:
+                self.stats['rejected'] += 1
+                remaining = max(0.0, self.retry_at - self.clock())
+                raise CircuitOpenError(f"{self.name} devresi açık, {remaining:.0f} saniye sonra denenecek")
+        if changed:
+            self.logger.info(f"🔌 {self.name}: deneme isteği gönderiliyor")
+            self._notify()
+
+    def record_success(self):
+        with self._lock:
+            recovered = self.state != CLOSED
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+            self._open_timeout = self.reset_timeout
+        if recovered:
+            self.logger.info(f"✅ {self.name} tekrar erişilebilir, devre kapandı")
+            self._notify()
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                # Deneme başarısız - daha uzun bekle
+                self._open_timeout = min(self.max_reset_timeout, self._open_timeout * 2)
+            elif self.state != CLOSED or self.failures < self.failure_threshold:
+                return
+            self.state = OPEN
+            self._probing = False
+            self.retry_at = self.clock() + self._open_timeout
+            self.stats['opened'] += 1
+            timeout = self._open_timeout
+        self.logger.warning(f"⚠️ {self.name} yanıt vermiyor ({self.failures} hata), "
+                            f"istekler {timeout:.0f} saniye boyunca gönderilmeyecek")
+        self._notify()
+
+    def release(self):
+        """İstek ağ hatası dışında bir sebeple bitti - durum değişmez, deneme hakkı serbest kalır"""
+        with self._lock:
+            self._probing = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """GUI/log için durum özeti"""
+        with self._lock:
+            return {
+                'name': self.name,
+                'state': self.state,
+                'failures': self.failures,
+                'retry_in': max(0.0, self.retry_at - self.clock()) if self.state == OPEN else 0.0,
+                'rejected': self.stats['rejected'],
+            }
+
+    def _notify(self):
+        for callback in list(self._listeners):
+            try:
+                callback(self)
+            except Exception as e:
+                self.logger.error(f"Devre kesici dinleyici hatası ({self.name}): {e}")
+
+
+class BreakerRegistry:
+    """URL'yi uç nokta grubuna eşleyen kesici kümesi"""
+
+    def __init__(self, endpoints: Optional[List[Tuple[str, str]]] = None, **breaker_options):
+        self.endpoints = [(name, re.compile(pattern)) for name, pattern in (endpoints or ENDPOINTS)]
+        self.breakers: Dict[str, CircuitBreaker] = {
+            name: CircuitBreaker(name, **breaker_options) for name, _ in self.endpoints
+        }
+
+    def for_url(self, url: str) -> Optional[CircuitBreaker]:
+        """URL'nin kesicisi - korunmayan URL için None"""
+        for name, pattern in self.endpoints:
+            if pattern.match(url):
+                return self.breakers[name]
+        return None
+
+    def subscribe(self, callback: BreakerCallback):
+        """Tüm kesicilerin durum değişikliklerini dinle"""
+        for breaker in self.breakers.values():
+            breaker.subscribe(callback)
+
+    def unsubscribe(self, callback: BreakerCallback):
+        for breaker in self.breakers.values():
+            if callback in breaker._listeners:
+                breaker._listeners.remove(callback)
+
+    def states(self) -> Dict[str, str]:
+        return {name: breaker.state for name, breaker in self.breakers.items()}
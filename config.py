@@ -7,6 +7,9 @@ import os
 from typing import Optional
 from pathlib import Path
 
+# Henrik API kök adresi - testlerde mock_henrik_server'a yönlendirilebilir
+DEFAULT_HENRIK_BASE_URL = 'https://api.henrikdev.xyz/valorant'
+
 class Config:
     """Uygulama konfigürasyonu"""
     
@@ -34,9 +37,12 @@ class Config:
         self.riot_name = ''
         self.riot_tag = ''
         self.region = 'eu'
+        self.language = 'tr'
         self.discord_client_id = '1434340968487850135'
         self.henrik_api_key = ''
-        self.update_interval = 6
+        self.henrik_base_url = DEFAULT_HENRIK_BASE_URL
+        self.update_interval = 20
+        self.state_debounce = 1.5
         self.use_local_assets = False
         self.asset_cdn_url = 'https://media.valorant-api.com'
         self.show_rank = True
@@ -61,14 +67,21 @@ class Config:
                 self.riot_tag = config_data.get('riot_tag', '')
                 self.region = config_data.get('region', 'eu')
                 
+                # Presence dili (assets/locales altındaki paket)
+                self.language = config_data.get('language', 'tr')
+                
                 # Discord ayarları
                 self.discord_client_id = config_data.get('discord_client_id', '1434340968487850135')
                 
                 # Henrik Dev API Key (opsiyonel)
                 self.henrik_api_key = config_data.get('henrik_api_key', '')
+                self.henrik_base_url = config_data.get('henrik_base_url', DEFAULT_HENRIK_BASE_URL)
+                
+                # Boştayken en uzun poll aralığı (websocket değişiklikleri beklemeden gelir)
+                self.update_interval = config_data.get('update_interval', 20)
                 
-                # Güncelleme aralığı
-                self.update_interval = config_data.get('update_interval', 6)
+                # State geçişlerinin sabitlenmesi için beklenecek süre
+                self.state_debounce = config_data.get('state_debounce', 1.5)
                 
                 # Asset ayarları
                 self.use_local_assets = config_data.get('use_local_assets', False)
@@ -111,9 +124,12 @@ class Config:
             "riot_name": self.riot_name,
             "riot_tag": self.riot_tag,
             "region": self.region,
+            "language": self.language,
             "discord_client_id": self.discord_client_id,
             "henrik_api_key": self.henrik_api_key,
+            "henrik_base_url": self.henrik_base_url,
             "update_interval": self.update_interval,
+            "state_debounce": self.state_debounce,
             "use_local_assets": self.use_local_assets,
             "asset_cdn_url": self.asset_cdn_url,
             "show_rank": self.show_rank,
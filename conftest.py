@@ -0,0 +1,84 @@
+"""
+Ortak test yardımcıları - lokal HTTP sunucu fixture'ı ve koşul bekleme
+
+Henrik'e giden istekler mock_henrik_server.MockHenrikServer ile test edilir;
+buradaki sunucu Henrik dışı (valorant-api, genel HTTP) testler içindir.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+import pytest
+
+
+def wait_until(condition, timeout=5):
+    """Koşul sağlanana veya süre dolana kadar bekle - son sonucu döndürür"""
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """İstekleri sunucunun `respond(handler)` fonksiyonuna iletir"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits += 1
+        self.server.respond(self)
+
+    def reply(self, status: int, body: bytes = b'', headers: Optional[Dict[str, str]] = None):
+        try:
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            # İstemci timeout olup bağlantıyı kapattı
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Lokal HTTP sunucu fabrikası
+
+    `http_server(respond, **attrs)` sunucuyu başlatır; `respond(handler)` her
+    GET'te çağrılır ve `handler.reply(status, body, headers)` ile cevaplar.
+    `attrs` sunucuya test durumu olarak eklenir. Sunucu `url`, `hits` (istek
+    sayısı) ve `connections` (açılan bağlantı sayısı) tutar.
+    """
+    servers = []
+
+    def start(respond, **attrs):
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        httpd.daemon_threads = True
+        httpd.respond = respond
+        httpd.lock = threading.Lock()
+        httpd.hits = 0
+        httpd.connections = 0
+        for name, value in attrs.items():
+            setattr(httpd, name, value)
+        httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        servers.append(httpd)
+        return httpd
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
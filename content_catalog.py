@@ -0,0 +1,324 @@
+"""
+İçerik kataloğu - ajan, harita, mod, queue ve rank tier verileri
+
+Katalog `fetch_content.py` ile valorant-api'den üretilen sürümlü, kompakt
+bir JSON dosyasıdır (assets/content/catalog.json). Açılışta bir kez yüklenir;
+UUID, codename ve map path'e göre aramalar tek dict erişimidir. Görünen
+adlar aktif dil paketiyle (i18n) bir kez değiştirilir; ad çözümü yine tek erişimdir.
+content_updater güncel katalogu LocalAppData'ya yazar ve bellekteki
+katalogu set_catalog() ile tek atamada değiştirir.
+"""
+
+import functools
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
+
+import i18n
+
+SCHEMA_VERSION = 1
+
+# Ham matchMap / queueId başına tutulan çözümleme sayısı
+MEMO_SIZE = 256
+
+BUNDLED_CATALOG = Path(__file__).resolve().parent / 'assets' / 'content' / 'catalog.json'
+
+# Dosyada her koleksiyon satır listesidir; sütun sırası buradaki gibidir
+FIELDS: Dict[str, Tuple[str, ...]] = {
+    'agents': ('uuid', 'codename', 'name', 'icon'),
+    'maps': ('uuid', 'codename', 'name', 'path', 'icon'),
+    'modes': ('uuid', 'codename', 'name', 'icon'),
+    'queues': ('id', 'mode', 'name'),
+    'tiers': ('tier', 'division', 'name', 'icon'),
+}
+
+
+class Agent(NamedTuple):
+    uuid: str
+    codename: str
+    name: str
+    icon: str
+
+
+class Map(NamedTuple):
+    uuid: str
+    codename: str
+    name: str
+    path: str
+    icon: str
+
+
+class Mode(NamedTuple):
+    uuid: str
+    codename: str
+    name: str
+    icon: str
+
+
+class Queue(NamedTuple):
+    id: str
+    mode: str   # Mode UUID - icon için, yoksa ''
+    name: str
+
+
+class Tier(NamedTuple):
+    tier: int
+    division: str
+    name: str
+    icon: str
+
+
+class CatalogError(ValueError):
+    """Katalog dosyası okunamadı veya şeması uyumsuz"""
+
+
+def normalize(value: str) -> str:
+    """Arama anahtarı - 'KAY/O' → 'kayo', 'HURM_Helix' → 'hurmhelix'"""
+    return re.sub(r'[\W_]', '', value.casefold())
+
+
+class KeyMatcher:
+    """Tüm anahtarları tek regex'e derler; metindeki en uzun (en özel) eşleşmeyi tek geçişte bulur
+
+    Anahtar sadece tam kelime olarak eşleşir (önünde/arkasında harf veya rakam
+    olamaz): 'port' '/Game/Maps/Portal' içinde, 'competitive' 'competitiveteam'
+    içinde eşleşmez. Aynı uzunlukta birden çok eşleşmede sondaki kazanır -
+    map path'lerinde son parça en özel olanıdır.
+    """
+
+    def __init__(self, entries: Dict[str, Any]):
+        self._entries = {key.lower(): value for key, value in entries.items() if key}
+        keys = sorted(self._entries, key=len, reverse=True)
+        self._pattern = re.compile(
+            r'(?<![^\W_])(?:' + '|'.join(map(re.escape, keys)) + r')(?![^\W_])') if keys else None
+
+    def match(self, text: str) -> Optional[Any]:
+        if self._pattern is None:
+            return None
+        best = ''
+        for found in self._pattern.finditer(text.lower()):
+            if len(found.group()) >= len(best):
+                best = found.group()
+        return self._entries.get(best) if best else None
+
+
+class ContentCatalog:
+    """Katalog verisi ve O(1) indeksler - oluşturulduktan sonra değişmez"""
+
+    def __init__(self, data: Dict[str, Any]):
+        if data.get('schema') != SCHEMA_VERSION:
+            raise CatalogError(f"Desteklenmeyen katalog şeması: {data.get('schema')}")
+
+        self.version: str = data.get('version') or ''
+        self.generated: str = data.get('generated') or ''
+        # Koleksiyon başına valorant-api ETag'i - değişmeyenler tekrar indirilmez
+        self.etags: Dict[str, str] = dict(data.get('etags') or {})
+        # Adların işlendiği dil ('' = dosyadaki adlar) ve dilden bağımsız asıl katalog
+        self.language = ''
+        self.base: 'ContentCatalog' = self
+        try:
+            self.agents: Tuple[Agent, ...] = tuple(Agent(*row) for row in data['agents'])
+            self.maps: Tuple[Map, ...] = tuple(Map(*row) for row in data['maps'])
+            self.modes: Tuple[Mode, ...] = tuple(Mode(*row) for row in data['modes'])
+            self.queues: Tuple[Queue, ...] = tuple(Queue(*row) for row in data['queues'])
+            tiers = [Tier(*row) for row in data['tiers']]
+        except (KeyError, TypeError) as e:
+            raise CatalogError(f"Katalog bozuk: {e}") from e
+
+        # Tier numarası liste indeksi - boşluklar None
+        self.tiers: List[Optional[Tier]] = [None] * (max((t.tier for t in tiers), default=-1) + 1)
+        for tier in tiers:
+            self.tiers[tier.tier] = tier
+
+        self._agents: Dict[str, Agent] = {}
+        for agent in self.agents:
+            for key in (agent.uuid.lower(), normalize(agent.codename), normalize(agent.name)):
+                self._agents.setdefault(key, agent)
+
+        self._map_paths: Dict[str, Map] = {m.path.lower(): m for m in self.maps if m.path}
+        self._maps: Dict[str, Map] = {}
+        for map_ in self.maps:
+            for key in (map_.uuid.lower(), normalize(map_.codename), normalize(map_.name)):
+                self._maps.setdefault(key, map_)
+
+        self._modes: Dict[str, Mode] = {}
+        for mode in self.modes:
+            for key in (mode.uuid.lower(), normalize(mode.codename)):
+                self._modes.setdefault(key, mode)
+
+        self._queues: Dict[str, Queue] = {q.id.lower(): q for q in self.queues}
+
+        # Tam eşleşme olmazsa derlenmiş eşleştirici; sonuçlar ham değere göre hatırlanır
+        map_keys: Dict[str, Map] = {}
+        for map_ in self.maps:
+            for key in (map_.codename, map_.name):
+                map_keys.setdefault(key.lower(), map_)
+        self._map_matcher = KeyMatcher(map_keys)
+        self._queue_matcher = KeyMatcher(self._queues)
+        self._resolve_map = functools.lru_cache(maxsize=MEMO_SIZE)(self._match_map)
+        self._resolve_queue = functools.lru_cache(maxsize=MEMO_SIZE)(self._match_queue)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'ContentCatalog':
+        """
+        Katalog dosyasını yükle
+
+        Raises:
+            CatalogError: Dosya yok, JSON bozuk veya şema uyumsuz
+        """
+        path = Path(path) if path else BUNDLED_CATALOG
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CatalogError(f"Katalog okunamadı ({path}): {e}") from e
+        return cls(data)
+
+    def localize(self, pack: 'i18n.LocalePack') -> 'ContentCatalog':
+        """Dil paketindeki adlarla yeni katalog - pakette olmayanlar dosyadaki adı korur"""
+        data = self.base.to_dict()
+        data['agents'] = [[uuid, code, pack.agents.get(code, name), icon]
+                          for uuid, code, name, icon in data['agents']]
+        data['maps'] = [[uuid, code, pack.maps.get(code, name), path, icon]
+                        for uuid, code, name, path, icon in data['maps']]
+        data['modes'] = [[uuid, code, pack.modes.get(code, name), icon]
+                         for uuid, code, name, icon in data['modes']]
+        data['queues'] = [[queue_id, mode, pack.queues.get(queue_id, name)]
+                          for queue_id, mode, name in data['queues']]
+        data['tiers'] = [[tier, division, pack.tiers[tier] if tier < len(pack.tiers) else name, icon]
+                         for tier, division, name, icon in data['tiers']]
+        catalog = ContentCatalog(data)
+        catalog.language = pack.language
+        catalog.base = self.base
+        return catalog
+
+    def agent(self, key: str) -> Optional[Agent]:
+        """UUID, codename (ör. 'Wushu') veya isimden ajan"""
+        if not key:
+            return None
+        return self._agents.get(key.lower()) or self._agents.get(normalize(key))
+
+    def map(self, key: str) -> Optional[Map]:
+        """Map path (ör. '/Game/Maps/Duality/Duality'), UUID, codename veya isimden harita"""
+        if not key:
+            return None
+        return self._resolve_map(key)
+
+    def _match_map(self, key: str) -> Optional[Map]:
+        lower = key.lower()
+        return (self._map_paths.get(lower) or self._maps.get(lower) or self._maps.get(normalize(lower))
+                or self._map_matcher.match(lower))
+
+    def mode(self, key: str) -> Optional[Mode]:
+        """UUID veya codename'den oyun modu"""
+        if not key:
+            return None
+        return self._modes.get(key.lower()) or self._modes.get(normalize(key))
+
+    def queue(self, queue_id: str) -> Optional[Queue]:
+        """Queue ID'den (ör. 'competitive', 'hurm') queue"""
+        if not queue_id:
+            return None
+        return self._resolve_queue(queue_id)
+
+    def _match_queue(self, queue_id: str) -> Optional[Queue]:
+        lower = queue_id.lower()
+        return self._queues.get(lower) or self._queue_matcher.match(lower)
+
+    def queue_icon(self, queue: Queue) -> Optional[str]:
+        mode = self._modes.get(queue.mode) if queue.mode else None
+        return mode.icon if mode else None
+
+    def tier(self, number: int) -> Optional[Tier]:
+        if 0 <= number < len(self.tiers):
+            return self.tiers[number]
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dosya biçimi - fetch_content.py yazarken kullanır"""
+        return {
+            'schema': SCHEMA_VERSION,
+            'version': self.version,
+            'generated': self.generated,
+            'etags': dict(self.etags),
+            'agents': [list(a) for a in self.agents],
+            'maps': [list(m) for m in self.maps],
+            'modes': [list(m) for m in self.modes],
+            'queues': [list(q) for q in self.queues],
+            'tiers': [list(t) for t in self.tiers if t is not None],
+        }
+
+
+def write_catalog(data: Dict[str, Any], path: Optional[str] = None):
+    """Katalogu atomik olarak yaz - satır başına bir kayıt, ayraçlar boşluksuz"""
+    path = Path(path) if path else BUNDLED_CATALOG
+    lines = ['{']
+    for key in ('schema', 'version', 'generated', 'etags'):
+        lines.append(f'{json.dumps(key)}:{json.dumps(data.get(key), ensure_ascii=False)},')
+    for i, collection in enumerate(FIELDS):
+        rows = [json.dumps(row, ensure_ascii=False, separators=(',', ':')) for row in data.get(collection, [])]
+        closing = '' if i == len(FIELDS) - 1 else ','
+        lines.append(f'{json.dumps(collection)}:[\n' + ',\n'.join(rows) + f'\n]{closing}')
+    lines.append('}')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(tmp, path)
+
+
+_catalog: Optional[ContentCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def user_catalog_path() -> Path:
+    """content_updater'ın indirdiği katalog (LocalAppData)"""
+    from config import Config
+    return Path(Config.get_config_path()).parent / 'content_catalog.json'
+
+
+def load_newest(user_path: Optional[str] = None) -> ContentCatalog:
+    """İndirilmiş ve paketle gelen kataloglardan daha yeni üretilmiş olanı yükle
+
+    İndirilen dosya yoksa veya bozuksa paketle gelen kullanılır; uygulama
+    güncellenip daha yeni bir katalogla gelmişse eski indirme yok sayılır.
+    """
+    bundled = ContentCatalog.load()
+    try:
+        downloaded = ContentCatalog.load(user_path or str(user_catalog_path()))
+    except CatalogError:
+        return bundled
+    return downloaded if downloaded.generated >= bundled.generated else bundled
+
+
+def get_catalog() -> ContentCatalog:
+    """Uygulama genelinde paylaşılan, aktif dile çevrilmiş katalog (ilk çağrıda diskten)"""
+    global _catalog
+    locale = i18n.get_locale()
+    catalog = _catalog
+    if catalog is None or catalog.language != locale.language:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = load_newest()
+                logging.getLogger(__name__).debug(
+                    f"İçerik kataloğu yüklendi: {len(_catalog.agents)} ajan, {len(_catalog.maps)} harita "
+                    f"(sürüm {_catalog.version or 'bilinmiyor'})")
+            if _catalog.language != locale.language:
+                _catalog = _catalog.localize(locale)
+            catalog = _catalog
+    return catalog
+
+
+def set_catalog(catalog: ContentCatalog):
+    """Paylaşılan katalogu değiştir - okuyanlar eski veya yeni katalogu bütün olarak görür
+
+    Adlar bir sonraki get_catalog() çağrısında aktif dile çevrilir.
+    """
+    global _catalog
+    with _catalog_lock:
+        _catalog = catalog
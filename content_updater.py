@@ -0,0 +1,273 @@
+"""
+İçerik güncelleyici - valorant-api'deki yeni ajan, harita ve modları
+uygulama güncellemesi beklemeden kataloğa alır
+
+Günde en fazla bir kez sürüm uç noktasına bakılır; sürüm değiştiyse
+koleksiyonlar ETag ile koşullu istenir, sadece değişenler indirilir.
+Yeni katalog doğrulanır, LocalAppData'ya atomik yazılır ve bellekteki
+katalog tek atamada değiştirilir. Aramalar hiçbir zaman ağı beklemez.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+import requests
+
+import http_client
+import content_catalog
+import i18n
+from content_catalog import SCHEMA_VERSION, ContentCatalog, CatalogError, write_catalog
+
+API_URL = "https://valorant-api.com/v1"
+
+# Queue ID'leri valorant-api'de yok: (queue id, mod codename) - görünen adlar dil paketlerinde
+QUEUES = [
+    ('competitive', 'Bomb'),
+    ('competitiveteam', 'Bomb'),
+    ('unrated', 'Bomb'),
+    ('swiftplay', 'Swiftplay'),
+    ('spikerush', 'QuickBomb'),
+    ('deathmatch', 'Deathmatch'),
+    ('teamdeathmatch', 'HURM'),
+    ('hurm', 'HURM'),
+    ('ggteam', 'GunGame'),
+    ('onefa', 'OneForAll'),
+    ('snowball', 'SnowballFight'),
+    ('newmap', ''),
+    ('custom', ''),
+    ('premier', 'Bomb'),
+    ('clash', 'Skirmish'),
+    ('arcade', 'Skirmish'),
+    ('escalation', 'GunGame'),
+    ('lotus', ''),
+    ('unlimited', ''),
+    ('infiniteabilities', ''),
+    ('replication', 'OneForAll'),
+    ('range', 'ShootingRange'),
+]
+
+
+def _segment(path: str, index: int = -1) -> str:
+    parts = [p for p in (path or '').split('/') if p]
+    return parts[index] if len(parts) >= abs(index) else ''
+
+
+def parse_agents(data: List[Dict[str, Any]]) -> List[list]:
+    return [[a['uuid'], a.get('developerName') or a['displayName'], a['displayName'], a.get('displayIcon') or '']
+            for a in data]
+
+
+def parse_maps(data: List[Dict[str, Any]]) -> List[list]:
+    return [[m['uuid'], _segment(m.get('mapUrl', '')) or m['displayName'], m['displayName'],
+             m.get('mapUrl') or '', m.get('splash') or '']
+            for m in data]
+
+
+def parse_modes(data: List[Dict[str, Any]]) -> List[list]:
+    # assetPath: ShooterGame/Content/GameModes/Bomb/BombGameMode.BombGameMode_C → 'Bomb'
+    return [[m['uuid'], _segment(m.get('assetPath', ''), -2) or m['displayName'], m['displayName'],
+             m.get('displayIcon') or '']
+            for m in data]
+
+
+def parse_tiers(data: List[Dict[str, Any]]) -> List[list]:
+    # Son bölümün tier tablosu geçerli
+    return [[t['tier'], t.get('divisionName') or '', t.get('tierName') or '', t.get('largeIcon') or '']
+            for t in data[-1]['tiers']]
+
+
+def build_queues(modes: List[list], names: Optional[Dict[str, str]] = None) -> List[list]:
+    """Queue satırları - adı dil paketinde olmayan queue ID'sini ad olarak kullanır"""
+    names = names or {}
+    mode_uuids = {codename.lower(): uuid for uuid, codename, _, _ in modes}
+    return [[queue_id, mode_uuids.get(mode.lower(), ''), names.get(queue_id, queue_id)]
+            for queue_id, mode in QUEUES]
+
+
+# Koleksiyon → (valorant-api yolu, parametreler, ayrıştırıcı); queues modlardan türetilir
+SOURCES: Dict[str, Tuple[str, Dict[str, str], Callable[[List[Dict[str, Any]]], List[list]]]] = {
+    'agents': ('agents', {'isPlayableCharacter': 'true'}, parse_agents),
+    'maps': ('maps', {}, parse_maps),
+    'modes': ('gamemodes', {}, parse_modes),
+    'tiers': ('competitivetiers', {}, parse_tiers),
+}
+
+
+def validate(data: Dict[str, Any], previous: Optional[ContentCatalog] = None) -> ContentCatalog:
+    """
+    Yeni katalog verisini doğrula
+
+    Raises:
+        CatalogError: Şema/satır hatası, boş koleksiyon veya öncekinin yarısından az kayıt
+    """
+    catalog = ContentCatalog(data)
+    for name in ('agents', 'maps', 'modes', 'queues'):
+        rows = getattr(catalog, name)
+        if not rows:
+            raise CatalogError(f"{name} boş")
+        if previous is not None and len(rows) < len(getattr(previous, name)) // 2:
+            raise CatalogError(f"{name} beklenmedik şekilde küçüldü ({len(rows)})")
+    if not any(catalog.tiers):
+        raise CatalogError("tiers boş")
+    for agent in catalog.agents:
+        if len(agent.uuid) != 36:
+            raise CatalogError(f"Geçersiz ajan UUID'si: {agent.uuid!r}")
+    return catalog
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ContentUpdater:
+    """Katalogu arka planda günde en fazla bir kez valorant-api ile eşitler"""
+
+    CHECK_INTERVAL = 24 * 60 * 60
+    RETRY_INTERVAL = 60 * 60      # Hata sonrası
+    TIMEOUT = (3.05, 10)
+
+    def __init__(self, path: Optional[str] = None, state_path: Optional[str] = None,
+                 api_url: str = API_URL, language: str = 'tr-TR'):
+        self.logger = logging.getLogger(__name__)
+        self.path = path or str(content_catalog.user_catalog_path())
+        self.state_path = state_path or str(Path(self.path).with_name('content_state.json'))
+        self.api_url = api_url.rstrip('/')
+        self.language = language
+        self.stats = {
+            'checks': 0,
+            'downloaded': 0,    # 200 ile indirilen koleksiyonlar
+            'not_modified': 0,  # 304 - değişmemiş
+            'updates': 0,       # Değiştirilen katalog sayısı
+        }
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Arka plan kontrolünü başlat"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='ContentUpdater', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def due(self, now: Optional[float] = None) -> bool:
+        """Son kontrolün üzerinden CHECK_INTERVAL geçti mi?"""
+        now = time.time() if now is None else now
+        return now - self._load_state().get('checked', 0) >= self.CHECK_INTERVAL
+
+    def check(self, force: bool = False) -> bool:
+        """
+        Sürümü kontrol et, değiştiyse değişen koleksiyonları indirip katalogu değiştir
+
+        Returns:
+            Katalog değiştiyse True
+
+        Raises:
+            requests.RequestException, CatalogError: İndirme veya doğrulama hatası -
+                mevcut katalog olduğu gibi kalır
+        """
+        self.stats['checks'] += 1
+        current = content_catalog.get_catalog().base   # Dosyaya dil paketi uygulanmamış adlar yazılır
+        version = self._get('version').json()['data']
+        version = version.get('riotClientVersion') or version.get('version') or ''
+        self._save_state({'checked': time.time()})
+
+        if version and version == current.version and not force:
+            self.logger.debug(f"İçerik güncel (sürüm {version})")
+            return False
+
+        data = current.to_dict()
+        etags = dict(current.etags)
+        changed = []
+        for name, (path, params, parse) in SOURCES.items():
+            response = self._get(path, params, etag=etags.get(name))
+            if response.status_code == 304:
+                self.stats['not_modified'] += 1
+                continue
+            data[name] = parse(response.json()['data'])
+            etags[name] = response.headers.get('ETag', '')
+            changed.append(name)
+            self.stats['downloaded'] += 1
+        if 'modes' in changed:
+            data['queues'] = build_queues(data['modes'], self._queue_names())
+
+        data.update(schema=SCHEMA_VERSION, version=version, generated=_now(), etags=etags)
+        catalog = validate(data, current)
+        write_catalog(data, self.path)
+        content_catalog.set_catalog(catalog)
+        self.stats['updates'] += 1
+
+        if changed:
+            self.logger.info(f"🆕 İçerik güncellendi ({', '.join(changed)}): {len(catalog.agents)} ajan, "
+                             f"{len(catalog.maps)} harita - sürüm {version}")
+        return True
+
+    def build(self) -> Dict[str, Any]:
+        """Katalog verisini sıfırdan üret (fetch_content.py)"""
+        version = self._get('version').json()['data']
+        data: Dict[str, Any] = {
+            'schema': SCHEMA_VERSION,
+            'version': version.get('riotClientVersion') or version.get('version') or '',
+            'generated': _now(),
+            'etags': {},
+        }
+        for name, (path, params, parse) in SOURCES.items():
+            response = self._get(path, params)
+            data[name] = parse(response.json()['data'])
+            data['etags'][name] = response.headers.get('ETag', '')
+        data['queues'] = build_queues(data['modes'], self._queue_names())
+        return data
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self.CHECK_INTERVAL
+            if self.due():
+                try:
+                    self.check()
+                except (requests.RequestException, CatalogError, KeyError, IndexError, TypeError, ValueError) as e:
+                    self.logger.debug(f"İçerik kontrolü başarısız: {e}")
+                    delay = self.RETRY_INTERVAL
+            else:
+                delay = max(60.0, self.CHECK_INTERVAL - (time.time() - self._load_state().get('checked', 0)))
+            self._stop.wait(delay)
+
+    def _queue_names(self) -> Dict[str, str]:
+        """Queue adları diğer adlarla aynı dilin paketinden ('tr-TR' → tr)"""
+        for language in (self.language.split('-')[0].lower(), i18n.DEFAULT_LANGUAGE):
+            try:
+                return i18n.LocalePack.load(language).queues
+            except i18n.LocaleError:
+                continue
+        return {}
+
+    def _get(self, path: str, params: Optional[Dict[str, str]] = None, etag: Optional[str] = None) -> requests.Response:
+        headers = {'If-None-Match': etag} if etag else {}
+        response = http_client.get(f"{self.api_url}/{path}", params={**(params or {}), 'language': self.language},
+                                   headers=headers, timeout=self.TIMEOUT)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: Dict[str, Any]):
+        try:
+            Path(self.state_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError as e:
+            self.logger.debug(f"İçerik durumu yazılamadı: {e}")
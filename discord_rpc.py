@@ -3,37 +3,121 @@ Discord Rich Presence entegrasyonu
 """
 
 import logging
+import threading
 from pypresence import Presence
-from typing import Optional, Dict, Any
+from pypresence.exceptions import PipeClosed, InvalidPipe, DiscordNotFound, ResponseTimeout
+from pypresence.utils import get_ipc_path
+from typing import Optional, Dict, Any, Callable
 import time
 
+from rate_limit import TokenBucket, ExponentialBackoff
+
+# Discord kapandığında / IPC koptuğunda görülen hatalar
+PIPE_ERRORS = (PipeClosed, InvalidPipe, DiscordNotFound, ResponseTimeout,
+               BrokenPipeError, ConnectionError, EOFError)
+
 class DiscordRPC:
     """Discord RPC yöneticisi"""
     
-    def __init__(self, client_id: str):
+    # Discord SET_ACTIVITY limiti: 20 saniyede 5 güncelleme
+    RATE_LIMIT_UPDATES = 5
+    RATE_LIMIT_PERIOD = 20
+    
+    def __init__(self, client_id: str, clock: Callable[[], float] = time.monotonic):
         self.client_id = client_id
         self.rpc: Optional[Presence] = None
         self.connected = False
         self.logger = logging.getLogger(__name__)
+        
+        # Yayın durumu - son gönderilen ve limit yüzünden bekleyen presence
+        self.last_sent: Optional[Dict[str, Any]] = None
+        self.pending: Optional[Dict[str, Any]] = None
+        self.bucket = TokenBucket(self.RATE_LIMIT_UPDATES, self.RATE_LIMIT_PERIOD, clock=clock)
+        # Presence gerçekten Discord'a gittiğinde (flush'ı yapan thread'den) çağrılır
+        self.on_sent: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.stats = {
+            'sent': 0,        # Discord'a giden güncellemeler
+            'coalesced': 0,   # Limit içinde daha yenisi geldiği için atlananlar
+            'suppressed': 0,  # Son durumla aynı olduğu için hiç gönderilmeyenler
+        }
+        self._state_lock = threading.Lock()
+        self._send_lock = threading.Lock()
     
     def connect(self, retry_count: int = 3) -> bool:
         """Discord RPC'ye bağlan"""
+        if not self.ipc_available():
+            # Discord kapalı - bağlanmayı denemek boşuna
+            self.logger.debug("Discord IPC soketi bulunamadı")
+            return False
+        
+        backoff = ExponentialBackoff(base=1.0, maximum=8.0)
         for attempt in range(retry_count):
             try:
                 self.rpc = Presence(self.client_id)
                 self.rpc.connect()
                 self.connected = True
+                # Yeni bağlantıda Discord'daki presence boştur - son presence tekrar gönderilecek
+                with self._state_lock:
+                    if self.pending is None:
+                        self.pending = self.last_sent
+                    self.last_sent = None
                 self.logger.info("Discord RPC bağlantısı kuruldu!")
                 return True
             
             except Exception as e:
                 self.logger.warning(f"Bağlantı denemesi {attempt + 1}/{retry_count} başarısız: {e}")
+                self._mark_disconnected()
                 if attempt < retry_count - 1:
-                    time.sleep(2)
+                    time.sleep(backoff.next_delay())
         
         self.logger.error("Discord RPC bağlantısı kurulamadı!")
         return False
     
+    @staticmethod
+    def ipc_available() -> bool:
+        """Discord IPC soketi/pipe'ı mevcut mu? (Discord açık mı)"""
+        try:
+            return get_ipc_path() is not None
+        except OSError:
+            return False
+    
+    def ensure_connected(self) -> bool:
+        """
+        Bağlı değilse ve Discord açıksa bağlan
+        
+        IPC soketi yoksa bağlanmayı hiç denemez. Bağlanınca son presence
+        beklemeden tekrar gönderilir.
+        """
+        if self.connected:
+            return True
+        if not self.ipc_available():
+            return False
+        if not self.connect(retry_count=1):
+            return False
+        
+        self.flush()
+        return True
+    
+    def check_connection(self) -> bool:
+        """Bağlıyken IPC soketi kaybolduysa (Discord kapandı) bağlantıyı düşür"""
+        if self.connected and not self.ipc_available():
+            self.logger.warning("⚠️ Discord kapandı, IPC soketi kayboldu")
+            self._mark_disconnected()
+        return self.connected
+    
+    def _mark_disconnected(self):
+        """Kopan bağlantıyı sessizce bırak"""
+        self.connected = False
+        rpc, self.rpc = self.rpc, None
+        if rpc:
+            # pypresence her Presence için ayrı bir event loop açar
+            for close in (getattr(rpc.sock_writer, 'close', None), rpc.loop.close):
+                try:
+                    if close:
+                        close()
+                except Exception:
+                    pass
+    
     def update_presence(self, presence_data: Dict[str, Any]) -> bool:
         """Discord presence'ı güncelle"""
         if not self.connected or not self.rpc:
@@ -50,15 +134,97 @@ class DiscordRPC:
             self.rpc.update(**clean_data)
             return True
             
+        except PIPE_ERRORS as e:
+            # Discord kapandı - yeniden bağlanma engine'in gözetiminde yapılır
+            self.logger.warning(f"⚠️ Discord bağlantısı koptu: {type(e).__name__}")
+            self._mark_disconnected()
+            return False
+            
         except Exception as e:
             self.logger.error(f"Presence güncellenemedi: {e}")
+            return False
+    
+    @staticmethod
+    def clean_presence(presence_data: Dict[str, Any]) -> Dict[str, Any]:
+        """None değerleri kaldır, listeleri karşılaştırılabilir hale getir"""
+        return {k: (list(v) if isinstance(v, tuple) else v)
+                for k, v in presence_data.items() if v is not None}
+    
+    @staticmethod
+    def diff(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, tuple]:
+        """İki presence arasındaki alan bazlı farklar: {alan: (eski, yeni)}"""
+        old = old or {}
+        return {key: (old.get(key), new.get(key))
+                for key in set(old) | set(new)
+                if old.get(key) != new.get(key)}
+    
+    def submit(self, presence_data: Dict[str, Any]) -> bool:
+        """
+        Presence'ı yayın kuyruğuna al (bloklamaz)
+        
+        Son gönderilen (veya bekleyen) presence ile tüm alanlar aynıysa
+        hiçbir şey yapmaz. Limit dolduysa yalnızca en yenisi bekletilir.
+        Gönderim için ardından flush() çağrılmalı.
+        
+        Returns:
+            Presence değiştiyse True
+        """
+        clean_data = self.clean_presence(presence_data)
+        
+        with self._state_lock:
+            target = self.pending if self.pending is not None else self.last_sent
+            changes = self.diff(target, clean_data)
+            if not changes:
+                self.stats['suppressed'] += 1
+                return False
             
-            # Bağlantı kopmuşsa yeniden bağlan
-            if "RpcError" in str(e) or "ConnectionRefusedError" in str(e):
-                self.connected = False
-                self.connect()
+            if self.pending is not None:
+                # Limit penceresinde gönderilemeyen önceki güncellemenin yerine geç
+                self.stats['coalesced'] += 1
             
-            return False
+            if clean_data == self.last_sent:
+                # Bekleyen değişiklik geri alındı - Discord zaten bu durumda
+                self.pending = None
+            else:
+                self.pending = clean_data
+        
+        self.logger.debug(f"Presence değişen alanlar: {sorted(changes)}")
+        return True
+    
+    def flush(self) -> bool:
+        """Bekleyen presence'ı limit izin veriyorsa gönder (bloklar)"""
+        with self._send_lock:
+            if not self.connected:
+                # Bekleyen presence yeniden bağlanınca gönderilir
+                return False
+            with self._state_lock:
+                if self.pending is None or not self.bucket.consume():
+                    return False
+                data, self.pending = self.pending, None
+            
+            sent = self.update_presence(data)
+            
+            with self._state_lock:
+                if sent:
+                    self.last_sent = data
+                    self.stats['sent'] += 1
+                elif self.pending is None:
+                    # Gönderilemedi - daha yenisi gelmediyse tekrar denensin
+                    self.pending = data
+            
+            self.logger.debug(f"Discord yayın istatistikleri: {self.stats}")
+            if sent and self.on_sent:
+                self.on_sent(data)
+            return sent
+    
+    def has_pending(self) -> bool:
+        """Limit yüzünden bekleyen presence var mı?"""
+        with self._state_lock:
+            return self.pending is not None
+    
+    def next_flush_delay(self) -> float:
+        """Bekleyen presence'ın gönderilebilmesi için kalan süre"""
+        return self.bucket.time_until()
     
     def clear(self) -> bool:
         """Presence'ı temizle"""
@@ -81,4 +247,4 @@ class DiscordRPC:
             except Exception as e:
                 self.logger.error(f"RPC kapatma hatası: {e}")
             finally:
-                self.connected = False
+                self._mark_disconnected()
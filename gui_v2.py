@@ -4,6 +4,7 @@ System Tray desteği ile
 """
 
 import customtkinter as ctk
+import queue
 import threading
 import time
 import logging
@@ -13,13 +14,12 @@ import pystray
 from pystray import MenuItem as item
 import sys
 import webbrowser
-import requests
 from io import BytesIO
 
+import http_cache
+import i18n
 from config import Config
-from discord_rpc import DiscordRPC
-from valorant_client_v2 import ValorantClientV2
-from presence_builder_v2 import PresenceBuilderV2
+from presence_engine import PresenceEngine
 from version import __version__, GITHUB_RELEASES_URL, GITHUB_REPO_URL
 
 # CustomTkinter tema
@@ -50,7 +50,9 @@ class ValorantRPCGUI(ctk.CTk):
         self.running = False
         self.connected_discord = False
         self.connected_valorant = False
-        self.rpc_thread: Optional[threading.Thread] = None
+        self.engine: Optional[PresenceEngine] = None
+        # Motor thread'inden gelen olaylar - Tk tarafında poll edilir
+        self._engine_events: queue.Queue = queue.Queue()
         self.player_data = {}
         
         # System tray
@@ -74,6 +76,9 @@ class ValorantRPCGUI(ctk.CTk):
         # Minimize eventi
         self.bind("<Unmap>", self.on_minimize)
         
+        # Motor olaylarını dinle
+        self.poll_engine_events()
+        
         # Pencereyi ortala
         self.center_window()
         
@@ -81,9 +86,6 @@ class ValorantRPCGUI(ctk.CTk):
         if self.config.is_first_run or not self.config.validate():
             self.after(100, self.show_welcome_dialog)
         else:
-            # Config geçerliyse bileşenleri başlat
-            self.init_rpc_components()
-            
             # Sürüm kontrolü yap (arka planda)
             threading.Thread(target=self.check_for_updates, daemon=True).start()
             
@@ -91,14 +93,16 @@ class ValorantRPCGUI(ctk.CTk):
             self.after(500, self.auto_start)
     
     def init_rpc_components(self):
-        """RPC bileşenlerini başlat"""
+        """Bu çalışmanın motorunu oluştur (sadece start_rpc'den çağrılır)"""
         try:
-            henrik_key = getattr(self.config, 'henrik_api_key', None)
-            self.client = ValorantClientV2(region=self.config.region, henrik_api_key=henrik_key)
-            self.rpc = DiscordRPC(self.config.discord_client_id)
-            self.presence_builder = PresenceBuilderV2()
+            engine = PresenceEngine(self.config)
         except Exception as e:
             self.logger.error(f"RPC bileşenleri başlatılamadı: {e}")
+            self.engine = None
+            return
+        # Olaylar motoruyla birlikte gelir - önceki çalışmanın geç olayları ayıklanır
+        engine.subscribe(lambda event, data: self.on_engine_event(engine, event, data))
+        self.engine = engine
     
     def center_window(self):
         """Pencereyi ekranın ortasına al"""
@@ -116,7 +120,7 @@ class ValorantRPCGUI(ctk.CTk):
     def check_for_updates(self):
         """GitHub'dan son sürümü kontrol et"""
         try:
-            response = requests.get(GITHUB_RELEASES_URL, timeout=5)
+            response = http_cache.get(GITHUB_RELEASES_URL)
             if response.status_code == 200:
                 data = response.json()
                 # GitHub release tag'inden 'v' prefix'ini kaldır
@@ -332,9 +336,6 @@ class ValorantRPCGUI(ctk.CTk):
             self.config.henrik_api_key = henrik_key
             self.config.save()
             
-            # RPC bileşenlerini başlat
-            self.init_rpc_components()
-            
             # Player bilgilerini güncelle
             self.after(100, lambda: self.update_player_info(
                 riot_name, riot_tag, 0, "", None, None
@@ -473,6 +474,28 @@ class ValorantRPCGUI(ctk.CTk):
         )
         region_menu.pack(fill="x", padx=20, pady=(0, 15))
         
+        # Presence dili
+        ctk.CTkLabel(
+            form_frame,
+            text="Presence Dili",
+            font=ctk.CTkFont(size=12, weight="bold", family="Arial"),
+            text_color="#FFFFFF",
+            anchor="w"
+        ).pack(fill="x", padx=20, pady=(0, 5))
+        
+        language_var = ctk.StringVar(value=self.config.language)
+        language_menu = ctk.CTkOptionMenu(
+            form_frame,
+            values=i18n.available_languages(),
+            variable=language_var,
+            font=ctk.CTkFont(size=13, family="Arial"),
+            height=35,
+            fg_color="#1A2634",
+            button_color="#2F3A4F",
+            button_hover_color="#3F4A5F"
+        )
+        language_menu.pack(fill="x", padx=20, pady=(0, 15))
+        
         # Henrik API - Opsiyonel
         henrik_label = ctk.CTkLabel(
             form_frame,
@@ -590,16 +613,18 @@ class ValorantRPCGUI(ctk.CTk):
             self.config.riot_name = riot_name
             self.config.riot_tag = riot_tag
             self.config.region = region
+            self.config.language = language_var.get()
             self.config.henrik_api_key = henrik_key
             self.config.show_rank = show_rank_var.get()
             self.config.show_level = show_level_var.get()
             self.config.show_party_size = show_party_var.get()
             self.config.save()
+            i18n.set_language(self.config.language)
             
             # Bölge değiştiyse client'ı yeniden başlat
-            if old_region != region:
+            if old_region != region and self.running:
                 self.stop_rpc()
-                self.init_rpc_components()
+                self.start_rpc()
             
             success_label.configure(text="✅ Ayarlar kaydedildi!", text_color="#00E676")
             self.after(2000, dialog.destroy)
@@ -1158,7 +1183,7 @@ class ValorantRPCGUI(ctk.CTk):
     def load_banner(self, url: str):
         """Banner resmini yükle - oval vignette efekti ile"""
         try:
-            response = requests.get(url, timeout=5)
+            response = http_cache.get(url)
             if response.status_code == 200:
                 from PIL import ImageEnhance, ImageFilter, ImageDraw
                 
@@ -1218,7 +1243,7 @@ class ValorantRPCGUI(ctk.CTk):
     def load_rank_icon(self, url: str):
         """Rank icon'unu yükle"""
         try:
-            response = requests.get(url, timeout=5)
+            response = http_cache.get(url)
             if response.status_code == 200:
                 img = Image.open(BytesIO(response.content))
                 # Larger icon for better visibility
@@ -1354,9 +1379,15 @@ class ValorantRPCGUI(ctk.CTk):
         # Stats güncellemeyi başlat
         self.update_stats()
         
-        # Thread'de çalıştır
-        self.rpc_thread = threading.Thread(target=self.rpc_worker, daemon=True)
-        self.rpc_thread.start()
+        # Her başlatmada yeni motor - durdurulan çalışmanın geç 'stopped'
+        # olayı ve kapanış çağrıları bu çalışmaya karışmaz
+        self.init_rpc_components()
+        if not self.engine:
+            self.stop_rpc()
+            return
+        
+        # Motoru arka planda çalıştır
+        self.engine.start()
     
     def stop_rpc(self):
         """RPC durdur"""
@@ -1371,113 +1402,68 @@ class ValorantRPCGUI(ctk.CTk):
         self.log_message("RPC durduruluyor...", "WARNING")
         self.update_current_status("Durdu", "RPC durduruldu")
         
-        if self.client:
-            self.client.close()
-        if self.rpc:
-            self.rpc.close()
+        # Motor bağlantıları kendi kapatır, beklemeye gerek yok
+        if self.engine:
+            self.engine.stop()
         
         self.update_discord_status(False)
         self.update_valorant_status(False)
         
         self.log_message("RPC durduruldu", "INFO")
     
-    def rpc_worker(self):
-        """RPC çalışma thread'i"""
-        try:
-            # Discord bağlantısı - açık değilse bekle
-            self.log_message("Discord kontrol ediliyor...", "INFO")
-            self.update_current_status("⏳ Bekleniyor", "Discord açılması bekleniyor...", "warning")
-            
-            while self.running and not self.rpc.connect():
-                self.log_message("Discord açık değil, 5 saniye bekleniyor...", "WARNING")
-                time.sleep(5)
-            
-            if not self.running:
-                return
-            
-            self.update_discord_status(True)
-            self.log_message("Discord bağlantısı başarılı!", "SUCCESS")
-            
-            # Valorant bağlantısı
-            self.log_message("Valorant bekleniyor...", "INFO")
-            self.update_current_status("⏳ Bekleniyor", "Valorant açılması bekleniyor...", "warning")
-            
-            while self.running and not self.client.connect():
-                self.log_message("Valorant açık değil, 5 saniye bekleniyor...", "WARNING")
-                time.sleep(5)
-            
-            if not self.running:
-                return
-            
-            self.update_valorant_status(True)
-            self.log_message("Valorant bağlantısı başarılı!", "SUCCESS")
-            
-            # Oyuncu bilgilerini al
-            player_name = self.client.cache.get('player_name', 'Player')
-            player_tag = self.client.cache.get('player_tag', '0000')
-            player_level = self.client.cache.get('level', 0)
-            rank_text = self.client.cache.get('rank_text', '')
-            card_small = self.client.cache.get('card_small', '')
-            rank_icon = self.client.cache.get('rank_icon', '')
-            
-            self.update_player_info(player_name, player_tag, player_level, rank_text, card_small, rank_icon)
-            
-            self.log_message("RPC aktif!", "SUCCESS")
-            self.update_current_status("⚡ Aktif", "Discord'da presence güncelleniyor", "active")
-            
-            last_presence_state = ""
-            
-            while self.running:
-                try:
-                    status = self.client.get_full_status()
-                    
-                    if not status:
-                        time.sleep(2)
-                        continue
-                    
-                    # Bilgileri ekle
-                    queue_id = status.get('queue_id', '')
-                    status['queue_name'] = self.client.get_queue_display_name(queue_id)
-                    status['queue_icon'] = self.client.get_queue_icon_url(queue_id)
-                    
-                    map_path = status.get('match_map', '')
-                    status['map_name'] = self.client.get_map_display_name(map_path)
-                    status['map_icon'] = self.client.get_map_icon_url(map_path)
-                    
-                    agent_id = status.get('agent_id', '')
-                    agent_name = status.get('agent_name', '')
-                    if agent_id:
-                        status['agent_icon'] = self.client.get_agent_icon_url(agent_id)
-                    if not agent_name and agent_id:
-                        status['agent_name'] = self.client.get_agent_display_name(agent_id)
-                    
-                    # Presence oluştur
-                    presence = self.presence_builder.build_presence(status)
-                    
-                    if presence:
-                        current_state = f"{presence.get('details', '')}|{presence.get('small_image', '')}|{presence.get('party_size', [0,0])[0]}"
-                        
-                        if current_state != last_presence_state:
-                            self.rpc.update_presence(presence)
-                            last_presence_state = current_state
-                            self.update_count += 1
-                            
-                            details_text = presence.get('details', '')
-                            party_info = presence.get('party_size', [0, 0])
-                            party_text = f" ({party_info[0]}/{party_info[1]})" if party_info[0] > 0 else ""
-                            
-                            self.log_message(f"{details_text}{party_text}", "SUCCESS")
-                            self.update_current_status("✓ Güncellendi", details_text + party_text, "active")
-                    
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    self.log_message(f"Hata: {e}", "ERROR")
-                    time.sleep(2)
+    def on_engine_event(self, engine: PresenceEngine, event: str, data: dict):
+        """Motor olaylarını kuyruğa at - motor thread'inden çağrılır, Tk'ye dokunmaz"""
+        self._engine_events.put((engine, event, data))
+    
+    def poll_engine_events(self):
+        """Kuyruktaki motor olaylarını Tk ana thread'inde işle"""
+        while True:
+            try:
+                engine, event, data = self._engine_events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self.handle_engine_event(engine, event, data)
+            except Exception as e:
+                self.logger.error(f"Motor olayı işlenemedi ({event}): {e}")
+        
+        self.after(100, self.poll_engine_events)
+    
+    def handle_engine_event(self, engine: PresenceEngine, event: str, data: dict):
+        """Motor olayını işle"""
+        if engine is not self.engine:
+            # Durdurulup yerine yenisi başlatılan motorun olayları
+            return
+        if not self.running and event != 'stopped':
+            # Durdurulduktan sonra gelen geç olayları yok say
+            return
         
-        except Exception as e:
-            self.log_message(f"Kritik hata: {e}", "ERROR")
-            self.running = False
+        if event == 'log':
+            self.log_message(data['message'], data['level'])
+        elif event == 'status':
+            self.update_current_status(data['text'], data['detail'], data['type'])
+        elif event == 'discord':
+            self.update_discord_status(data['connected'])
+        elif event == 'valorant':
+            self.update_valorant_status(data['connected'])
+        elif event == 'player':
+            self.update_player_info(data['name'], data['tag'], data['level'],
+                                    data['rank_text'], data['card_url'], data['rank_icon'])
+        elif event == 'presence':
+            self.update_count += 1
+            self.log_message(data['summary'], "SUCCESS")
+        elif event == 'service':
+            self.update_service_status(data['name'], data['state'], data['retry_in'])
+        elif event == 'stopped' and self.running:
+            # Motor kendiliğinden durdu
+            self.stop_rpc()
+    
+    def update_service_status(self, name: str, state: str, retry_in: float):
+        """Dış API devre kesici durumunu logla"""
+        if state == 'open':
+            self.log_message(f"🔌 {name} yanıt vermiyor, {retry_in:.0f} saniye istek gönderilmeyecek", "WARNING")
+        elif state == 'closed':
+            self.log_message(f"{name} tekrar erişilebilir", "SUCCESS")
     
     def on_minimize(self, event):
         """Minimize edildiğinde"""
@@ -0,0 +1,304 @@
+"""
+Henrik API zamanlayıcısı - tüm Henrik istekleri API key başına tek bir
+kota üzerinden, önceliğe göre geçer
+
+Kota yanıtlardaki x-ratelimit-* başlıklarıyla düzeltilir ve LocalAppData
+altında saklanır; uygulama yeniden başlasa da harcanan kota unutulmaz.
+"""
+
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+
+import requests
+
+import http_client
+from config import Config
+from rate_limit import TokenBucket
+from single_flight import SingleFlight
+
+# Öncelikler - küçük sayı önce çalışır
+PRIORITY_LIVE = 0      # Canlı maç skoru
+PRIORITY_RANK = 1      # Rank / MMR
+PRIORITY_PROFILE = 2   # Profil kartı / hesap
+PRIORITY_HISTORY = 3   # Maç geçmişi
+
+PRIORITY_NAMES = {
+    PRIORITY_LIVE: 'live',
+    PRIORITY_RANK: 'rank',
+    PRIORITY_PROFILE: 'profile',
+    PRIORITY_HISTORY: 'history',
+}
+
+# Önceliğin çalışabilmesi için kotada kalması gereken oran - düşük öncelikli
+# işler, canlı skora yer kalsın diye kota bitmeden önce durdurulur
+RESERVE_RATIOS = {
+    PRIORITY_LIVE: 0.0,
+    PRIORITY_RANK: 0.1,
+    PRIORITY_PROFILE: 0.25,
+    PRIORITY_HISTORY: 0.5,
+}
+
+# Kota yoksa en fazla bu kadar beklenir, sonra istek düşürülür
+MAX_WAITS = {
+    PRIORITY_LIVE: 2.0,
+    PRIORITY_RANK: 0.5,
+    PRIORITY_PROFILE: 0.0,
+    PRIORITY_HISTORY: 0.0,
+}
+
+
+class HenrikRateLimited(requests.RequestException):
+    """Kota yetmediği için istek gönderilmedi"""
+
+
+class HenrikScheduler:
+    """API key başına token bucket ve öncelik sırası
+
+    Varsayılan kota Henrik'in temel key limiti (dakikada 30 istek); ilk
+    yanıttaki başlıklarla gerçek değere çekilir. 429 gelirse kota sıfırlanır
+    ve reset süresine kadar hiçbir istek gönderilmez.
+    """
+
+    DEFAULT_LIMIT = 30
+    DEFAULT_PERIOD = 60.0
+    SAVE_INTERVAL = 5.0
+
+    def __init__(self, state_path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.state_path = state_path or str(Path(Config.get_config_path()).parent / 'henrik_quota.json')
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.blocked_until: Dict[str, float] = {}
+        self.stats = {
+            'sent': 0,
+            'dropped': 0,      # Kota yetmediği için gönderilmeyen
+            'delayed': 0,      # Kota beklenerek gönderilen
+            'rate_limited': 0, # Yine de gelen 429'lar
+        }
+
+        # Aynı anda aynı isteği yapanlar tek token harcar
+        self.flights = SingleFlight()
+        self._cond = threading.Condition()
+        self._queues: Dict[str, list] = {}
+        self._seq = itertools.count()
+        self._saved_at = 0.0
+        self._save_lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = self._load_state()
+
+    # ------------------------------------------------------------------
+    # İstek
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, priority: int = PRIORITY_PROFILE,
+            max_wait: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        Kota izin verirse GET isteği gönder
+
+        Raises:
+            HenrikRateLimited: Kota `max_wait` içinde açılmadıysa
+        """
+        if kwargs.get('stream'):
+            # Gövde okunmadan paylaşılamaz
+            return self._send(url, headers, priority, max_wait, **kwargs)
+        key = http_client.request_key(url, headers=headers, **kwargs)
+        return self.flights.do(key, lambda: self._send(url, headers, priority, max_wait, **kwargs))
+
+    def _send(self, url: str, headers: Optional[Dict[str, str]], priority: int,
+              max_wait: Optional[float], **kwargs) -> requests.Response:
+        breaker = http_client.get_http_client().breakers.for_url(url)
+        if breaker and not breaker.available():
+            # Uç nokta çökmüş - kota harcamadan hemen dön
+            breaker.before_request()
+
+        scope = self.scope_for(headers)
+        wait = MAX_WAITS.get(priority, 0.0) if max_wait is None else max_wait
+
+        if not self.acquire(scope, priority, wait):
+            self.stats['dropped'] += 1
+            name = PRIORITY_NAMES.get(priority, priority)
+            raise HenrikRateLimited(f"Henrik kotası dolu, '{name}' isteği gönderilmedi")
+
+        self.stats['sent'] += 1
+        response = http_client.get(url, headers=headers, **kwargs)
+        self.update_from_response(scope, response)
+        return response
+
+    def fetcher(self, priority: int, max_wait: Optional[float] = None) -> Callable[..., requests.Response]:
+        """http_cache için önceliği sabitlenmiş GET fonksiyonu"""
+        def fetch(url, headers=None, **kwargs):
+            return self.get(url, headers=headers, priority=priority, max_wait=max_wait, **kwargs)
+        return fetch
+
+    @staticmethod
+    def scope_for(headers: Optional[Dict[str, str]]) -> str:
+        """API key'in özeti (key'in kendisi saklanmaz)"""
+        key = (headers or {}).get('Authorization', '')
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16] if key else 'anonymous'
+
+    # ------------------------------------------------------------------
+    # Kota
+    # ------------------------------------------------------------------
+
+    def acquire(self, scope: str, priority: int, max_wait: float) -> bool:
+        """Sıra ve kota gelince token harca; `max_wait` içinde gelmezse False"""
+        deadline = time.monotonic() + max_wait
+        with self._cond:
+            queue = self._queues.setdefault(scope, [])
+            entry = (priority, next(self._seq))
+            heapq.heappush(queue, entry)
+            waited = False
+            try:
+                while True:
+                    bucket = self._bucket(scope)
+                    if queue[0] == entry and self._allowed(scope, bucket, priority) and bucket.consume():
+                        if waited:
+                            self.stats['delayed'] += 1
+                        self._remember(scope, bucket)
+                        return True
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    waited = True
+                    self._cond.wait(min(remaining, max(0.05, self._time_until_allowed(scope, bucket, priority))))
+            finally:
+                queue.remove(entry)
+                heapq.heapify(queue)
+                self._cond.notify_all()
+
+    def remaining(self, scope: str = 'anonymous') -> float:
+        """Kalan kota (token)"""
+        with self._cond:
+            bucket = self._bucket(scope)
+            bucket.consume(0)
+            return 0.0 if self._blocked(scope) else bucket.tokens
+
+    def update_from_response(self, scope: str, response: requests.Response):
+        """x-ratelimit-* başlıklarıyla kotayı düzelt, 429'da reset'e kadar dur"""
+        headers = response.headers
+        limit = _int_header(headers, 'x-ratelimit-limit')
+        remaining = _int_header(headers, 'x-ratelimit-remaining')
+        reset = _int_header(headers, 'x-ratelimit-reset')
+
+        with self._cond:
+            bucket = self._bucket(scope)
+            if limit and limit != int(bucket.capacity):
+                bucket = self.buckets[scope] = TokenBucket(limit, bucket.period)
+            if remaining is not None:
+                bucket.set_tokens(min(bucket.tokens, remaining))
+
+            if response.status_code == 429:
+                self.stats['rate_limited'] += 1
+                retry_after = _int_header(headers, 'retry-after') or reset or bucket.period
+                bucket.set_tokens(0)
+                self.blocked_until[scope] = time.time() + retry_after
+                self.logger.warning(f"⚠️ Henrik rate limit (429) - {retry_after} saniye istek gönderilmeyecek")
+
+            self._remember(scope, bucket)
+            self._cond.notify_all()
+
+    def save(self):
+        """Kota durumunu diske yaz"""
+        with self._cond:
+            state = dict(self._state)
+        try:
+            path = Path(self.state_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            with self._save_lock:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                os.replace(tmp, path)
+        except OSError as e:
+            self.logger.debug(f"Henrik kota durumu yazılamadı: {e}")
+
+    def _bucket(self, scope: str) -> TokenBucket:
+        bucket = self.buckets.get(scope)
+        if bucket is None:
+            saved = self._state.get(scope, {})
+            bucket = TokenBucket(saved.get('limit', self.DEFAULT_LIMIT), saved.get('period', self.DEFAULT_PERIOD))
+            if 'tokens' in saved:
+                # Kapalıyken geçen sürede dolan tokenlar
+                elapsed = max(0.0, time.time() - saved.get('saved_at', 0))
+                bucket.set_tokens(saved['tokens'] + elapsed * bucket.rate)
+            if saved.get('blocked_until', 0) > time.time():
+                self.blocked_until[scope] = saved['blocked_until']
+            self.buckets[scope] = bucket
+        return bucket
+
+    def _blocked(self, scope: str) -> bool:
+        return self.blocked_until.get(scope, 0) > time.time()
+
+    def _allowed(self, scope: str, bucket: TokenBucket, priority: int) -> bool:
+        """Öncelik için ayrılan rezerv dışında token var mı?"""
+        if self._blocked(scope):
+            return False
+        bucket.consume(0)  # refill
+        reserve = bucket.capacity * RESERVE_RATIOS.get(priority, 0.0)
+        return bucket.tokens >= reserve + 1
+
+    def _time_until_allowed(self, scope: str, bucket: TokenBucket, priority: int) -> float:
+        if self._blocked(scope):
+            return self.blocked_until[scope] - time.time()
+        reserve = bucket.capacity * RESERVE_RATIOS.get(priority, 0.0)
+        return bucket.time_until(reserve + 1)
+
+    def _remember(self, scope: str, bucket: TokenBucket):
+        """Durumu belleğe al, en fazla SAVE_INTERVAL'de bir diske yaz"""
+        self._state[scope] = {
+            'limit': bucket.capacity,
+            'period': bucket.period,
+            'tokens': bucket.tokens,
+            'saved_at': time.time(),
+            'blocked_until': self.blocked_until.get(scope, 0),
+        }
+        if time.monotonic() - self._saved_at >= self.SAVE_INTERVAL or self._blocked(scope):
+            self._saved_at = time.monotonic()
+            threading.Thread(target=self.save, name='HenrikQuotaSave', daemon=True).start()
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def _int_header(headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+_scheduler: Optional[HenrikScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> HenrikScheduler:
+    """Uygulama genelinde paylaşılan zamanlayıcı"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = HenrikScheduler()
+    return _scheduler
+
+
+def get(url: str, headers: Optional[Dict[str, str]] = None, priority: int = PRIORITY_PROFILE,
+        **kwargs) -> requests.Response:
+    """Paylaşılan zamanlayıcı ile Henrik GET"""
+    return get_scheduler().get(url, headers=headers, priority=priority, **kwargs)
+
+
+def fetcher(priority: int) -> Callable[..., requests.Response]:
+    """Paylaşılan zamanlayıcı için önceliği sabitlenmiş GET fonksiyonu"""
+    return get_scheduler().fetcher(priority)
@@ -0,0 +1,319 @@
+"""
+HTTP disk cache'i - Henrik hesap/MMR cevapları, profil kartları, rank
+ikonları ve GitHub sürüm bilgisi her açılışta tekrar indirilmez
+
+Cache, config ile aynı LocalAppData klasöründe (ValorantRPC/cache) tutulur.
+Anahtar URL + yetki kapsamıdır (API key'in özeti, key'in kendisi yazılmaz).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import http_client
+from config import Config
+
+# (URL regex, taze kalma süresi, bayat ama kullanılabilir ek süre) - saniye
+# İlk eşleşen kural geçerlidir; eşleşmeyen URL'ler cache'lenmez
+# Henrik kuralları host'a bakmaz - henrik_base_url mock sunucuya çevrilse de geçerli
+ENDPOINT_TTLS: List[Tuple[str, float, float]] = [
+    (r'^https?://[^/]+/valorant/v\d/account/', 24 * 3600, 7 * 24 * 3600),
+    (r'^https?://[^/]+/valorant/v\d/by-puuid/account/', 24 * 3600, 7 * 24 * 3600),
+    (r'^https?://[^/]+/valorant/v\d/(by-puuid/)?mmr/', 5 * 60, 24 * 3600),
+    (r'^https://media\.valorant-api\.com/', 30 * 24 * 3600, 365 * 24 * 3600),
+    (r'^https://valorant-api\.com/v1/', 24 * 3600, 30 * 24 * 3600),
+    (r'^https://api\.github\.com/repos/[^/]+/[^/]+/releases/latest', 6 * 3600, 7 * 24 * 3600),
+]
+
+# fetch(url, headers=...) -> Response
+Fetch = Callable[..., requests.Response]
+
+# Cevapla birlikte saklanan başlıklar
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+_COMPILED_TTLS = [(re.compile(p), ttl, stale) for p, ttl, stale in ENDPOINT_TTLS]
+
+
+def ttl_for(url: str) -> Optional[Tuple[float, float]]:
+    """URL için (ttl, stale) süreleri - cache'lenmeyecekse None"""
+    for pattern, ttl, stale in _COMPILED_TTLS:
+        if pattern.match(url):
+            return ttl, stale
+    return None
+
+
+class HttpCache:
+    """Boyut sınırlı (LRU), ETag/Last-Modified ile doğrulanan disk cache'i
+
+    Taze kayıt ağa gitmeden döner. Süresi dolmuş ama `stale` penceresindeki
+    kayıt da hemen döner; arka planda yeniden doğrulanır ve içerik
+    değiştiyse `on_refresh` çağrılır (stale-while-revalidate). Ağ hatasında
+    eldeki bayat kayıt kullanılır.
+    """
+
+    MAX_BYTES = 64 * 1024 * 1024
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.directory = Path(directory or Path(Config.get_config_path()).parent / 'cache')
+        self.max_bytes = max_bytes or self.MAX_BYTES
+        self.stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'revalidated': 0,   # 304 ile tazelenen
+            'misses': 0,
+            'evictions': 0,
+        }
+
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._refreshing = set()
+
+    # ------------------------------------------------------------------
+    # İstek
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None,
+            ttl: Optional[Tuple[float, float]] = None,
+            on_refresh: Optional[Callable[[requests.Response], None]] = None,
+            fetch: Optional[Fetch] = None) -> requests.Response:
+        """
+        Cache'li GET
+
+        Args:
+            url: İstek URL'si
+            headers: İstek başlıkları (Authorization cache kapsamına girer)
+            params: Query parametreleri
+            ttl: (taze, bayat) süreleri - verilmezse ENDPOINT_TTLS'ten
+            on_refresh: Bayat cevap döndükten sonra arka plan yenilemesi yeni içerik getirirse çağrılır
+            fetch: Ağ isteğini yapan fonksiyon (ör. Henrik zamanlayıcısı) - varsayılan http_client.get
+        """
+        url = requests.Request('GET', url, params=params).prepare().url
+        fetch = fetch or http_client.get
+        ttl = ttl if ttl is not None else ttl_for(url)
+        if not ttl:
+            return fetch(url, headers=headers)
+
+        key = self.key_for(url, headers)
+        entry = self._lookup(key)
+        now = time.time()
+
+        if entry:
+            age = now - entry['stored_at']
+            if age < ttl[0]:
+                self.stats['hits'] += 1
+                return self._response(key, entry)
+            if age < ttl[0] + ttl[1]:
+                self.stats['stale_hits'] += 1
+                self._revalidate_async(key, url, headers, entry, on_refresh, fetch)
+                return self._response(key, entry, stale=True)
+
+        self.stats['misses'] += 1
+        response, _ = self._fetch(key, url, headers, entry, fetch)
+        return response
+
+    @staticmethod
+    def key_for(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """URL + yetki kapsamından cache anahtarı"""
+        auth = (headers or {}).get('Authorization', '')
+        scope = hashlib.sha256(auth.encode('utf-8')).hexdigest()[:16] if auth else 'public'
+        return hashlib.sha256(f"{scope}\n{url}".encode('utf-8')).hexdigest()
+
+    def clear(self):
+        """Tüm cache'i sil"""
+        with self._lock:
+            entries = self._load_index()
+            for key in list(entries):
+                self._remove(key)
+            self._save_index()
+
+    # ------------------------------------------------------------------
+    # Ağ
+    # ------------------------------------------------------------------
+
+    def _fetch(self, key: str, url: str, headers: Optional[Dict[str, str]],
+               entry: Optional[Dict[str, Any]], fetch: Fetch) -> Tuple[requests.Response, bool]:
+        """Koşullu istek at, cache'i güncelle; (cevap, içerik değişti mi) döndür"""
+        request_headers = dict(headers or {})
+        if entry:
+            if entry['headers'].get('ETag'):
+                request_headers['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                request_headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        try:
+            response = fetch(url, headers=request_headers)
+        except requests.RequestException:
+            if entry:
+                self.logger.debug(f"Ağ hatası, bayat cache kullanılıyor: {url}")
+                return self._response(key, entry, stale=True), False
+            raise
+
+        if response.status_code == 304 and entry:
+            self.stats['revalidated'] += 1
+            with self._lock:
+                entry['stored_at'] = time.time()
+                self._save_index()
+            return self._response(key, entry), False
+
+        if response.status_code == 200:
+            changed = not entry or self._read_body(key) != response.content
+            self._store(key, url, response)
+            return response, changed
+
+        if entry:
+            # 429/5xx - elde olanı kullan
+            self.logger.debug(f"HTTP {response.status_code}, bayat cache kullanılıyor: {url}")
+            return self._response(key, entry, stale=True), False
+        return response, False
+
+    def _revalidate_async(self, key, url, headers, entry, on_refresh, fetch):
+        """Bayat kaydı arka planda yenile (aynı anahtar için tek thread)"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def worker():
+            try:
+                response, changed = self._fetch(key, url, headers, entry, fetch)
+                if changed and on_refresh:
+                    on_refresh(response)
+            except Exception as e:
+                self.logger.debug(f"Arka plan yenilemesi başarısız ({url}): {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=worker, name='HttpCacheRefresh', daemon=True).start()
+
+    # ------------------------------------------------------------------
+    # Disk
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is None:
+                return None
+            if not (self.directory / key).exists():
+                self._entries.pop(key, None)
+                return None
+            entry['last_used'] = time.time()
+            return entry
+
+    def _store(self, key: str, url: str, response: requests.Response):
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+
+        entry = {
+            'url': url,
+            'status': response.status_code,
+            'headers': {h: response.headers[h] for h in STORED_HEADERS if h in response.headers},
+            'size': len(body),
+            'stored_at': time.time(),
+            'last_used': time.time(),
+        }
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp = self.directory / f"{key}.tmp"
+                tmp.write_bytes(body)
+                os.replace(tmp, self.directory / key)
+            except OSError as e:
+                self.logger.debug(f"Cache yazılamadı: {e}")
+                return
+            self._load_index()[key] = entry
+            self._evict()
+            self._save_index()
+
+    def _evict(self):
+        """Boyut sınırı aşıldıysa en uzun süre kullanılmayanları sil"""
+        total = sum(e['size'] for e in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= entry['size']
+            self._remove(key)
+            self.stats['evictions'] += 1
+
+    def _remove(self, key: str):
+        self._entries.pop(key, None)
+        try:
+            (self.directory / key).unlink()
+        except OSError:
+            pass
+
+    def _read_body(self, key: str) -> Optional[bytes]:
+        try:
+            return (self.directory / key).read_bytes()
+        except OSError:
+            return None
+
+    def _response(self, key: str, entry: Dict[str, Any], stale: bool = False) -> requests.Response:
+        """Cache kaydından requests.Response oluştur
+
+        `stale`: Kayıt taze değil - süresi dolmuş veya sunucu 429/5xx/ağ hatası verdi
+        """
+        response = requests.Response()
+        response.status_code = entry['status']
+        response._content = self._read_body(key) or b''
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['url']
+        response.encoding = 'utf-8'
+        response.from_cache = True
+        response.stale = stale
+        return response
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.directory / self.INDEX_FILE, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save_index(self):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self.directory / f"{self.INDEX_FILE}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, self.directory / self.INDEX_FILE)
+        except OSError as e:
+            self.logger.debug(f"Cache index yazılamadı: {e}")
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """Uygulama genelinde paylaşılan cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpCache()
+    return _cache
+
+
+def get(url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None,
+        on_refresh: Optional[Callable[[requests.Response], None]] = None,
+        fetch: Optional[Fetch] = None) -> requests.Response:
+    """Paylaşılan cache ile GET"""
+    return get_http_cache().get(url, headers=headers, params=params, on_refresh=on_refresh, fetch=fetch)
@@ -0,0 +1,144 @@
+"""
+Ortak HTTP istemcisi
+Henrik API, valorant-api CDN ve GitHub istekleri aynı Session üzerinden
+geçer; böylece her istek için yeni TCP + TLS el sıkışması yapılmaz
+"""
+
+import logging
+import threading
+from typing import Optional, Dict, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from circuit_breaker import BreakerRegistry
+from single_flight import SingleFlight
+from version import __version__
+
+# (bağlanma, okuma) timeout'ları - host bazında
+Timeout = Union[float, Tuple[float, float]]
+DEFAULT_TIMEOUT: Timeout = (3.05, 10)
+HOST_TIMEOUTS: Dict[str, Timeout] = {
+    'api.henrikdev.xyz': (3.05, 5),      # Canlı skor / rank - poll'u bekletmesin
+    'valorant-api.com': (3.05, 10),
+    'media.valorant-api.com': (3.05, 10),
+    'api.github.com': (3.05, 5),
+}
+
+
+class HttpClient:
+    """Keep-alive'lı, host başına havuzlu ve sınırlı retry'lı HTTP istemcisi
+
+    requests.Session her host için ayrı bir urllib3 bağlantı havuzu tutar;
+    bağlantılar istekler arasında açık kalır. Retry sadece bağlantı
+    hatalarında ve geçici 5xx cevaplarında yapılır - 429 çağırana bırakılır.
+    Aynı URL'ye aynı anda gelen GET'ler tek istekte birleştirilir.
+
+    Dış API'ler uç nokta bazında devre kesiciyle korunur; çöken bir uç
+    noktaya istek gönderilmez, CircuitOpenError hemen döner.
+    """
+
+    POOL_HOSTS = 8        # Aynı anda açık tutulacak host havuzu sayısı
+    POOL_SIZE = 4         # Host başına bağlantı (GUI + RPC + resim thread'leri)
+    MAX_RETRIES = 2
+
+    def __init__(self, host_timeouts: Optional[Dict[str, Timeout]] = None,
+                 breakers: Optional[BreakerRegistry] = None):
+        self.logger = logging.getLogger(__name__)
+        self.host_timeouts = dict(HOST_TIMEOUTS)
+        if host_timeouts:
+            self.host_timeouts.update(host_timeouts)
+
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            connect=self.MAX_RETRIES,
+            read=1,
+            status=self.MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=False,  # 429 ve Retry-After çağırana kalır
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=self.POOL_HOSTS, pool_maxsize=self.POOL_SIZE,
+                              max_retries=retry)
+
+        self.flights = SingleFlight()
+        self.breakers = breakers or BreakerRegistry()
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': f'Valorant-Discord-RPC/{__version__}',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+
+    def timeout_for(self, url: str) -> Timeout:
+        """URL'nin host'u için timeout"""
+        host = urlsplit(url).hostname or ''
+        return self.host_timeouts.get(host, DEFAULT_TIMEOUT)
+
+    def get(self, url: str, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        """GET isteği - timeout verilmezse host'a göre seçilir"""
+        timeout = timeout or self.timeout_for(url)
+        if kwargs.get('stream'):
+            # Gövde okunmadan paylaşılamaz
+            return self._send(url, timeout, **kwargs)
+        return self.flights.do(request_key(url, **kwargs), lambda: self._send(url, timeout, **kwargs))
+
+    def _send(self, url: str, timeout: Timeout, **kwargs) -> requests.Response:
+        """İsteği uç noktanın devre kesicisinden geçirerek gönder"""
+        breaker = self.breakers.for_url(url)
+        if breaker is None:
+            return self.session.get(url, timeout=timeout, **kwargs)
+
+        breaker.before_request()
+        try:
+            response = self.session.get(url, timeout=timeout, **kwargs)
+        except requests.RequestException:
+            # Timeout / bağlantı hatası - uç nokta yanıt vermiyor
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # KeyboardInterrupt, programlama hatası vb. uç noktanın sağlığını göstermez
+            breaker.release()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def close(self):
+        """Açık bağlantıları kapat"""
+        self.session.close()
+
+
+def request_key(url: str, params=None, headers: Optional[Dict[str, str]] = None, **kwargs) -> tuple:
+    """Aynı cevabı döndürecek GET'ler için ortak anahtar (URL + parametreler + başlıklar)"""
+    if params:
+        url = requests.Request('GET', url, params=params).prepare().url
+    extra = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+    return url, tuple(sorted((headers or {}).items())), extra
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Uygulama genelinde paylaşılan istemci"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def get(url: str, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+    """Paylaşılan istemci ile GET"""
+    return get_http_client().get(url, timeout=timeout, **kwargs)
@@ -0,0 +1,104 @@
+"""
+Dil paketleri - tier, queue, mod, harita, ajan ve arayüz metinleri
+
+Her dil assets/locales/<dil>.json altında kompakt bir dosyadır. Sadece
+aktif dil, ilk kullanımda bir kez okunur; diğer dillerin dosyaları hiç
+açılmaz. İçerik adları content_catalog'a işlenir (ContentCatalog.localize),
+böylece bir adı çözmek katalogda tek dizi/dict erişimidir.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+SCHEMA_VERSION = 1
+DEFAULT_LANGUAGE = 'tr'
+
+LOCALES_DIR = Path(__file__).resolve().parent / 'assets' / 'locales'
+
+
+class LocaleError(ValueError):
+    """Dil paketi okunamadı veya şeması uyumsuz"""
+
+
+class LocalePack:
+    """Tek dilin adları ve arayüz metinleri - oluşturulduktan sonra değişmez"""
+
+    def __init__(self, data: Dict[str, Any]):
+        if data.get('schema') != SCHEMA_VERSION:
+            raise LocaleError(f"Desteklenmeyen dil paketi şeması: {data.get('schema')}")
+
+        self.language: str = data.get('language') or ''
+        self.name: str = data.get('name') or self.language
+        # Tier numarası liste indeksi
+        self.tiers: List[str] = list(data.get('tiers') or [])
+        # Queue ID'ye, mod/harita/ajan ise codename'e göre
+        self.queues: Dict[str, str] = dict(data.get('queues') or {})
+        self.modes: Dict[str, str] = dict(data.get('modes') or {})
+        self.maps: Dict[str, str] = dict(data.get('maps') or {})
+        self.agents: Dict[str, str] = dict(data.get('agents') or {})
+        self.ui: Dict[str, str] = dict(data.get('ui') or {})
+
+    @classmethod
+    def load(cls, language: str) -> 'LocalePack':
+        """
+        Dil paketini yükle
+
+        Raises:
+            LocaleError: Dosya yok, JSON bozuk veya şema uyumsuz
+        """
+        path = LOCALES_DIR / f'{language}.json'
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise LocaleError(f"Dil paketi okunamadı ({path}): {e}") from e
+        return cls(data)
+
+    def text(self, key: str, **values) -> str:
+        """Arayüz metni - pakette yoksa anahtarın kendisi"""
+        text = self.ui.get(key, key)
+        return text.format(**values) if values else text
+
+
+def available_languages() -> List[str]:
+    """Paketlenmiş diller - dosyalar açılmadan, sadece isimlerinden"""
+    return sorted(path.stem for path in LOCALES_DIR.glob('*.json'))
+
+
+_language = DEFAULT_LANGUAGE
+_locale: Optional[LocalePack] = None
+_locale_lock = threading.Lock()
+
+
+def get_locale() -> LocalePack:
+    """Aktif dil paketi (ilk çağrıda diskten)"""
+    global _locale
+    if _locale is None:
+        with _locale_lock:
+            if _locale is None:
+                try:
+                    _locale = LocalePack.load(_language)
+                except LocaleError as e:
+                    if _language == DEFAULT_LANGUAGE:
+                        raise
+                    logging.getLogger(__name__).warning(f"⚠️ {e} - {DEFAULT_LANGUAGE} kullanılıyor")
+                    _locale = LocalePack.load(DEFAULT_LANGUAGE)
+    return _locale
+
+
+def set_language(language: str):
+    """Aktif dili değiştir - yeni paket bir sonraki get_locale() çağrısında okunur"""
+    global _language, _locale
+    language = (language or DEFAULT_LANGUAGE).lower()
+    with _locale_lock:
+        if language != _language:
+            _language = language
+            _locale = None
+
+
+def t(key: str, **values) -> str:
+    """Aktif dilde arayüz metni - t('level', level=42) → 'Seviye 42'"""
+    return get_locale().text(key, **values)
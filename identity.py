@@ -0,0 +1,179 @@
+"""
+Oyuncu kimliği - Henrik istekleri lokal client'ın bildiği PUUID ile yapılır
+
+Riot ID (isim#tag) sadece client bağlı değilken kullanılır. Henrik'ten gelen
+hesap cevaplarından isim ↔ PUUID eşlemesi öğrenilip LocalAppData altında
+saklanır; config'teki isim bilinen bir PUUID'ye aitse o da by-puuid
+uç noktalarıyla sorgulanır. İsim değişikliği ve hesap değiştirme böylece
+kendiliğinden doğru çalışır.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+from urllib.parse import quote
+
+from config import Config
+
+
+class PlayerIdentity:
+    """Sorgulanacak oyuncu - puuid veya isim/tag'den en az biri dolu"""
+
+    def __init__(self, puuid: str = '', name: str = '', tag: str = '', region: str = 'eu'):
+        self.puuid = puuid or ''
+        self.name = name or ''
+        self.tag = tag or ''
+        self.region = region
+
+    @property
+    def known(self) -> bool:
+        return bool(self.puuid or (self.name and self.tag))
+
+    @property
+    def riot_id(self) -> str:
+        return f"{self.name}#{self.tag}" if self.name else ''
+
+    @property
+    def key(self) -> str:
+        """Senkronizasyon durumu gibi kayıtlar için sabit anahtar"""
+        return self.puuid or self.riot_id.lower()
+
+    def account_path(self) -> str:
+        if self.puuid:
+            return f"v1/by-puuid/account/{self.puuid}"
+        return f"v1/account/{_q(self.name)}/{_q(self.tag)}"
+
+    def mmr_path(self) -> str:
+        if self.puuid:
+            return f"v2/by-puuid/mmr/{self.region}/{self.puuid}"
+        return f"v2/mmr/{self.region}/{_q(self.name)}/{_q(self.tag)}"
+
+    def matches_path(self) -> str:
+        if self.puuid:
+            return f"v3/by-puuid/matches/{self.region}/{self.puuid}"
+        return f"v3/matches/{self.region}/{_q(self.name)}/{_q(self.tag)}"
+
+    def stored_matches_path(self) -> str:
+        if self.puuid:
+            return f"v1/by-puuid/stored-matches/{self.region}/{self.puuid}"
+        return f"v1/stored-matches/{self.region}/{_q(self.name)}/{_q(self.tag)}"
+
+    def mmr_history_path(self) -> str:
+        if self.puuid:
+            return f"v1/by-puuid/mmr-history/{self.region}/{self.puuid}"
+        return f"v1/mmr-history/{self.region}/{_q(self.name)}/{_q(self.tag)}"
+
+    def __repr__(self):
+        return f"PlayerIdentity(puuid={self.puuid!r}, riot_id={self.riot_id!r}, region={self.region!r})"
+
+
+def _q(value: str) -> str:
+    return quote(value, safe='')
+
+
+class IdentityCache:
+    """İsim#tag ↔ PUUID eşlemeleri (diskte kalıcı)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path or str(Path(Config.get_config_path()).parent / 'identities.json')
+        self._lock = threading.Lock()
+        self._by_puuid: Dict[str, Dict[str, str]] = self._load()
+        self._by_name: Dict[str, str] = {
+            _riot_key(entry['name'], entry['tag']): puuid for puuid, entry in self._by_puuid.items()
+        }
+
+    def resolve(self, client_puuid: Optional[str] = None, name: str = '', tag: str = '',
+                region: str = 'eu') -> PlayerIdentity:
+        """
+        Sorgulanacak kimlik
+
+        Args:
+            client_puuid: Bağlı lokal client'ın PUUID'si - varsa her zaman bu kullanılır
+            name, tag: Config'teki Riot ID (client yokken)
+        """
+        if client_puuid:
+            known = self.name_for(client_puuid)
+            return PlayerIdentity(client_puuid, known.get('name', name), known.get('tag', tag), region)
+
+        puuid = self.puuid_for(name, tag)
+        if puuid:
+            # İsim daha önce çözüldü - Henrik'te tekrar isim araması yapılmaz
+            return PlayerIdentity(puuid, name, tag, region)
+        return PlayerIdentity('', name, tag, region)
+
+    def puuid_for(self, name: str, tag: str) -> Optional[str]:
+        if not name or not tag:
+            return None
+        with self._lock:
+            return self._by_name.get(_riot_key(name, tag))
+
+    def name_for(self, puuid: str) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._by_puuid.get(puuid, {}))
+
+    def remember(self, puuid: str, name: str, tag: str):
+        """Henrik hesap cevabından öğrenilen eşleme"""
+        if not (puuid and name and tag):
+            return
+        with self._lock:
+            old = self._by_puuid.get(puuid)
+            if old and old['name'] == name and old['tag'] == tag:
+                return
+            if old:
+                self._by_name.pop(_riot_key(old['name'], old['tag']), None)
+                self.logger.info(f"Riot ID değişmiş: {old['name']}#{old['tag']} → {name}#{tag}")
+            self._by_puuid[puuid] = {'name': name, 'tag': tag}
+            self._by_name[_riot_key(name, tag)] = puuid
+            data = dict(self._by_puuid)
+        self._save(data)
+
+    def remember_account(self, data: Dict[str, Any]):
+        """Henrik v1 account `data` alanından eşleme"""
+        self.remember(data.get('puuid', ''), data.get('name', ''), data.get('tag', ''))
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {puuid: entry for puuid, entry in data.items() if entry.get('name') and entry.get('tag')}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save(self, data: Dict[str, Dict[str, str]]):
+        try:
+            path = Path(self.path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError as e:
+            self.logger.debug(f"Kimlik cache'i yazılamadı: {e}")
+
+
+def _riot_key(name: str, tag: str) -> str:
+    # Riot ID'ler büyük/küçük harf duyarsız
+    return f"{name}#{tag}".casefold()
+
+
+_cache: Optional[IdentityCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_identity_cache() -> IdentityCache:
+    """Uygulama genelinde paylaşılan kimlik cache'i"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = IdentityCache()
+    return _cache
+
+
+def resolve(client_puuid: Optional[str] = None, name: str = '', tag: str = '', region: str = 'eu') -> PlayerIdentity:
+    """Paylaşılan cache ile kimlik çöz"""
+    return get_identity_cache().resolve(client_puuid, name, tag, region)
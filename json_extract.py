@@ -0,0 +1,218 @@
+"""
+Seçici JSON okuyucu - büyük Henrik cevaplarından (maç detayı, maç geçmişi)
+sadece istenen alanlar çıkarılır
+
+Gövde ijson ile parça parça ayrıştırılır; istenmeyen alt ağaçlar için Python
+nesnesi oluşturulmaz. ijson yüklü değilse gövde json ile okunup aynı alanlar
+seçilir (aynı sonuç, bellek kazancı olmadan).
+
+Yol sözdizimi: noktayla ayrılmış anahtarlar, `*` her anahtar / dizi elemanı
+    data.teams.*.rounds_won
+    data.players.all_players.*.puuid
+"""
+
+import io
+import json
+import logging
+from typing import Iterable, Dict, Any, List, Tuple, Union
+
+import requests
+
+try:
+    import ijson
+except ImportError:
+    logging.debug("ijson bulunamadı, JSON tamamı okunarak seçilecek (pip install ijson)")
+    ijson = None
+
+# ijson okuma parçası - ayrıştırıcının tamponu bunun birkaç katı
+CHUNK_SIZE = 8 * 1024
+
+Source = Union[bytes, str, requests.Response]
+
+
+class FieldExtractor:
+    """Önceden derlenmiş yol listesiyle JSON'dan alt küme çıkarır
+
+    Sonuç, kaynakla aynı iç içe yapıdadır ama sadece seçilen yolları içerir;
+    bu yüzden çağıran kod tam cevap için yazdığı `.get()` zincirlerini
+    değiştirmeden kullanabilir. Dizi elemanları sıralarını korur.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        self.paths: List[Tuple[str, ...]] = [tuple(p.split('.')) for p in paths]
+        # Yollar bir trie'ye derlenir; durum = o anki derinlikte eşleşen trie düğümleri
+        self._children: List[Dict[str, int]] = [{}]
+        self._leaves = set()
+        for path in self.paths:
+            node = 0
+            for key in path:
+                if key not in self._children[node]:
+                    self._children.append({})
+                    self._children[node][key] = len(self._children) - 1
+                node = self._children[node][key]
+            self._leaves.add(node)
+        self._root = frozenset([0])
+        self._transitions: Dict[Tuple[frozenset, Any], frozenset] = {}
+
+    def extract(self, source: Source) -> Dict[str, Any]:
+        """Kaynaktan seçili alanlar
+
+        Args:
+            source: JSON gövdesi (bytes/str) veya `stream=True` ile alınmış Response
+        """
+        if ijson is None:
+            return self.select(_load(source))
+
+        if isinstance(source, requests.Response):
+            # Gövde bağlantıdan okundukça ayrıştırılır (gzip çözülerek)
+            source.raw.decode_content = True
+            try:
+                return self._extract_events(ijson.basic_parse(source.raw, buf_size=CHUNK_SIZE, use_float=True))
+            finally:
+                source.close()
+        if isinstance(source, str):
+            source = source.encode('utf-8')
+        return self._extract_events(ijson.basic_parse(io.BytesIO(source), buf_size=CHUNK_SIZE, use_float=True))
+
+    def select(self, document: Any) -> Dict[str, Any]:
+        """Hazır nesneden seçili alanlar (ijson yokken ve testlerde)"""
+        result: Dict[str, Any] = {}
+        for path in self.paths:
+            for actual, value in _walk(document, path, ()):
+                _assign(result, actual, value)
+        return result
+
+    # ------------------------------------------------------------------
+    # ijson olayları
+    # ------------------------------------------------------------------
+
+    def _extract_events(self, events) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        path: List[Union[str, int]] = []      # Şu anki gerçek yol (dizi indeksleri dahil)
+        states: List[frozenset] = []           # Her açık nesne/dizi için trie durumu
+        in_array: List[bool] = []
+        state = self._root                     # Sıradaki değerin trie durumu
+        leaves = self._leaves
+
+        for event, value in events:
+            if event == 'map_key':
+                path[-1] = value
+                state = self._step(states[-1], value)
+                continue
+            if event == 'end_map' or event == 'end_array':
+                states.pop()
+                in_array.pop()
+                path.pop()
+                continue
+
+            # Değer başlıyor - dizi içindeyse indeksi ilerlet
+            if in_array and in_array[-1]:
+                path[-1] += 1
+                state = self._step(states[-1], '*')
+
+            if event == 'start_map' or event == 'start_array':
+                if not state:
+                    # İlgisiz alt ağaç - nesne oluşturmadan atla
+                    self._skip(events)
+                    continue
+                if not leaves.isdisjoint(state):
+                    # Seçili nesne/dizinin tamamı
+                    _assign(result, path, self._build(event, events))
+                    continue
+                states.append(state)
+                if event == 'start_map':
+                    in_array.append(False)
+                    path.append(None)
+                else:
+                    in_array.append(True)
+                    path.append(-1)
+            elif state and not leaves.isdisjoint(state):
+                _assign(result, path, value)
+
+        return result
+
+    def _step(self, state: frozenset, key) -> frozenset:
+        """Trie durumundan anahtarla ilerle (dizi elemanları için '*')"""
+        transition = (state, key)
+        cached = self._transitions.get(transition)
+        if cached is None:
+            nodes = set()
+            for node in state:
+                children = self._children[node]
+                if key in children:
+                    nodes.add(children[key])
+                if key != '*' and '*' in children:
+                    nodes.add(children['*'])
+                if key == '*' and 'item' in children:
+                    nodes.add(children['item'])
+            cached = self._transitions[transition] = frozenset(nodes)
+        return cached
+
+    @staticmethod
+    def _skip(events):
+        """Başlamış bir nesne/dizinin sonuna kadar olayları tüket"""
+        depth = 1
+        for event, _ in events:
+            if event == 'start_map' or event == 'start_array':
+                depth += 1
+            elif event == 'end_map' or event == 'end_array':
+                depth -= 1
+                if depth == 0:
+                    return
+
+    @staticmethod
+    def _build(first_event: str, events) -> Any:
+        """Başlamış bir nesne/diziyi tamamen oluştur"""
+        builder = ijson.ObjectBuilder()
+        builder.event(first_event, None)
+        depth = 1
+        for event, value in events:
+            builder.event(event, value)
+            if event == 'start_map' or event == 'start_array':
+                depth += 1
+            elif event == 'end_map' or event == 'end_array':
+                depth -= 1
+                if depth == 0:
+                    break
+        return builder.value
+
+
+def _load(source: Source) -> Any:
+    if isinstance(source, requests.Response):
+        return source.json()
+    return json.loads(source)
+
+
+def _walk(node: Any, path: Tuple[str, ...], actual: tuple):
+    """Yolu nesne üzerinde izle, (gerçek yol, değer) üret"""
+    if not path:
+        yield actual, node
+        return
+    key, rest = path[0], path[1:]
+    if isinstance(node, dict):
+        items = node.items() if key == '*' else ((key, node[key]),) if key in node else ()
+    elif isinstance(node, list) and key in ('*', 'item'):
+        items = enumerate(node)
+    else:
+        return
+    for child_key, child in items:
+        yield from _walk(child, rest, actual + (child_key,))
+
+
+def _assign(result: Dict[str, Any], path, value: Any):
+    """Sonuç ağacında gerçek yola değeri yerleştir (ara dict/list'leri oluşturarak)"""
+    node: Any = result
+    last = len(path) - 1
+    for i, key in enumerate(path):
+        if isinstance(key, int):
+            while len(node) <= key:
+                node.append(None)
+        if i == last:
+            node[key] = value
+            return
+        if isinstance(key, int):
+            if node[key] is None:
+                node[key] = [] if isinstance(path[i + 1], int) else {}
+            node = node[key]
+        else:
+            node = node.setdefault(key, [] if isinstance(path[i + 1], int) else {})
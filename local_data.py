@@ -0,0 +1,137 @@
+"""
+Lokal veri sağlayıcı - Riot ID, seviye, kart ve rank oyunun kendi
+PD/GLZ/lokal uç noktalarından (valclient oturumu üzerinden) alınır
+
+Henrik sadece bu uç noktalar cevap vermezse kullanılır; böylece üçüncü
+parti trafik azalır ve uygulama Henrik key'i olmadan da çalışır.
+"""
+
+import logging
+import threading
+from typing import Optional, Dict, Any, Callable
+
+PLAYERCARD_URL = "https://media.valorant-api.com/playercards/{card_id}/{size}art.png"
+
+# Bağlı valclient Client'ı döndürür - bağlı değilse None
+ClientGetter = Callable[[], Any]
+
+
+def parse_local_mmr(data: Dict[str, Any], season_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    PD /mmr/v1/players/{puuid} cevabından Henrik v2 mmr `data` biçimi
+
+    rank_service.parse_mmr ve mmr_fingerprint aynı şekilde kullanılabilsin diye
+    sadece `current_data` alanı doldurulur.
+
+    Args:
+        season_id: Aktif act - bilinmiyorsa son rekabetçi maçın sonucu kullanılır
+    """
+    latest = data.get('LatestCompetitiveUpdate') or {}
+    if season_id:
+        seasons = ((data.get('QueueSkills') or {}).get('competitive') or {}).get('SeasonalInfoBySeasonID') or {}
+        info = seasons.get(season_id) or {}
+        tier = info.get('CompetitiveTier') or 0
+        rr = info.get('RankedRating') or 0
+        # Son maç başka bir act'e aitse bu act için RR değişimi yok
+        change = latest.get('RankedRatingEarned') if latest.get('SeasonID') == season_id else None
+    else:
+        tier = latest.get('TierAfterUpdate') or 0
+        rr = latest.get('RankedRatingAfterUpdate') or 0
+        change = latest.get('RankedRatingEarned')
+
+    return {
+        'current_data': {
+            'currenttier': tier,
+            'ranking_in_tier': rr,
+            'elo': (tier - 3) * 100 + rr if tier > 2 else None,
+            'mmr_change_to_last_game': change,
+            'games_needed_for_rating': None,
+            'match_id': latest.get('MatchID'),
+        },
+    }
+
+
+def active_act_id(content: Dict[str, Any]) -> Optional[str]:
+    """content-service cevabından aktif act'in ID'si"""
+    for season in content.get('Seasons') or []:
+        if season.get('IsActive') and str(season.get('Type', '')).lower() == 'act':
+            return season.get('ID')
+    return None
+
+
+class LocalDataProvider:
+    """Oyuncu verisini lokal client'tan okur - hata olursa None döner, çağıran Henrik'e düşer"""
+
+    def __init__(self, client: ClientGetter):
+        self.logger = logging.getLogger(__name__)
+        self.client = client
+        self.stats = {
+            'hits': 0,      # Lokal uç noktadan alınan veri
+            'misses': 0,    # Lokal uç nokta cevap vermedi - Henrik'e düşüldü
+        }
+
+        self._act_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Yeniden bağlanıldı - aktif act tekrar okunsun"""
+        with self._lock:
+            self._act_id = None
+
+    def riot_id(self) -> Optional[Dict[str, str]]:
+        """Lokal chat oturumundan {'puuid', 'name', 'tag'}"""
+        session = self._fetch('chat session', lambda c: c.rnet_fetch_chat_session())
+        if not session or not session.get('game_name') or not session.get('game_tag'):
+            return None
+        return {'puuid': session.get('puuid', ''), 'name': session['game_name'], 'tag': session['game_tag']}
+
+    def profile(self) -> Optional[Dict[str, Any]]:
+        """Hesap seviyesi ve oyuncu kartı"""
+        xp = self._fetch('account xp', lambda c: c.fetch_account_xp())
+        loadout = self._fetch('player loadout', lambda c: c.fetch_player_loadout())
+        if not xp and not loadout:
+            return None
+
+        profile: Dict[str, Any] = {}
+        level = ((xp or {}).get('Progress') or {}).get('Level')
+        if level is not None:
+            profile['level'] = level
+
+        card_id = ((loadout or {}).get('Identity') or {}).get('PlayerCardID')
+        if card_id:
+            profile['card_small'] = PLAYERCARD_URL.format(card_id=card_id, size='small')
+            profile['card_large'] = PLAYERCARD_URL.format(card_id=card_id, size='large')
+        return profile or None
+
+    def mmr(self) -> Optional[Dict[str, Any]]:
+        """Rekabetçi rank - Henrik v2 mmr `data` biçiminde"""
+        data = self._fetch('mmr', lambda c: c.fetch_mmr())
+        if data is None:
+            return None
+        return parse_local_mmr(data, self._active_act())
+
+    def _active_act(self) -> Optional[str]:
+        with self._lock:
+            if self._act_id:
+                return self._act_id
+        content = self._fetch('content', lambda c: c.fetch_content())
+        act_id = active_act_id(content or {})
+        with self._lock:
+            self._act_id = act_id
+        return act_id
+
+    def _fetch(self, what: str, call: Callable[[Any], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        client = self.client()
+        if client is None:
+            return None
+        try:
+            data = call(client)
+        except Exception as e:
+            self.stats['misses'] += 1
+            self.logger.debug(f"Lokal {what} alınamadı: {e}")
+            return None
+        if not isinstance(data, dict):
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return data
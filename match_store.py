@@ -0,0 +1,383 @@
+"""
+Maç geçmişi deposu - Henrik'ten çekilen maçlar lokal SQLite'ta (WAL) tutulur
+Geçmiş ve istatistik sorguları API'ye gitmeden indekslerden cevaplanır
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable
+
+import requests
+
+import henrik_scheduler
+from config import Config, DEFAULT_HENRIK_BASE_URL
+from identity import PlayerIdentity
+from rate_limit import ExponentialBackoff
+
+# fetch(path, params) -> Henrik cevabının JSON'u (hata/kota yoksa None)
+HenrikFetch = Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    match_id    TEXT PRIMARY KEY,
+    puuid       TEXT NOT NULL,
+    started_at  INTEGER NOT NULL,
+    map         TEXT,
+    mode        TEXT,
+    agent       TEXT,
+    team        TEXT,
+    ally_score  INTEGER,
+    enemy_score INTEGER,
+    won         INTEGER,
+    kills       INTEGER,
+    deaths      INTEGER,
+    assists     INTEGER,
+    rr_change   INTEGER,
+    raw         BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_matches_player ON matches (puuid, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_matches_mode ON matches (puuid, mode, started_at DESC);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+COLUMNS = ('match_id', 'puuid', 'started_at', 'map', 'mode', 'agent', 'team', 'ally_score',
+           'enemy_score', 'won', 'kills', 'deaths', 'assists', 'rr_change')
+
+
+def _timestamp(value: Optional[str]) -> int:
+    """ISO tarihini epoch saniyeye çevir"""
+    if not value:
+        return 0
+    try:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        return 0
+
+
+def parse_stored_match(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Henrik v1 stored-matches kaydından kompakt satır"""
+    meta = item.get('meta') or {}
+    stats = item.get('stats') or {}
+    match_id = meta.get('id')
+    if not match_id:
+        return None
+
+    team = (stats.get('team') or '').lower()
+    teams = item.get('teams') or {}
+    ally = teams.get(team)
+    enemy = next((score for name, score in teams.items() if name != team), None)
+    won = None
+    if ally is not None and enemy is not None and ally != enemy:
+        won = int(ally > enemy)
+
+    return {
+        'match_id': match_id,
+        'puuid': stats.get('puuid', ''),
+        'started_at': _timestamp(meta.get('started_at')),
+        'map': (meta.get('map') or {}).get('name'),
+        'mode': (meta.get('mode') or '').lower(),
+        'agent': (stats.get('character') or {}).get('name'),
+        'team': team,
+        'ally_score': ally,
+        'enemy_score': enemy,
+        'won': won,
+        'kills': stats.get('kills'),
+        'deaths': stats.get('deaths'),
+        'assists': stats.get('assists'),
+        'rr_change': None,
+    }
+
+
+def history_entry(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Kompakt satırdan v3 maç geçmişi biçiminde kayıt - ValorantAPI.get_match_history için"""
+    started = datetime.fromtimestamp(row['started_at'], timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return {
+        'metadata': {
+            'matchid': row['match_id'],
+            'map': row['map'],
+            'mode': row['mode'],
+            'game_start': started,
+        },
+        'stats': {key: row[key] for key in ('agent', 'team', 'ally_score', 'enemy_score', 'won',
+                                            'kills', 'deaths', 'assists', 'rr_change')},
+    }
+
+
+class MatchStore:
+    """WAL modunda SQLite maç deposu
+
+    Her maç için sorgularda kullanılan alanlar ayrı kolonlarda, ham JSON ise
+    zlib ile sıkıştırılmış olarak saklanır.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path or str(Path(Config.get_config_path()).parent / 'matches.db')
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # ------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------
+
+    def add_matches(self, items: List[Dict[str, Any]]) -> int:
+        """stored-matches kayıtlarını ekle, yeni eklenen sayısını döndür"""
+        rows = []
+        for item in items:
+            row = parse_stored_match(item)
+            if row:
+                raw = zlib.compress(json.dumps(item, separators=(',', ':')).encode('utf-8'))
+                rows.append(tuple(row[c] for c in COLUMNS) + (raw,))
+
+        placeholders = ','.join('?' * (len(COLUMNS) + 1))
+        with self._lock, self._db:
+            before = self._db.total_changes
+            self._db.executemany(
+                f"INSERT OR IGNORE INTO matches ({','.join(COLUMNS)}, raw) VALUES ({placeholders})", rows)
+            return self._db.total_changes - before
+
+    def set_rr_changes(self, changes: Dict[str, int]) -> int:
+        """match_id -> RR değişimi eşlemesini uygula"""
+        with self._lock, self._db:
+            before = self._db.total_changes
+            self._db.executemany("UPDATE matches SET rr_change = ? WHERE match_id = ?",
+                                 [(rr, match_id) for match_id, rr in changes.items()])
+            return self._db.total_changes - before
+
+    def get_state(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else default
+
+    def set_state(self, key: str, value: str):
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+
+    def has_match(self, match_id: str) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM matches WHERE match_id = ?", (match_id,)).fetchone() is not None
+
+    def count(self, puuid: str) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM matches WHERE puuid = ?", (puuid,)).fetchone()[0]
+
+    def recent(self, puuid: str, mode: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Son maçlar (kompakt satırlar, yeniden eskiye)"""
+        query = f"SELECT {','.join(COLUMNS)} FROM matches WHERE puuid = ?"
+        params: list = [puuid]
+        if mode:
+            query += " AND mode = ?"
+            params.append(mode.lower())
+        query += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._db.execute(query, params)]
+
+    def raw(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """Maçın sıkıştırılmış ham JSON'u"""
+        with self._lock:
+            row = self._db.execute("SELECT raw FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+        if not row or row['raw'] is None:
+            return None
+        return json.loads(zlib.decompress(row['raw']).decode('utf-8'))
+
+    def stats(self, puuid: str, mode: Optional[str] = None, since: Optional[int] = None) -> Dict[str, Any]:
+        """Galibiyet, K/D ve toplam RR özeti"""
+        query = """
+            SELECT COUNT(*) AS matches,
+                   SUM(won = 1) AS wins,
+                   SUM(won = 0) AS losses,
+                   SUM(kills) AS kills,
+                   SUM(deaths) AS deaths,
+                   SUM(assists) AS assists,
+                   SUM(rr_change) AS rr_total
+            FROM matches WHERE puuid = ?"""
+        params: list = [puuid]
+        if mode:
+            query += " AND mode = ?"
+            params.append(mode.lower())
+        if since:
+            query += " AND started_at >= ?"
+            params.append(since)
+        with self._lock:
+            row = dict(self._db.execute(query, params).fetchone())
+
+        row = {k: v or 0 for k, v in row.items()}
+        row['win_rate'] = row['wins'] / row['matches'] if row['matches'] else 0.0
+        row['kd'] = row['kills'] / row['deaths'] if row['deaths'] else float(row['kills'])
+        return row
+
+
+class MatchSync:
+    """Henrik'ten maç geçmişini arka planda depoya senkronize eder
+
+    - Yeni maçlar: ilk sayfadan başlayıp depoda olan bir maça gelince durur
+    - Eski geçmiş: kalınan sayfadan devam eder, sayfalar arası bekler,
+      hata/kota dolunca katlanarak artan süre bekler
+    - RR: mmr-history'deki match_id'lerle eşleştirilir
+
+    İstekler Henrik zamanlayıcısında en düşük öncelikle (history) gider.
+    """
+
+    PAGE_SIZE = 20
+    PAGE_DELAY = 2.0
+    RESYNC_INTERVAL = 30 * 60
+
+    def __init__(self, store: MatchStore, fetch: Optional[HenrikFetch] = None):
+        self.logger = logging.getLogger(__name__)
+        self.store = store
+        self.fetch = fetch or self._henrik_fetch
+        self.identity = PlayerIdentity()
+        self.api_key = ''
+        self.base_url = DEFAULT_HENRIK_BASE_URL
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def configure(self, identity: PlayerIdentity, api_key: str = '', base_url: Optional[str] = None):
+        """Senkronize edilecek oyuncu - PUUID biliniyorsa by-puuid uç noktaları kullanılır"""
+        self.identity = identity
+        self.api_key = api_key
+        self.base_url = (base_url or DEFAULT_HENRIK_BASE_URL).rstrip('/')
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive() and not self._stop.is_set())
+
+    def start(self):
+        """Arka plan senkronizasyonunu başlat"""
+        if self.running:
+            self.request_sync()
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='MatchSync', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Durdur - timeout verilirse thread'in bitmesini bekle (depo kapatılmadan önce)"""
+        self._stop.set()
+        self._wake.set()
+        if timeout and self._thread:
+            self._thread.join(timeout)
+
+    def request_sync(self):
+        """Maç bitti - yeni maçları hemen çek"""
+        self._wake.set()
+
+    def _run(self):
+        backoff = ExponentialBackoff(base=self.PAGE_DELAY, maximum=10 * 60)
+        while not self._stop.is_set():
+            if not self.identity.known:
+                self._wake.wait(self.RESYNC_INTERVAL)
+                self._wake.clear()
+                continue
+
+            try:
+                self.sync_new()
+                self.sync_rr()
+                backoff.reset()
+                # Eski geçmiş - sayfa sayfa, yeni maç isteği gelirse araya girer
+                while not self._stop.is_set() and not self._wake.is_set():
+                    if not self.sync_history_page():
+                        break
+                    self._stop.wait(self.PAGE_DELAY)
+                delay = self.RESYNC_INTERVAL
+            except requests.RequestException as e:
+                delay = backoff.next_delay()
+                self.logger.debug(f"Maç senkronizasyonu ertelendi ({delay:.0f}s): {e}")
+            except (sqlite3.Error, ValueError, KeyError, TypeError) as e:
+                # Depo hatası veya beklenmedik Henrik cevabı - thread ölmez, sonra tekrar denenir
+                delay = backoff.next_delay()
+                self.logger.warning(f"Maç senkronizasyonu hatası, {delay:.0f} saniye sonra tekrar denenecek: {e}")
+
+            self._wake.wait(delay)
+            self._wake.clear()
+
+    def sync_new(self) -> int:
+        """Depoda olmayan yeni maçları çek"""
+        # İlk senkronizasyonda sadece ilk sayfa - gerisi eski geçmiş olarak yavaşça
+        first_sync = self.store.get_state(self._key('history_page')) is None
+        added = 0
+        page = 1
+        while True:
+            items = self._stored_matches(page)
+            if not items:
+                break
+            known = any(self.store.has_match((i.get('meta') or {}).get('id', '')) for i in items)
+            added += self.store.add_matches(items)
+            if first_sync or known or len(items) < self.PAGE_SIZE:
+                break
+            page += 1
+
+        if first_sync:
+            self.store.set_state(self._key('history_page'), '2')
+        if added:
+            self.logger.info(f"📚 {added} yeni maç kaydedildi")
+        return added
+
+    def sync_history_page(self) -> bool:
+        """Eski geçmişten bir sayfa çek - devam edilecekse True"""
+        if self.store.get_state(self._key('history_done')) == '1':
+            return False
+
+        page = int(self.store.get_state(self._key('history_page'), '2'))
+        items = self._stored_matches(page)
+        if not items:
+            self.store.set_state(self._key('history_done'), '1')
+            return False
+
+        self.store.add_matches(items)
+        self.store.set_state(self._key('history_page'), str(page + 1))
+        if len(items) < self.PAGE_SIZE:
+            # Son sayfa
+            self.store.set_state(self._key('history_done'), '1')
+            return False
+        return True
+
+    def sync_rr(self) -> int:
+        """mmr-history'den RR değişimlerini maçlara işle"""
+        data = self.fetch(self.identity.mmr_history_path(), {})
+        changes = {
+            entry['match_id']: entry.get('mmr_change_to_last_game')
+            for entry in (data or {}).get('data') or []
+            if entry.get('match_id')
+        }
+        return self.store.set_rr_changes(changes) if changes else 0
+
+    def _stored_matches(self, page: int) -> List[Dict[str, Any]]:
+        data = self.fetch(self.identity.stored_matches_path(), {'page': page, 'size': self.PAGE_SIZE})
+        return (data or {}).get('data') or []
+
+    def _key(self, name: str) -> str:
+        return f"{self.identity.region}/{self.identity.key}/{name}".lower()
+
+    def _henrik_fetch(self, path: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        headers = {'Authorization': self.api_key} if self.api_key else {}
+        response = henrik_scheduler.get(f"{self.base_url}/{path}", headers=headers, params=params,
+                                        priority=henrik_scheduler.PRIORITY_HISTORY)
+        if response.status_code != 200:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+        return response.json()
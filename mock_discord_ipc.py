@@ -0,0 +1,190 @@
+"""
+Discord IPC soketinin lokal taklidi (test ve geliştirme için)
+Discord açık olmadan DiscordRPC'yi ve yeniden bağlanmayı denemeye yarar
+
+Sadece Linux/macOS (unix soketi). pypresence soketi XDG_RUNTIME_DIR
+altında aradığı için istemci tarafında bu değişken sunucunun klasörüne
+ayarlanmalıdır.
+
+Kullanım:
+    python mock_discord_ipc.py [klasör]
+"""
+
+import json
+import logging
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Optional, Dict, Any, List
+
+# IPC opcode'ları
+OP_HANDSHAKE = 0
+OP_FRAME = 1
+OP_CLOSE = 2
+
+
+class MockDiscordIPC:
+    """discord-ipc-0 soketini dinleyen basit sunucu
+
+    Handshake'e READY, SET_ACTIVITY'ye aynı activity ile cevap verir ve
+    gelen activity'leri sırayla kaydeder. kill() Discord'un kapanmasını,
+    start() tekrar açılmasını taklit eder.
+    """
+
+    def __init__(self, directory: str):
+        self.logger = logging.getLogger(__name__)
+        self.directory = directory
+        self.path = os.path.join(directory, 'discord-ipc-0')
+
+        self.server: Optional[socket.socket] = None
+        self.clients: List[socket.socket] = []
+        self.activities: List[Optional[Dict[str, Any]]] = []
+        self.handshakes = 0
+        self.running = False
+        self._lock = threading.Lock()
+
+    @property
+    def activity(self) -> Optional[Dict[str, Any]]:
+        """Son ayarlanan activity"""
+        with self._lock:
+            return self.activities[-1] if self.activities else None
+
+    def start(self):
+        """Soketi oluştur ve arka planda dinle"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(self.path)
+        self.server.listen(5)
+        self.running = True
+        threading.Thread(target=self._accept_loop, args=(self.server,), daemon=True).start()
+
+    def kill(self):
+        """Discord kapandı - bağlantıları kopar ve soketi sil"""
+        self.running = False
+        with self._lock:
+            clients, self.clients = self.clients, []
+        for client in clients:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+                client.close()
+            except OSError:
+                pass
+        if self.server:
+            try:
+                self.server.close()
+            except OSError:
+                pass
+            self.server = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def wait_for_activity(self, count: int, timeout: float = 5) -> bool:
+        """En az `count` activity gelene kadar bekle"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._lock:
+                if len(self.activities) >= count:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def _accept_loop(self, server: socket.socket):
+        while self.running:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._handle_client, args=(conn,), daemon=True).start()
+
+    def _handle_client(self, conn: socket.socket):
+        with self._lock:
+            self.clients.append(conn)
+        try:
+            while self.running:
+                frame = self._read_frame(conn)
+                if frame is None:
+                    break
+                op, payload = frame
+
+                if op == OP_HANDSHAKE:
+                    with self._lock:
+                        self.handshakes += 1
+                    self._send(conn, OP_FRAME, {
+                        'cmd': 'DISPATCH', 'evt': 'READY', 'nonce': None,
+                        'data': {'v': 1, 'user': {'id': '0', 'username': 'mock'}},
+                    })
+                elif op == OP_CLOSE:
+                    break
+                elif op == OP_FRAME and payload.get('cmd') == 'SET_ACTIVITY':
+                    activity = payload.get('args', {}).get('activity')
+                    with self._lock:
+                        self.activities.append(activity)
+                    self._send(conn, OP_FRAME, {
+                        'cmd': 'SET_ACTIVITY', 'evt': None,
+                        'nonce': payload.get('nonce'), 'data': activity,
+                    })
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._lock:
+                if conn in self.clients:
+                    self.clients.remove(conn)
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _recv_exact(conn: socket.socket, size: int) -> Optional[bytes]:
+        data = b''
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _read_frame(self, conn: socket.socket):
+        header = self._recv_exact(conn, 8)
+        if header is None:
+            return None
+        op, length = struct.unpack('<II', header)
+        body = self._recv_exact(conn, length) if length else b'{}'
+        if body is None:
+            return None
+        return op, json.loads(body.decode('utf-8'))
+
+    @staticmethod
+    def _send(conn: socket.socket, op: int, payload: Dict[str, Any]):
+        data = json.dumps(payload).encode('utf-8')
+        conn.sendall(struct.pack('<II', op, len(data)) + data)
+
+
+def main():
+    """Sahte Discord'u başlat ve gelen activity'leri yazdır"""
+    logging.basicConfig(level=logging.INFO)
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.getcwd()
+    server = MockDiscordIPC(directory)
+    server.start()
+    print(f"🧪 Mock Discord IPC: {server.path}")
+    print(f"   İstemci için: XDG_RUNTIME_DIR={directory}")
+
+    seen = 0
+    try:
+        while True:
+            time.sleep(0.5)
+            with server._lock:
+                new = server.activities[seen:]
+            for activity in new:
+                print(f"📥 SET_ACTIVITY: {activity}")
+            seen += len(new)
+    except KeyboardInterrupt:
+        server.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Henrik API'nin lokal taklidi (test, geliştirme ve benchmark için)
+fixtures/henrik altındaki kayıtlı cevapları döndürür; gecikme, 429, 5xx ve
+timeout enjekte edilebilir
+
+Kullanım:
+    python mock_henrik_server.py --port 8765 --latency 0.2
+    # config.json: "henrik_base_url": "http://127.0.0.1:8765/valorant"
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit, parse_qs, unquote
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'henrik'
+
+# (endpoint adı, yol regex'i, fixture dosyası)
+ROUTES: List[Tuple[str, str, str]] = [
+    ('account', r'^/valorant/v1/account/(?P<name>[^/]+)/(?P<tag>[^/]+)$', 'account.json'),
+    ('account', r'^/valorant/v1/by-puuid/account/(?P<puuid>[^/]+)$', 'account.json'),
+    ('mmr', r'^/valorant/v2/mmr/(?P<region>[^/]+)/(?P<name>[^/]+)/(?P<tag>[^/]+)$', 'mmr.json'),
+    ('mmr', r'^/valorant/v2/by-puuid/mmr/(?P<region>[^/]+)/(?P<puuid>[^/]+)$', 'mmr.json'),
+    ('matches', r'^/valorant/v3/matches/(?P<region>[^/]+)/(?P<name>[^/]+)/(?P<tag>[^/]+)$', 'matches.json'),
+    ('matches', r'^/valorant/v3/by-puuid/matches/(?P<region>[^/]+)/(?P<puuid>[^/]+)$', 'matches.json'),
+    ('match', r'^/valorant/v2/match/(?P<match_id>[^/]+)$', 'match.json'),
+    ('raw', r'^/valorant/v1/raw$', 'raw_coregame.json'),
+    ('stored-matches', r'^/valorant/v1/stored-matches/(?P<region>[^/]+)/(?P<name>[^/]+)/(?P<tag>[^/]+)$',
+     'stored_matches.json'),
+    ('stored-matches', r'^/valorant/v1/by-puuid/stored-matches/(?P<region>[^/]+)/(?P<puuid>[^/]+)$',
+     'stored_matches.json'),
+    ('mmr-history', r'^/valorant/v1/mmr-history/(?P<region>[^/]+)/(?P<name>[^/]+)/(?P<tag>[^/]+)$',
+     'mmr_history.json'),
+    ('mmr-history', r'^/valorant/v1/by-puuid/mmr-history/(?P<region>[^/]+)/(?P<puuid>[^/]+)$',
+     'mmr_history.json'),
+]
+
+
+class Fault:
+    """Sıradaki isteklere uygulanacak hata"""
+
+    def __init__(self, status: Optional[int] = None, hang: float = 0.0, endpoint: Optional[str] = None,
+                 count: int = 1, retry_after: Optional[int] = None):
+        self.status = status
+        self.hang = hang
+        self.endpoint = endpoint
+        self.count = count
+        self.retry_after = retry_after
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.mock.count_connection()
+
+    def do_GET(self):
+        self.server.mock.handle(self)
+
+    def do_POST(self):
+        # v1/raw resmi API'de POST
+        length = int(self.headers.get('Content-Length') or 0)
+        self.body = self.rfile.read(length) if length else b''
+        self.server.mock.handle(self)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockHenrikServer:
+    """Kayıtlı fixture'larla çalışan Henrik API sunucusu
+
+    - `latency`: her cevaptan önce beklenecek süre (saniye)
+    - `error_rate`: rastgele 503 döndürme olasılığı
+    - `fail_next()` / `hang_next()`: sıradaki isteklere 429/5xx veya timeout
+    - `rate_limit`: (limit, period) verilirse x-ratelimit-* başlıkları ve
+      kota aşımında 429 döner
+    - `api_key`: verilirse Authorization başlığı eşleşmeyen istekler 401 alır
+    - `headers`: her cevaba eklenecek başlıklar (örn. sabit x-ratelimit-*)
+    - `compress`: True ise gzip kabul eden istemcilere sıkıştırılmış cevap
+
+    Cevaplara ETag eklenir; If-None-Match eşleşirse 304 döner.
+    """
+
+    def __init__(self, fixtures_dir: Optional[str] = None, host: str = '127.0.0.1', port: int = 0,
+                 api_key: Optional[str] = None, rate_limit: Optional[Tuple[int, float]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else FIXTURES_DIR
+        self.api_key = api_key
+        self.rate_limit = rate_limit
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.headers: Dict[str, str] = {}
+        self.compress = False
+
+        self.requests: List[Tuple[str, str]] = []   # (endpoint, yol)
+        self.counts: Dict[str, int] = {}
+        self.connections = 0                         # Açılan TCP bağlantıları (keep-alive kontrolü)
+        self.overrides: Dict[str, Any] = {}         # endpoint -> fixture yerine dönecek JSON (veya bytes)
+
+        self._routes = [(name, re.compile(pattern), fixture) for name, pattern, fixture in ROUTES]
+        self._fixtures: Dict[str, bytes] = {}
+        self._faults: List[Fault] = []
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._window_count = 0
+
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.mock = self
+        self.host, self.port = self.httpd.server_address[:2]
+
+    @property
+    def base_url(self) -> str:
+        """Config'deki henrik_base_url yerine kullanılacak adres"""
+        return f"http://{self.host}:{self.port}/valorant"
+
+    def start(self) -> 'MockHenrikServer':
+        """Sunucuyu arka planda başlat"""
+        threading.Thread(target=self.httpd.serve_forever, name='MockHenrik', daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Hata enjeksiyonu
+    # ------------------------------------------------------------------
+
+    def fail_next(self, status: int = 503, count: int = 1, endpoint: Optional[str] = None,
+                  retry_after: Optional[int] = None):
+        """Sıradaki `count` isteğe `status` döndür (429 için retry_after verilebilir)"""
+        with self._lock:
+            self._faults.append(Fault(status=status, endpoint=endpoint, count=count, retry_after=retry_after))
+
+    def hang_next(self, seconds: float, count: int = 1, endpoint: Optional[str] = None):
+        """Sıradaki `count` isteği `seconds` bekletip sonra cevapla (client timeout'u için)"""
+        with self._lock:
+            self._faults.append(Fault(hang=seconds, endpoint=endpoint, count=count))
+
+    def clear_faults(self):
+        with self._lock:
+            self._faults.clear()
+            self.error_rate = 0.0
+
+    # ------------------------------------------------------------------
+    # İstek işleme
+    # ------------------------------------------------------------------
+
+    def count_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def handle(self, handler: _Handler):
+        url = urlsplit(handler.path)
+        path = unquote(url.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        endpoint, fixture, params = self._route(path)
+
+        with self._lock:
+            self.requests.append((endpoint or '?', handler.path))
+            self.counts[endpoint or '?'] = self.counts.get(endpoint or '?', 0) + 1
+            fault = self._take_fault(endpoint)
+            limit_headers, limited = self._count_quota()
+            limit_headers.update(self.headers)
+
+        if self.latency:
+            time.sleep(self.latency)
+        if fault and fault.hang:
+            time.sleep(fault.hang)
+
+        if self.api_key and handler.headers.get('Authorization') != self.api_key:
+            return self._send_error(handler, 401, 'Invalid API key', limit_headers)
+        if limited:
+            return self._send_error(handler, 429, 'Rate limit exceeded', limit_headers,
+                                    retry_after=int(self.rate_limit[1]))
+        if fault and fault.status:
+            return self._send_error(handler, fault.status, 'Injected error', limit_headers,
+                                    retry_after=fault.retry_after)
+        if self.error_rate and random.random() < self.error_rate:
+            return self._send_error(handler, 503, 'Injected error', limit_headers)
+        if not endpoint:
+            return self._send_error(handler, 404, 'Not found', limit_headers)
+
+        body = self._body(endpoint, fixture, params, query)
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if handler.headers.get('If-None-Match') == etag:
+            return self._send(handler, 304, b'', dict(limit_headers, ETag=etag))
+        if self.compress and 'gzip' in handler.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            limit_headers['Content-Encoding'] = 'gzip'
+        self._send(handler, 200, body, dict(limit_headers, ETag=etag))
+
+    def _route(self, path: str) -> Tuple[Optional[str], Optional[str], Dict[str, str]]:
+        for name, pattern, fixture in self._routes:
+            match = pattern.match(path)
+            if match:
+                return name, fixture, match.groupdict()
+        return None, None, {}
+
+    def _take_fault(self, endpoint: Optional[str]) -> Optional[Fault]:
+        for fault in self._faults:
+            if fault.endpoint is None or fault.endpoint == endpoint:
+                fault.count -= 1
+                if fault.count <= 0:
+                    self._faults.remove(fault)
+                return fault
+        return None
+
+    def _count_quota(self) -> Tuple[Dict[str, str], bool]:
+        """Sabit pencereli kota - (başlıklar, aşıldı mı)"""
+        if not self.rate_limit:
+            return {}, False
+        limit, period = self.rate_limit
+        now = time.time()
+        if now - self._window_start >= period:
+            self._window_start, self._window_count = now, 0
+        self._window_count += 1
+        remaining = max(0, limit - self._window_count)
+        headers = {
+            'x-ratelimit-limit': str(limit),
+            'x-ratelimit-remaining': str(remaining),
+            'x-ratelimit-reset': str(max(1, int(self._window_start + period - now))),
+        }
+        return headers, self._window_count > limit
+
+    def _body(self, endpoint: str, fixture: str, params: Dict[str, str], query: Dict[str, str]) -> bytes:
+        if endpoint in self.overrides:
+            override = self.overrides[endpoint]
+            return override if isinstance(override, bytes) else json.dumps(override).encode('utf-8')
+
+        if endpoint in ('account', 'mmr') and 'name' in params:
+            # İstenen Riot ID ile cevapla
+            data = json.loads(self._fixture(fixture))
+            data['data']['name'], data['data']['tag'] = params['name'], params['tag']
+            return json.dumps(data).encode('utf-8')
+
+        if endpoint == 'stored-matches' and 'page' in query:
+            data = json.loads(self._fixture(fixture))
+            size = int(query.get('size', 20))
+            start = (int(query['page']) - 1) * size
+            data['data'] = data['data'][start:start + size]
+            return json.dumps(data).encode('utf-8')
+
+        return self._fixture(fixture)
+
+    def _fixture(self, name: str) -> bytes:
+        if name not in self._fixtures:
+            self._fixtures[name] = (self.fixtures_dir / name).read_bytes()
+        return self._fixtures[name]
+
+    def _send_error(self, handler, status: int, message: str, headers: Dict[str, str],
+                    retry_after: Optional[int] = None):
+        if retry_after is not None:
+            headers = dict(headers, **{'Retry-After': str(retry_after)})
+        body = json.dumps({'status': status, 'errors': [{'message': message, 'code': 0}]}).encode('utf-8')
+        self._send(handler, status, body, headers)
+
+    @staticmethod
+    def _send(handler, status: int, body: bytes, headers: Dict[str, str]):
+        try:
+            handler.send_response(status)
+            handler.send_header('Content-Type', 'application/json')
+            handler.send_header('Content-Length', str(len(body)))
+            for name, value in headers.items():
+                handler.send_header(name, value)
+            handler.end_headers()
+            handler.wfile.write(body)
+        except OSError:
+            # İstemci timeout olup bağlantıyı kapattı
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lokal Henrik API taklidi')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='Her cevaptan önce bekleme (saniye)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Rastgele 503 olasılığı (0-1)')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Dakikalık istek limiti (0 = sınırsız)')
+    parser.add_argument('--api-key', default=None, help='Beklenen Authorization değeri')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockHenrikServer(host=args.host, port=args.port, api_key=args.api_key,
+                              rate_limit=(args.rate_limit, 60.0) if args.rate_limit else None)
+    server.latency = args.latency
+    server.error_rate = args.error_rate
+    server.start()
+    print(f"Mock Henrik API: {server.base_url}")
+    print("Durdurmak için Ctrl+C")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
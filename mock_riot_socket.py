@@ -0,0 +1,238 @@
+"""
+Riot Client websocket'inin lokal taklidi (test ve geliştirme için)
+Valorant açık olmadan PresenceSocket'i denemeye yarar
+
+Kullanım:
+    python mock_riot_socket.py            # lockfile yazar, örnek presence'lar yayınlar
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import socket
+import struct
+import threading
+import time
+from typing import Optional, Dict, Any, List
+
+from presence_socket import WAMP_SUBSCRIBE, WAMP_EVENT, PRESENCE_EVENT
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+class MockRiotSocket:
+    """Basit, TLS'siz WAMP/websocket sunucusu
+
+    Sadece PresenceSocket'in kullandığı kadarını uygular: Basic auth ile
+    handshake, subscribe mesajı ve sunucudan istemciye text frame.
+    """
+
+    def __init__(self, password: str = 'mockpassword', host: str = '127.0.0.1', port: int = 0):
+        self.logger = logging.getLogger(__name__)
+        self.password = password
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((host, port))
+        self.server.listen(5)
+        self.port = self.server.getsockname()[1]
+
+        self.clients: List[socket.socket] = []
+        self.subscriptions: List[str] = []
+        self.running = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Sunucuyu arka planda başlat"""
+        self.running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def stop(self):
+        """Sunucuyu ve tüm bağlantıları kapat"""
+        self.running = False
+        self.drop_clients()
+        try:
+            self.server.close()
+        except OSError:
+            pass
+
+    def write_lockfile(self, path: str):
+        """PresenceSocket'in okuyacağı lockfile'ı yaz"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"Riot Client:1234:{self.port}:{self.password}:https")
+
+    def push_presence(self, puuid: str, presence: Dict[str, Any], product: str = 'valorant'):
+        """Abonelere presence olayı gönder"""
+        private = base64.b64encode(json.dumps(presence).encode()).decode()
+        message = [WAMP_EVENT, PRESENCE_EVENT, {
+            'data': {'presences': [{'puuid': puuid, 'product': product, 'private': private}]},
+            'eventType': 'Update',
+            'uri': '/chat/v4/presences',
+        }]
+        self._broadcast(json.dumps(message))
+
+    def drop_clients(self):
+        """Tüm istemci bağlantılarını kopar (socket düşmesi testi)"""
+        with self._lock:
+            clients, self.clients = self.clients, []
+        for client in clients:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+                client.close()
+            except OSError:
+                pass
+
+    def wait_for_subscriber(self, timeout: float = 5) -> bool:
+        """Bir istemci abone olana kadar bekle"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._lock:
+                if self.clients and PRESENCE_EVENT in self.subscriptions:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._handle_client, args=(conn,), daemon=True).start()
+
+    def _handle_client(self, conn: socket.socket):
+        try:
+            if not self._handshake(conn):
+                conn.close()
+                return
+            with self._lock:
+                self.clients.append(conn)
+
+            while self.running:
+                message = self._read_frame(conn)
+                if message is None:
+                    break
+                try:
+                    payload = json.loads(message)
+                except ValueError:
+                    continue
+                if isinstance(payload, list) and len(payload) >= 2 and payload[0] == WAMP_SUBSCRIBE:
+                    with self._lock:
+                        self.subscriptions.append(payload[1])
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                if conn in self.clients:
+                    self.clients.remove(conn)
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def _handshake(self, conn: socket.socket) -> bool:
+        request = b''
+        while b'\r\n\r\n' not in request:
+            chunk = conn.recv(4096)
+            if not chunk:
+                return False
+            request += chunk
+
+        headers = {}
+        for line in request.decode('latin-1').split('\r\n')[1:]:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                headers[key.strip().lower()] = value.strip()
+
+        expected = 'Basic ' + base64.b64encode(f"riot:{self.password}".encode()).decode()
+        if headers.get('authorization') != expected:
+            conn.sendall(b'HTTP/1.1 401 Unauthorized\r\nContent-Length: 0\r\n\r\n')
+            return False
+
+        accept = base64.b64encode(
+            hashlib.sha1((headers.get('sec-websocket-key', '') + WS_GUID).encode()).digest()
+        ).decode()
+        conn.sendall((
+            'HTTP/1.1 101 Switching Protocols\r\n'
+            'Upgrade: websocket\r\n'
+            'Connection: Upgrade\r\n'
+            f'Sec-WebSocket-Accept: {accept}\r\n\r\n'
+        ).encode())
+        return True
+
+    @staticmethod
+    def _recv_exact(conn: socket.socket, size: int) -> Optional[bytes]:
+        data = b''
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _read_frame(self, conn: socket.socket) -> Optional[str]:
+        header = self._recv_exact(conn, 2)
+        if header is None:
+            return None
+        opcode = header[0] & 0x0F
+        masked = header[1] & 0x80
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack('>H', self._recv_exact(conn, 2))[0]
+        elif length == 127:
+            length = struct.unpack('>Q', self._recv_exact(conn, 8))[0]
+        mask = self._recv_exact(conn, 4) if masked else b'\x00\x00\x00\x00'
+        payload = self._recv_exact(conn, length) if length else b''
+        if payload is None or opcode == 0x8:
+            return None
+        data = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return data.decode('utf-8', errors='replace') if opcode == 0x1 else ''
+
+    def _broadcast(self, text: str):
+        data = text.encode('utf-8')
+        if len(data) < 126:
+            header = struct.pack('>BB', 0x81, len(data))
+        elif len(data) < 65536:
+            header = struct.pack('>BBH', 0x81, 126, len(data))
+        else:
+            header = struct.pack('>BBQ', 0x81, 127, len(data))
+
+        with self._lock:
+            clients = list(self.clients)
+        for client in clients:
+            try:
+                client.sendall(header + data)
+            except OSError:
+                pass
+
+
+def main():
+    """Lockfile yaz ve menü -> ajan seçimi -> maç döngüsü yayınla"""
+    logging.basicConfig(level=logging.INFO)
+    server = MockRiotSocket()
+    server.start()
+    server.write_lockfile('lockfile')
+    print(f"🧪 Mock Riot websocket: ws://127.0.0.1:{server.port} (lockfile yazıldı)")
+
+    puuid = 'mock-puuid'
+    states = [
+        {'isValid': True, 'queueId': 'competitive', 'partySize': 1,
+         'matchPresenceData': {'sessionLoopState': 'MENUS', 'matchMap': '', 'queueId': 'competitive'}},
+        {'isValid': True, 'queueId': 'competitive', 'partySize': 1,
+         'matchPresenceData': {'sessionLoopState': 'PREGAME', 'matchMap': '/Game/Maps/Ascent/Ascent',
+                               'queueId': 'competitive'}},
+        {'isValid': True, 'queueId': 'competitive', 'partySize': 1,
+         'matchPresenceData': {'sessionLoopState': 'INGAME', 'matchMap': '/Game/Maps/Ascent/Ascent',
+                               'queueId': 'competitive', 'isMatchInProgress': True}},
+    ]
+    try:
+        while True:
+            for state in states:
+                server.push_presence(puuid, state)
+                time.sleep(5)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Poll zamanlayıcı - Session durumuna ve değişim hızına göre bekleme süresi
+"""
+
+import logging
+from typing import Optional, Any
+
+
+class PollScheduler:
+    """Uyarlanabilir poll aralığı hesaplayıcı
+
+    Ajan seçiminde, round geçişlerinde ve durum değişikliklerinden hemen
+    sonra hızlı poll eder; hiçbir şey değişmediğinde (özellikle menüde)
+    adım adım yavaşlar. Config.update_interval üst sınır olarak kullanılır.
+
+    Riot websocket bağlıyken presence değişiklikleri poll'u beklemeden
+    döngüyü uyandırır; poll sadece yedek yoldur, bu yüzden boşta uzun
+    aralıklar güncellemeleri geciktirmez.
+    """
+
+    MIN_INTERVAL = 1.0
+
+    # Session durumuna göre başlangıç aralıkları (saniye)
+    BASE_INTERVALS = {
+        'pregame': 1.0,
+        'ingame': 2.0,
+        'menus': 2.0,
+    }
+
+    # Değişiklik olmadıkça her poll'da aralık bu oranla büyür
+    BACKOFF_FACTORS = {
+        'pregame': 1.0,   # Ajan seçiminde hiç yavaşlama
+        'ingame': 1.5,
+        'menus': 2.0,
+    }
+
+    # Session durumuna göre tavan - max_interval'dan küçük olan geçerli
+    STATE_CEILINGS = {
+        'pregame': 1.0,
+        'ingame': 10.0,   # Skor değişimi websocket'ten gelmezse en geç bu kadar gecikir
+    }
+
+    # Değişiklikten / round geçişinden sonra kaç poll boyunca hızlı kalınacak
+    BURST_POLLS = 3
+
+    def __init__(self, max_interval: float = 20):
+        self.logger = logging.getLogger(__name__)
+        self.max_interval = max(float(max_interval or 0), self.MIN_INTERVAL)
+        self.session_state: Optional[str] = None
+        self.round_key: Any = None
+        self.interval = self.MIN_INTERVAL
+        self.burst_remaining = 0
+
+    def reset(self):
+        """Yeni bağlantıda zamanlayıcıyı baştan başlat"""
+        self.session_state = None
+        self.round_key = None
+        self.interval = self.MIN_INTERVAL
+        self.burst_remaining = 0
+
+    def ceiling(self, state: str) -> float:
+        return max(min(self.STATE_CEILINGS.get(state, self.max_interval), self.max_interval), self.MIN_INTERVAL)
+
+    def next_interval(self, session_state: Optional[str], changed: bool, round_key: Any = None) -> float:
+        """Bir sonraki poll'a kadar beklenecek süreyi döndür
+
+        Args:
+            session_state: 'menus', 'pregame', 'ingame' veya durum alınamadıysa None
+            changed: Son poll'da Discord'a giden presence değişti mi
+            round_key: Maç içinde round'u belirleyen değer (ör. skor) - değişince round geçişi
+        """
+        state = session_state or 'menus'
+        ceiling = self.ceiling(state)
+        base = min(self.BASE_INTERVALS.get(state, self.BASE_INTERVALS['menus']), ceiling)
+
+        if state != self.session_state:
+            # Session geçişi (menü -> ajan seçimi -> maç) - yoğun değişim dönemi
+            self.session_state = state
+            self.round_key = None
+            changed = True
+
+        if state == 'ingame' and round_key is not None:
+            if self.round_key is not None and round_key != self.round_key:
+                # Round bitti - alım evresi ve sonraki round başlangıcı hızlı takip edilir
+                changed = True
+            self.round_key = round_key
+
+        if changed:
+            self.burst_remaining = self.BURST_POLLS
+            self.interval = self.MIN_INTERVAL
+        elif self.burst_remaining > 0:
+            self.burst_remaining -= 1
+            self.interval = self.MIN_INTERVAL
+        elif self.interval < base:
+            self.interval = base
+        else:
+            factor = self.BACKOFF_FACTORS.get(state, self.BACKOFF_FACTORS['menus'])
+            self.interval = min(self.interval * factor, ceiling)
+
+        self.logger.debug(f"⏱️ Poll aralığı: {self.interval:.1f}s (state: {state}, değişim: {changed})")
+        return self.interval
@@ -7,6 +7,9 @@ import logging
 import time
 from typing import Dict, Any, Optional
 
+import tiers
+from i18n import t
+
 class PresenceBuilderV2:
     """Discord RPC presence oluşturucu - Client tabanlı"""
     
@@ -39,18 +42,18 @@ class PresenceBuilderV2:
         party_size = status.get('party_size', 0)
         party_max = status.get('party_max', 5)
         rank_text = status.get('rank_text', '')
-        queue_name = status.get('queue_name', 'Lobide')
+        queue_name = status.get('queue_name', t('lobby'))
         
         # Details: Oyun modu (boş olamaz!)
         if queue_id:
             details_text = queue_name
         else:
-            details_text = rank_text if rank_text else "Menüde"
+            details_text = rank_text if rank_text else t('in_menus')
         
         presence = {
             'details': details_text,
             'large_image': status.get('card_large', 'valorant_logo'),
-            'large_text': f"Seviye {status.get('level', 0)}",
+            'large_text': t('level', level=status.get('level', 0)),
             'start': self.start_timestamp,
         }
         
@@ -59,7 +62,7 @@ class PresenceBuilderV2:
             presence['party_size'] = [party_size, party_max]
         
         # Small image: Lobide competitive ise rank göster
-        if queue_id and ('competitive' in queue_id.lower() or 'rekabetçi' in queue_name.lower()):
+        if queue_id and 'competitive' in queue_id.lower():
             # Competitive lobby - rank icon + RR
             rank_icon = status.get('rank_icon')
             self.logger.debug(f"🏆 Competitive lobby - Rank icon: {rank_icon}, Rank text: {rank_text}")
@@ -90,13 +93,13 @@ class PresenceBuilderV2:
     
     def _build_pregame_presence(self, status: Dict[str, Any]) -> Dict[str, Any]:
         """Ajan seçimi presence"""
-        queue_name = status.get('queue_name', 'Maç')
+        queue_name = status.get('queue_name', t('match'))
         party_size = status.get('party_size', 0)
         party_max = status.get('party_max', 5)
         map_name = status.get('map_name', '')
         
         # Details: Ajan Seçiliyor
-        details_text = "Ajan Seçiliyor"
+        details_text = t('agent_select')
         
         # Large image: MAP (varsa), yoksa profil kartı
         map_icon = status.get('map_icon')
@@ -105,7 +108,7 @@ class PresenceBuilderV2:
             large_text = map_name
         else:
             large_image = status.get('card_large', 'valorant_logo')
-            large_text = f"Seviye {status.get('level', 0)}"
+            large_text = t('level', level=status.get('level', 0))
         
         presence = {
             'details': details_text,
@@ -119,9 +122,8 @@ class PresenceBuilderV2:
             presence['party_size'] = [party_size, party_max]
         
         # Unranked icon
-        unranked_icon = "https://media.valorant-api.com/competitivetiers/03621f52-342b-cf4e-4f86-9350a49c6d04/0/largeicon.png"
-        presence['small_image'] = unranked_icon
-        presence['small_text'] = "Oyun Öncesi"
+        presence['small_image'] = tiers.tier(0).icon_url
+        presence['small_text'] = t('pregame')
         
         # Buttons
         presence['buttons'] = [
@@ -133,7 +135,7 @@ class PresenceBuilderV2:
     def _build_ingame_presence(self, status: Dict[str, Any]) -> Dict[str, Any]:
         """Maç içi presence"""
         map_name = status.get('map_name', '')
-        queue_name = status.get('queue_name', 'Maç')
+        queue_name = status.get('queue_name', t('match'))
         party_size = status.get('party_size', 0)
         party_max = status.get('party_max', 5)
         agent_name = status.get('agent_name', '')
@@ -146,7 +148,7 @@ class PresenceBuilderV2:
             details_text = f"{queue_name} / {score_part}"
         else:
             # Skor yoksa sadece oyun modu
-            details_text = queue_name if queue_name else "Maçta"
+            details_text = queue_name if queue_name else t('in_match')
         
         # Large image: MAP
         map_icon = status.get('map_icon')
@@ -156,7 +158,7 @@ class PresenceBuilderV2:
         else:
             # Map yoksa profil kartı
             large_image = status.get('card_large', 'valorant_logo')
-            large_text = f"Seviye {status.get('level', 0)}"
+            large_text = t('level', level=status.get('level', 0))
         
         presence = {
             'details': details_text,
@@ -0,0 +1,155 @@
+"""
+Session durumu debouncer - sıra bulma, ajan seçimi ve yükleme sırasında
+presence alanlarının ileri geri zıplamasını söndürür
+
+Kayıtlı presence dizisini yeniden oynatmak için:
+    python presence_debouncer.py presence_recording.jsonl [pencere_saniye]
+"""
+
+import json
+import logging
+import sys
+import time
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+
+class StateDebouncer:
+    """Yeni session state'i ancak `window` saniye boyunca sabit kalınca uygular
+
+    Aynı state içindeki değişiklikler (skor, parti, ajan) beklemeden geçer;
+    sadece state geçişleri bekletilir. Bekleme sırasında son onaylanmış
+    durum döndürülür, böylece Discord'a ve zenginleştirmeye ara durumlar gitmez.
+    """
+
+    def __init__(self, window: float = 1.5):
+        self.logger = logging.getLogger(__name__)
+        self.window = max(0.0, float(window))
+        self.committed: Optional[Dict[str, Any]] = None
+        self.candidate_state: Optional[str] = None
+        self.candidate_since = 0.0
+        self.stats = {
+            'inputs': 0,
+            'commits': 0,   # Onaylanan state geçişleri
+            'held': 0,      # Bekletilen (henüz sabitlenmemiş) durumlar
+            'dropped': 0,   # Pencere dolmadan geri dönülen geçişler
+        }
+
+    def reset(self):
+        """Yeni bağlantıda sıfırla"""
+        self.committed = None
+        self.candidate_state = None
+        self.candidate_since = 0.0
+
+    def feed(self, status: Dict[str, Any], now: Optional[float] = None) -> Dict[str, Any]:
+        """Yeni durumu işle, kullanılması gereken (onaylanmış) durumu döndür"""
+        now = time.monotonic() if now is None else now
+        self.stats['inputs'] += 1
+        state = status.get('session_state')
+
+        if self.committed is None or self.window == 0:
+            return self._commit(status)
+
+        if state == self.committed.get('session_state'):
+            if self.candidate_state is not None:
+                # Geçiş pencere dolmadan geri alındı - flapping
+                self.stats['dropped'] += 1
+                self.candidate_state = None
+            # Aynı state - skor vb. değişiklikler anında geçer
+            self.committed = status
+            return status
+
+        if state != self.candidate_state:
+            if self.candidate_state is not None:
+                self.stats['dropped'] += 1
+            self.candidate_state = state
+            self.candidate_since = now
+
+        if now - self.candidate_since >= self.window:
+            self.logger.debug(f"State geçişi onaylandı: {self.committed.get('session_state')} -> {state}")
+            return self._commit(status)
+
+        self.stats['held'] += 1
+        return self.committed
+
+    def pending_for(self, now: Optional[float] = None) -> Optional[float]:
+        """Bekleyen geçiş varsa onaylanmasına kalan süre"""
+        if self.candidate_state is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.window - (now - self.candidate_since))
+
+    def _commit(self, status: Dict[str, Any]) -> Dict[str, Any]:
+        if self.committed is None or status.get('session_state') != self.committed.get('session_state'):
+            self.stats['commits'] += 1
+        self.committed = status
+        self.candidate_state = None
+        return status
+
+
+def replay(sequence: Iterable[Tuple[float, Dict[str, Any]]], window: float = 1.5) -> Dict[str, Any]:
+    """
+    Zaman damgalı durum dizisini debouncer'dan geçir ve karşılaştır
+
+    Args:
+        sequence: (zaman, parse edilmiş durum) çiftleri
+        window: Debounce penceresi (saniye)
+
+    Returns:
+        Ham ve debounce edilmiş state geçiş sayıları ve debouncer istatistikleri
+    """
+    debouncer = StateDebouncer(window)
+    raw_transitions = 0
+    debounced_transitions = 0
+    last_raw = None
+    last_out = None
+
+    for timestamp, status in sequence:
+        state = status.get('session_state')
+        if last_raw is not None and state != last_raw:
+            raw_transitions += 1
+        last_raw = state
+
+        out_state = debouncer.feed(status, now=timestamp).get('session_state')
+        if last_out is not None and out_state != last_out:
+            debounced_transitions += 1
+        last_out = out_state
+
+    return {
+        'raw_transitions': raw_transitions,
+        'debounced_transitions': debounced_transitions,
+        **debouncer.stats,
+    }
+
+
+def load_recording(path: str):
+    """ValorantClientV2'nin kaydettiği JSONL presence dosyasını oku ve parse et"""
+    from valorant_client_v2 import ValorantClientV2
+
+    client = ValorantClientV2()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            parsed = client._parse_presence(entry['presence'])
+            if parsed:
+                yield entry['t'], parsed
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    window = float(sys.argv[2]) if len(sys.argv) > 2 else 1.5
+    result = replay(load_recording(sys.argv[1]), window)
+
+    print(f"📼 {result['inputs']} presence, pencere {window}s")
+    print(f"   Ham state geçişi:       {result['raw_transitions']}")
+    print(f"   Debounce sonrası geçiş: {result['debounced_transitions']}")
+    print(f"   Bekletilen: {result['held']} | Söndürülen flapping: {result['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,492 @@
+"""
+Presence motoru - CLI ve GUI'nin ortak asyncio çekirdeği
+Bağlantı döngüleri, poll, zenginleştirme ve Discord yayını tek yerde
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List
+
+import http_client
+import i18n
+from circuit_breaker import CircuitBreaker
+from config import Config
+from discord_rpc import DiscordRPC
+from valorant_client_v2 import ValorantClientV2
+from presence_builder_v2 import PresenceBuilderV2
+from poll_scheduler import PollScheduler
+from presence_debouncer import StateDebouncer
+from riot_lockfile import LockfileWatcher
+from rate_limit import ExponentialBackoff
+from content_updater import ContentUpdater
+
+# Olay callback'i: callback(event_name, data)
+EngineCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class PresenceEngine:
+    """Valorant durumunu Discord'a taşıyan asyncio motoru
+
+    Bloklayan çağrılar (valclient, pypresence, HTTP) thread executor'larda
+    çalışır; bekleme noktalarının hepsi iptal edilebilir olduğundan stop()
+    anında etkili olur.
+
+    Yayınlanan olaylar:
+        log       - message, level ('INFO', 'SUCCESS', 'WARNING', 'ERROR')
+        status    - text, detail, type ('info', 'active', 'warning', 'error')
+        discord   - connected
+        valorant  - connected
+        player    - name, tag, level, rank_text, card_url, rank_icon
+        presence  - presence, summary
+        service   - name, state ('closed', 'open', 'half_open'), retry_in
+        stopped   - (boş)
+    """
+
+    RETRY_DELAY = 5               # Valorant bağlantı denemeleri arası ilk bekleme
+    VALORANT_BACKOFF_MAX = 60.0   # Riot Client açık, Valorant kapalıyken en seyrek deneme
+    IPC_CHECK_INTERVAL = 2.0      # Discord kapalıyken IPC soketi kontrol aralığı
+    DISCORD_BACKOFF_MAX = 30.0
+
+    def __init__(self, config: Optional[Config] = None, max_errors: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.config = config or Config()
+        self.max_errors = max_errors
+        # Presence metinleri ve içerik adları bu dilde (paket ilk kullanımda okunur)
+        i18n.set_language(getattr(self.config, 'language', None))
+
+        henrik_key = getattr(self.config, 'henrik_api_key', None)
+        self.client = ValorantClientV2(region=self.config.region, henrik_api_key=henrik_key,
+                                       henrik_base_url=getattr(self.config, 'henrik_base_url', None),
+                                       config=self.config)
+        self.rpc = DiscordRPC(self.config.discord_client_id)
+        self.presence_builder = PresenceBuilderV2()
+        self.poll_scheduler = PollScheduler(max_interval=self.config.update_interval)
+        self.debouncer = StateDebouncer(window=self.config.state_debounce)
+        
+        # Valorant'ın açılıp kapanmasını lockfile üzerinden anında fark et
+        self.lockfile_watcher = LockfileWatcher(on_change=self._on_lockfile_change)
+        
+        if self.config.debug_mode:
+            # Ham presence'ları debouncer replay'i için kaydet
+            self.client.record_path = str(Path(self.config.config_file).parent / 'presence_recording.jsonl')
+
+        # Yeni ajan/harita verisi günde en fazla bir kez arka planda
+        self.content_updater = ContentUpdater()
+
+        self.running = False
+        self.error_count = 0
+        self.update_count = 0
+
+        self._listeners: List[EngineCallback] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._lockfile_changed: Optional[asyncio.Event] = None
+        self._discord_lost: Optional[asyncio.Event] = None
+        self._discord_task: Optional[asyncio.Task] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._thread: Optional[threading.Thread] = None
+        self._discord_executor: Optional[ThreadPoolExecutor] = None
+        self._valorant_executor: Optional[ThreadPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    # Dış arayüz
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: EngineCallback):
+        """Motor olaylarını dinle (callback motorun thread'inde çağrılır)"""
+        self._listeners.append(callback)
+
+    def run_forever(self):
+        """Motoru bu thread'de çalıştır, durdurulana kadar döner"""
+        asyncio.run(self.run())
+
+    def start(self) -> threading.Thread:
+        """Motoru arka plan thread'inde başlat
+
+        Önceki çalışma hâlâ kapanıyorsa aynı motor tekrar başlatılamaz -
+        yeniden başlatmada yeni bir motor oluşturulur.
+        """
+        if self._thread and self._thread.is_alive():
+            raise RuntimeError("Motor zaten çalışıyor")
+        self._thread = threading.Thread(target=self.run_forever, name='PresenceEngine', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """Motoru durdur - herhangi bir thread'den çağrılabilir"""
+        loop, task = self._loop, self._task
+        if loop and task and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # Loop bu arada kapandı
+                pass
+
+    # ------------------------------------------------------------------
+    # Ana akış
+    # ------------------------------------------------------------------
+
+    async def run(self):
+        """Bağlan, poll et, yayınla - iptal edilene kadar"""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._wake = asyncio.Event()
+        self._lockfile_changed = asyncio.Event()
+        self._discord_lost = asyncio.Event()
+        self._discord_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='discord')
+        self._valorant_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='valorant')
+
+        self.running = True
+        self.error_count = 0
+        self._flush_handle = None
+        self.poll_scheduler.reset()
+        self.debouncer.reset()
+
+        # Websocket presence olayı gelince poll beklemesini kes
+        self.client.presence_socket.on_presence = self._on_presence_event
+        # Sayaç ve "Güncellendi" sadece Discord'a gerçekten giden presence için
+        self.rpc.on_sent = self._on_presence_sent
+        self.lockfile_watcher.start()
+        self.content_updater.start()
+        # Dış API devre kesicilerinin durumu arayüze
+        http_client.get_http_client().breakers.subscribe(self._on_breaker_change)
+
+        try:
+            # Discord bağlantısı arka planda gözetilir; presence'lar Discord
+            # açılana kadar bekletilip bağlanınca gönderilir
+            self._discord_task = asyncio.ensure_future(self._supervise_discord())
+            await self._connect_valorant()
+            while True:
+                self._emit('log', message="RPC aktif!", level="SUCCESS")
+                self._emit('status', text="⚡ Aktif", detail="Discord'da presence güncelleniyor", type="active")
+                if not await self._poll_loop():
+                    break
+                # Valorant kapandı - tekrar açılmasını bekle
+                await self._connect_valorant()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._shutdown()
+            self.running = False
+            self._emit('stopped')
+
+    async def _supervise_discord(self):
+        """Discord bağlantısını motor boyunca ayakta tut
+        
+        IPC soketi yokken bağlanma denenmez, sadece soketin varlığı kontrol
+        edilir. Soket var ama bağlantı başarısızsa jitter'lı üstel bekleme
+        uygulanır. Bağlantı koparsa (flush sırasında fark edilir) tekrar
+        bağlanılır ve son presence beklemeden yeniden gönderilir.
+        """
+        backoff = ExponentialBackoff(base=1.0, maximum=self.DISCORD_BACKOFF_MAX)
+        waiting_logged = False
+        self._emit('log', message="Discord kontrol ediliyor...", level="INFO")
+
+        while True:
+            if self.rpc.connected:
+                # Presence değişmese de Discord'un kapanması fark edilsin
+                await self._wait_event(self._discord_lost, self.IPC_CHECK_INTERVAL)
+                if not await self._call(self._discord_executor, self.rpc.check_connection):
+                    self._emit('discord', connected=False)
+                    self._emit('log', message="Discord bağlantısı koptu, yeniden bağlanılacak...", level="WARNING")
+                continue
+
+            if not await self._call(self._discord_executor, self.rpc.ipc_available):
+                if not waiting_logged:
+                    self._emit('log', message="Discord açık değil, açılması bekleniyor...", level="WARNING")
+                    self._emit('status', text="⏳ Bekleniyor", detail="Discord açılması bekleniyor...", type="warning")
+                    waiting_logged = True
+                await asyncio.sleep(self.IPC_CHECK_INTERVAL)
+                continue
+
+            # Bağlanınca son presence aynı çağrı içinde tekrar gönderilir
+            if await self._call(self._discord_executor, self.rpc.ensure_connected):
+                backoff.reset()
+                waiting_logged = False
+                self._discord_lost.clear()
+                self._emit('discord', connected=True)
+                self._emit('log', message="Discord bağlantısı başarılı!", level="SUCCESS")
+                if self.rpc.has_pending() and not self._flush_handle:
+                    self._schedule_flush(self.rpc.next_flush_delay())
+                continue
+
+            delay = backoff.next_delay()
+            self._emit('log', message=f"Discord'a bağlanılamadı, {delay:.1f} saniye sonra tekrar denenecek...", level="WARNING")
+            await asyncio.sleep(delay)
+
+    async def _connect_valorant(self) -> bool:
+        """Lockfile oluşunca Valorant'a bağlan
+        
+        Lockfile Riot Client açık olduğu sürece vardır; Valorant kapalıyken
+        denemeler üstel olarak seyrekleşir. Lockfile değişirse (Riot Client
+        yeniden başladı) bekleme kesilir ve baştan başlanır.
+        """
+        self._emit('log', message="Valorant bekleniyor...", level="INFO")
+        backoff = ExponentialBackoff(base=self.RETRY_DELAY, maximum=self.VALORANT_BACKOFF_MAX)
+
+        while True:
+            if not self.lockfile_watcher.present:
+                # Riot Client kapalı - deneme yapma, lockfile oluşmasını bekle
+                await self._wait_event(self._lockfile_changed, None)
+                backoff.reset()
+                continue
+
+            if await self._call(self._valorant_executor, self.client.connect):
+                break
+
+            # Riot Client açık ama Valorant açık veya hazır değil
+            delay = backoff.next_delay()
+            self._emit('log', message=f"Valorant henüz hazır değil, {delay:.0f} saniye sonra tekrar denenecek...", level="WARNING")
+            if await self._wait_event(self._lockfile_changed, delay):
+                backoff.reset()
+
+        self.poll_scheduler.reset()
+        self.debouncer.reset()
+        self._emit('valorant', connected=True)
+        self._emit('log', message="Valorant bağlantısı başarılı!", level="SUCCESS")
+        self._emit_player_info()
+        return True
+
+    async def _poll_loop(self) -> bool:
+        """Durumu al, zenginleştir, presence oluştur, değiştiyse yayınla
+        
+        Returns:
+            Valorant kapandığı için çıkıldıysa True, çok fazla hatadan dolayı False
+        """
+        while True:
+            if not self.lockfile_watcher.present:
+                await self._detach_valorant()
+                return True
+
+            session_state = None
+            round_key = None
+            changed = False
+
+            try:
+                status = await self._call(self._valorant_executor, self.client.get_full_status)
+
+                if status:
+                    # Ara state'ler sabitlenene kadar son onaylanmış durum kullanılır
+                    status = self.debouncer.feed(status)
+                    session_state = status.get('session_state')
+                    round_key = status.get('round_info')
+                    self.enrich_status(status)
+
+                    self.logger.debug(f"Session: {session_state} | Queue: {status.get('queue_id')} | Party: {status.get('party_size')}")
+
+                    presence = self.presence_builder.build_presence(status)
+                    if presence:
+                        changed = self._publish(presence)
+                else:
+                    self.logger.debug("Client'tan durum alınamadı")
+
+                self.error_count = 0
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.error_count += 1
+                if self.max_errors:
+                    self._emit('log', message=f"Hata ({self.error_count}/{self.max_errors}): {e}", level="ERROR")
+                    if self.error_count >= self.max_errors:
+                        self._emit('log', message="Çok fazla hata! Kapatılıyor...", level="ERROR")
+                        return False
+                else:
+                    self._emit('log', message=f"Hata: {e}", level="ERROR")
+
+            interval = self.poll_scheduler.next_interval(session_state, changed, round_key)
+            pending = self.debouncer.pending_for()
+            if pending is not None:
+                # Bekleyen state geçişini pencere dolar dolmaz onayla
+                interval = min(interval, pending + 0.05)
+            await self._wait_for_change(interval)
+
+    def enrich_status(self, status: Dict[str, Any]):
+        """Ham client durumuna görünen isim ve icon URL'lerini ekle"""
+        # Queue bilgileri
+        queue_id = status.get('queue_id', '')
+        status['queue_name'] = self.client.get_queue_display_name(queue_id)
+        status['queue_icon'] = self.client.get_queue_icon_url(queue_id)
+
+        # Map bilgisi
+        map_path = status.get('match_map', '')
+        status['map_name'] = self.client.get_map_display_name(map_path)
+        status['map_icon'] = self.client.get_map_icon_url(map_path)
+
+        # Agent bilgisi - Her durumda ekle (ingame'de agent_name olabilir)
+        agent_id = status.get('agent_id', '')
+        agent_name = status.get('agent_name', '')
+        if agent_id:
+            status['agent_icon'] = self.client.get_agent_icon_url(agent_id)
+        if not agent_name and agent_id:
+            # agent_name yoksa ID'den çevir
+            status['agent_name'] = self.client.get_agent_display_name(agent_id)
+
+    def _publish(self, presence: Dict[str, Any]) -> bool:
+        """Presence değiştiyse Discord'a gönder (beklemeden), değişti mi döndür"""
+        # Tüm alanlar karşılaştırılır; limit doluysa sadece en yenisi bekletilir
+        if not self.rpc.submit(presence):
+            return False
+
+        self._schedule_flush()
+        return True
+
+    def _announce_presence(self, presence: Dict[str, Any]):
+        """Discord'a gönderilen presence'ı say ve arayüze bildir"""
+        self.update_count += 1
+        details_text = presence.get('details', '')
+        party_info = presence.get('party_size', [0, 0])
+        party_text = f" ({party_info[0]}/{party_info[1]})" if party_info[0] > 0 else ""
+        summary = f"{details_text}{party_text}"
+
+        self._emit('presence', presence=presence, summary=summary)
+        self._emit('status', text="✓ Güncellendi", detail=summary, type="active")
+
+    def _schedule_flush(self, delay: float = 0):
+        """Bekleyen presence'ı Discord thread'inde gönder, limit doluysa sonra tekrar dene"""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if delay > 0:
+            self._flush_handle = self._loop.call_later(delay, self._schedule_flush)
+            return
+
+        future = self._loop.run_in_executor(self._discord_executor, self.rpc.flush)
+        future.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, future):
+        """Flush bitti - hâlâ bekleyen varsa token birikince tekrar dene"""
+        if future.cancelled() or self._task is None or self._task.done():
+            return
+        if not self.rpc.connected:
+            # Bağlantı koptu - bekleyen presence yeniden bağlanınca gönderilir
+            self._discord_lost.set()
+            return
+        if self.rpc.has_pending() and not self._flush_handle:
+            # Gönderim hatasında Discord'u sıkıştırmamak için en az 1 saniye bekle
+            self._schedule_flush(max(self.rpc.next_flush_delay(), 1.0))
+
+    # ------------------------------------------------------------------
+    # Yardımcılar
+    # ------------------------------------------------------------------
+
+    async def _call(self, executor: ThreadPoolExecutor, func: Callable, *args):
+        """Bloklayan fonksiyonu executor'da çalıştır (iptal edilebilir bekleme)"""
+        return await self._loop.run_in_executor(executor, functools.partial(func, *args))
+
+    async def _detach_valorant(self):
+        """Valorant kapandı - client'ı kapat ve arayüze bildir"""
+        self._emit('log', message="Valorant kapandı", level="WARNING")
+        self._emit('valorant', connected=False)
+        self._emit('status', text="⏳ Bekleniyor", detail="Valorant açılması bekleniyor...", type="warning")
+        await self._call(self._valorant_executor, self.client.close)
+
+    async def _wait_for_change(self, timeout: float):
+        """Presence olayı gelene veya süre dolana kadar bekle"""
+        await self._wait_event(self._wake, timeout)
+
+    @staticmethod
+    async def _wait_event(event: asyncio.Event, timeout: Optional[float]) -> bool:
+        """Event set edilene veya süre dolana kadar bekle, sonra event'i temizle
+        
+        Returns:
+            Event set edildiyse True, süre dolduysa False
+        """
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            event.clear()
+        return True
+
+    def _on_lockfile_change(self, lockfile: Optional[Dict[str, str]]):
+        """LockfileWatcher thread'inden gelir - bağlantı döngüsünü uyandır"""
+        loop = self._loop
+        if loop and not loop.is_closed() and self._lockfile_changed:
+            try:
+                loop.call_soon_threadsafe(self._lockfile_changed.set)
+                loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass
+
+    def _on_presence_event(self, presence: Dict[str, Any]):
+        """PresenceSocket thread'inden gelir - loop'u uyandır"""
+        loop = self._loop
+        if loop and not loop.is_closed() and self._wake:
+            try:
+                loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass
+
+    def _on_presence_sent(self, presence: Dict[str, Any]):
+        """Discord thread'inden gelir - limit yüzünden birleştirilenler buraya hiç gelmez"""
+        loop = self._loop
+        if loop and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._announce_presence, presence)
+            except RuntimeError:
+                pass
+
+    def _on_breaker_change(self, breaker: CircuitBreaker):
+        """Devre kesici durumu değişti (isteği yapan thread'den gelir)"""
+        loop = self._loop
+        if loop and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(functools.partial(self._emit, 'service', **breaker.snapshot()))
+            except RuntimeError:
+                pass
+
+    def _emit_player_info(self):
+        """Bağlantı sonrası oyuncu kartı bilgisini yayınla"""
+        cache = self.client.cache
+        self._emit(
+            'player',
+            name=cache.get('player_name') or 'Player',
+            tag=cache.get('player_tag') or '0000',
+            level=cache.get('level') or 0,
+            rank_text=cache.get('rank_text') or '',
+            card_url=cache.get('card_small') or '',
+            rank_icon=cache.get('rank_icon') or '',
+        )
+
+    def _emit(self, event: str, **data):
+        """Tüm dinleyicilere olay gönder"""
+        for callback in list(self._listeners):
+            try:
+                callback(event, data)
+            except Exception as e:
+                self.logger.error(f"Olay dinleyici hatası ({event}): {e}")
+
+    def _shutdown(self):
+        """Bağlantıları beklemeden kapat"""
+        self.client.presence_socket.on_presence = None
+        self.rpc.on_sent = None
+        http_client.get_http_client().breakers.unsubscribe(self._on_breaker_change)
+        self.lockfile_watcher.stop()
+        self.content_updater.stop()
+        if self._discord_task:
+            self._discord_task.cancel()
+            self._discord_task = None
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # Kapatma çağrıları kendi executor'larında sıraya girer; motor beklemez
+        for executor, close in ((self._valorant_executor, self.client.close),
+                                (self._discord_executor, self.rpc.close)):
+            if executor:
+                try:
+                    executor.submit(close)
+                except RuntimeError:
+                    close()
+                executor.shutdown(wait=False)
+
+        self._emit('discord', connected=False)
+        self._emit('valorant', connected=False)
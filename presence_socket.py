@@ -0,0 +1,208 @@
+"""
+Riot Client lokal websocket üzerinden olay tabanlı presence
+Presence değiştiğinde anında haber verir, poll gerektirmez
+"""
+
+import base64
+import json
+import logging
+import ssl
+import threading
+import time
+from typing import Optional, Dict, Any, Callable
+
+from riot_lockfile import read_lockfile
+
+try:
+    import websocket
+except ImportError:
+    logging.warning("websocket-client kütüphanesi bulunamadı, presence poll ile alınacak (pip install websocket-client)")
+    websocket = None
+
+# WAMP mesaj tipleri
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+
+PRESENCE_EVENT = 'OnJsonApiEvent_chat_v4_presences'
+
+
+class PresenceSocket:
+    """Riot Client websocket presence dinleyicisi
+
+    Ayrı bir thread'de çalışır. Kendi PUUID'mize ait presence her
+    değiştiğinde `latest` güncellenir, `changed` event'i set edilir ve
+    varsa callback çağrılır. Bağlantı koparsa yeniden bağlanmayı dener;
+    bu sırada `connected` False olur ve client poll'a geri döner.
+    """
+
+    RECONNECT_DELAY = 5
+
+    def __init__(self, puuid: str = '', lockfile_path: Optional[str] = None,
+                 on_presence: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 use_tls: bool = True):
+        self.logger = logging.getLogger(__name__)
+        self.puuid = puuid
+        self.lockfile_path = lockfile_path
+        self.on_presence = on_presence
+        self.use_tls = use_tls
+
+        self.connected = False
+        self.running = False
+        self.latest: Optional[Dict[str, Any]] = None
+        self.latest_raw: Optional[str] = None
+        self.changed = threading.Event()
+        self.event_count = 0
+
+        self._ws = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        """websocket-client yüklü mü?"""
+        return websocket is not None
+
+    def start(self) -> bool:
+        """Dinleyici thread'ini başlat"""
+        if not self.available():
+            return False
+        if self.running:
+            return True
+
+        self.running = True
+        if self._thread and self._thread.is_alive():
+            # Önceki thread henüz çıkmadı (yeniden bağlanma beklemesinde), onu kullanmaya devam et
+            return True
+        self._thread = threading.Thread(target=self._run, name='PresenceSocket', daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Dinleyiciyi durdur"""
+        self.running = False
+        self.connected = False
+        ws = self._ws
+        if ws:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        self.changed.set()
+
+    def get_presence(self) -> Optional[Dict[str, Any]]:
+        """Son alınan presence (bağlantı yoksa None)"""
+        with self._lock:
+            if not self.connected:
+                return None
+            return self.latest
+
+    def seed(self, presence: Dict[str, Any]):
+        """Bağlantı sonrası ilk olay gelene kadar poll ile alınan presence'ı kullan"""
+        with self._lock:
+            if self.connected and self.latest is None:
+                self.latest = presence
+
+    def wait(self, timeout: float) -> bool:
+        """Presence değişene veya süre dolana kadar bekle"""
+        changed = self.changed.wait(timeout)
+        self.changed.clear()
+        return changed
+
+    def _connect(self):
+        """Lockfile'dan port/şifre al ve websocket'e bağlan"""
+        lockfile = read_lockfile(self.lockfile_path)
+        if not lockfile:
+            raise ConnectionError("Lockfile bulunamadı")
+
+        token = base64.b64encode(f"riot:{lockfile['password']}".encode()).decode()
+        scheme = 'wss' if self.use_tls else 'ws'
+        ws = websocket.create_connection(
+            f"{scheme}://127.0.0.1:{lockfile['port']}",
+            header=[f"Authorization: Basic {token}"],
+            sslopt={'cert_reqs': ssl.CERT_NONE, 'check_hostname': False},
+            timeout=10,
+        )
+        # Okuma blocking olsun - stop() soketi kapatarak çıkartır
+        ws.settimeout(None)
+        ws.send(json.dumps([WAMP_SUBSCRIBE, PRESENCE_EVENT]))
+        return ws
+
+    def _run(self):
+        """Bağlan, mesajları oku, koparsa yeniden dene"""
+        while self.running:
+            try:
+                self._ws = self._connect()
+                with self._lock:
+                    # Kopukluk sırasındaki değişiklikler kaçmış olabilir - client seed edene kadar poll
+                    self.latest = None
+                    self.latest_raw = None
+                    self.connected = True
+                self.logger.info("⚡ Riot websocket bağlandı - presence olay tabanlı alınıyor")
+
+                while self.running:
+                    message = self._ws.recv()
+                    if not message:
+                        continue
+                    self._handle_message(message)
+
+            except Exception as e:
+                if self.running:
+                    self.logger.debug(f"Riot websocket bağlantısı yok/koptu: {e}")
+            finally:
+                was_connected = self.connected
+                self.connected = False
+                if self._ws:
+                    try:
+                        self._ws.close()
+                    except Exception:
+                        pass
+                    self._ws = None
+                if was_connected and self.running:
+                    self.logger.warning("⚠️ Riot websocket koptu, poll'a geri dönülüyor")
+                    # Bekleyenleri uyandır ki poll'a geçsinler
+                    self.changed.set()
+
+            if self.running:
+                time.sleep(self.RECONNECT_DELAY)
+
+    def _handle_message(self, message: str):
+        """WAMP event mesajını işle"""
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            return
+
+        if not isinstance(payload, list) or len(payload) < 3:
+            return
+        if payload[0] != WAMP_EVENT or payload[1] != PRESENCE_EVENT:
+            return
+
+        data = payload[2].get('data', {}) if isinstance(payload[2], dict) else {}
+        for presence in data.get('presences', []):
+            if presence.get('puuid') != self.puuid:
+                continue
+            if presence.get('product') not in (None, 'valorant'):
+                continue
+
+            raw = presence.get('private')
+            if not raw or raw == self.latest_raw:
+                # Aynı presence - değişiklik yok
+                continue
+
+            try:
+                decoded = json.loads(base64.b64decode(raw))
+            except Exception as e:
+                self.logger.debug(f"Presence çözülemedi: {e}")
+                continue
+
+            with self._lock:
+                self.latest = decoded
+                self.latest_raw = raw
+                self.event_count += 1
+
+            self.changed.set()
+            if self.on_presence:
+                try:
+                    self.on_presence(decoded)
+                except Exception as e:
+                    self.logger.error(f"Presence callback hatası: {e}")
@@ -0,0 +1,294 @@
+"""
+Rank servisi - MMR sonucunu (önce lokal client, yoksa Henrik; rank yok ve hata dahil) kendi
+süreleriyle cache'ler; poll döngüsü her turda API'ye gitmez
+"""
+
+import logging
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
+
+import requests
+
+import http_cache
+import henrik_scheduler
+import tiers
+from rate_limit import ExponentialBackoff
+
+# (url, headers) döndüren sağlayıcı - oyuncu bilinmiyorsa None
+MmrRequest = Callable[[], Optional[Tuple[str, Dict[str, str]]]]
+
+# Lokal client'tan Henrik v2 mmr `data` biçiminde MMR - alınamazsa None (Henrik'e düşülür)
+LocalMmr = Callable[[], Optional[Dict[str, Any]]]
+
+EMPTY_RANK = {'tier': 0, 'rr': 0, 'rank_text': '', 'rank_icon': None}
+
+
+def mmr_fingerprint(data: Dict[str, Any]) -> Optional[tuple]:
+    """MMR verisinin maçtan maça değişen alanları - yeni maç işlendi mi anlamak için"""
+    current_data = data.get('current_data') or {}
+    if not current_data:
+        return None
+    return (current_data.get('currenttier'), current_data.get('ranking_in_tier'), current_data.get('elo'),
+            current_data.get('mmr_change_to_last_game'), current_data.get('games_needed_for_rating'))
+
+
+def parse_mmr(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Henrik v2 mmr `data` alanından rank bilgisi"""
+    current_data = data.get('current_data') or {}
+    tier = current_data.get('currenttier') or 0
+    rr = current_data.get('ranking_in_tier') or 0
+
+    # Sadece ranked ise göster (Demir 1'den başla)
+    info = tiers.tier(tier)
+    if not info.ranked:
+        return dict(EMPTY_RANK)
+
+    return {
+        'tier': tier,
+        'rr': rr,
+        'rank_text': f"{info.name} - {rr} RR",
+        'rank_icon': info.icon_url,
+    }
+
+
+class RankService:
+    """Rank bilgisini sonucun türüne göre farklı sürelerle tutar
+
+    - Ranked sonuç `REFRESH_INTERVAL` boyunca geçerlidir
+    - "Rank yok" (derecesiz / key yok / oyuncu ayarlanmamış) `UNRANKED_TTL`
+    - Hata (timeout, 429, 5xx) `ERROR_TTL`'den başlayıp katlanarak artar
+    - Hata yüzünden disk cache'ten gelen bayat sonuç gösterilir ama hata
+      gibi kısa sürede tekrar denenir
+
+    get() hiçbir zaman ağı beklemez; süresi dolmuşsa yenileme arka planda
+    tek thread ile yapılır. Aynı anda tek yenileme çalışır; refresh() başka
+    bir yenileme sürüyorsa onun bitmesini bekler.
+
+    Henrik rekabetçi maç sonucunu gecikmeli işler; refresh_after_match()
+    MMR verisi değişene kadar katlanarak seyrekleşen aralıklarla yeniler ve
+    değişince (veya MATCH_REFRESH_ATTEMPTS dolunca) durur.
+    """
+
+    REFRESH_INTERVAL = 10 * 60
+    UNRANKED_TTL = 30 * 60
+    ERROR_TTL = 60
+    ERROR_TTL_MAX = 15 * 60
+    MATCH_REFRESH_DELAY = 30          # İlk deneme 15-30 sn sonra, sonra katlanarak
+    MATCH_REFRESH_DELAY_MAX = 5 * 60
+    MATCH_REFRESH_ATTEMPTS = 8
+
+    def __init__(self, request: MmrRequest, local: Optional[LocalMmr] = None):
+        self.logger = logging.getLogger(__name__)
+        self.request = request
+        self.local = local
+        self.rank: Dict[str, Any] = dict(EMPTY_RANK)
+        self.kind: Optional[str] = None      # 'ranked', 'unranked', 'stale', 'error'
+        self.expires_at = 0.0
+        self.fingerprint: Optional[tuple] = None
+        self.stats = {
+            'hits': 0,           # Geçerli ranked sonuç
+            'negative_hits': 0,  # Geçerli "rank yok" / hata sonucu - istek atılmadı
+            'misses': 0,         # Süre doldu, yenileme başlatıldı
+            'fetches': 0,
+            'local_fetches': 0,  # Lokal client'tan alınan sonuçlar - Henrik'e gidilmedi
+            'errors': 0,
+            'match_refreshes': 0,   # Maç sonrası yapılan yenileme denemeleri
+        }
+
+        self._errors = 0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._idle = threading.Condition(self._lock)
+        # Maç sonrası yenileme - yeni maç veya reset() eskisini iptal eder
+        self._match_cond = threading.Condition(self._lock)
+        self._match_generation = 0
+
+    def get(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Mevcut rank - süresi dolduysa arka planda yenilemeyi başlat"""
+        now = time.time() if now is None else now
+        with self._lock:
+            rank = dict(self.rank)
+            if self.kind is not None and now < self.expires_at:
+                self.stats['hits' if self.kind == 'ranked' else 'negative_hits'] += 1
+                return rank
+            self.stats['misses'] += 1
+
+        self._refresh_async()
+        return rank
+
+    def refresh_after_match(self):
+        """Rekabetçi maç bitti - MMR verisi değişene kadar arka planda yenile"""
+        with self._lock:
+            self._match_generation += 1
+            generation = self._match_generation
+            baseline = self.fingerprint
+            self._match_cond.notify_all()
+
+        threading.Thread(target=self._refresh_until_changed, args=(generation, baseline),
+                         name='RankMatchRefresh', daemon=True).start()
+
+    def reset(self):
+        """Hesap değişti/yeniden bağlanıldı - her şeyi unut"""
+        with self._lock:
+            self.rank = dict(EMPTY_RANK)
+            self.kind = None
+            self.expires_at = 0.0
+            self.fingerprint = None
+            self._errors = 0
+            self._match_generation += 1
+            self._match_cond.notify_all()
+
+    def refresh(self, force: bool = False) -> Dict[str, Any]:
+        """Rank'ı şimdi çek (bloklar) - `force` ile disk cache'teki taze kayıt da atlanır"""
+        with self._lock:
+            self._idle.wait_for(lambda: not self._refreshing)
+            self._refreshing = True
+        try:
+            return self._refresh(force)
+        finally:
+            self._refresh_done()
+
+    def _refresh(self, force: bool = False) -> Dict[str, Any]:
+        # Önce oyunun kendi MMR uç noktası - maç sonucu orada hemen görünür
+        data = self._local_mmr()
+        if data is not None:
+            with self._lock:
+                self.stats['local_fetches'] += 1
+            self._apply_data(data)
+            return self.rank
+
+        target = self.request()
+        if not target:
+            # Riot ID ayarlanmamış - rank gösterilemez
+            self._set('unranked', dict(EMPTY_RANK), self.UNRANKED_TTL)
+            return self.rank
+
+        url, headers = target
+        with self._lock:
+            self.stats['fetches'] += 1
+        try:
+            # Maç sonrası disk cache'teki taze kayıt da atlanır
+            ttl = (0, 0) if force else None
+            response = http_cache.get_http_cache().get(
+                url, headers=headers, ttl=ttl, on_refresh=self._apply_response,
+                fetch=henrik_scheduler.fetcher(henrik_scheduler.PRIORITY_RANK))
+        except requests.RequestException as e:
+            self.logger.debug(f"Rank alınamadı: {e}")
+            self._set_error()
+            return self.rank
+
+        self._apply_response(response)
+        return self.rank
+
+    def _refresh_until_changed(self, generation: int, baseline: Optional[tuple]):
+        """Henrik yeni maçı işleyene kadar dene - değişince veya deneme hakkı bitince dur"""
+        backoff = ExponentialBackoff(base=self.MATCH_REFRESH_DELAY, maximum=self.MATCH_REFRESH_DELAY_MAX)
+        for attempt in range(1, self.MATCH_REFRESH_ATTEMPTS + 1):
+            delay = backoff.next_delay()
+            with self._lock:
+                if self._match_cond.wait_for(lambda: self._match_generation != generation, timeout=delay):
+                    return  # Yeni maç bitti veya hesap değişti
+                self.stats['match_refreshes'] += 1
+
+            try:
+                # Arka plan yenilemesi sürüyorsa bitmesi beklenir - aynı anda tek MMR isteği
+                self.refresh(force=True)
+            except Exception as e:
+                self.logger.debug(f"Maç sonrası rank yenilemesi başarısız: {e}")
+
+            with self._lock:
+                changed = self.fingerprint is not None and self.fingerprint != baseline
+            if changed:
+                self.logger.info(f"✅ Maç sonrası rank güncellendi ({attempt}. deneme): {self.rank['rank_text']}")
+                return
+
+        self.logger.debug("Maç sonrası rank değişmedi, yenileme bırakıldı")
+
+    def _apply_response(self, response: requests.Response):
+        """MMR cevabını işle ve türüne göre süre ver"""
+        if response.status_code == 200:
+            try:
+                data = response.json().get('data') or {}
+            except ValueError:
+                self._set_error()
+                return
+            self._apply_data(data, stale=getattr(response, 'stale', False))
+        elif response.status_code in (401, 403, 404):
+            # Key yok / oyuncu bulunamadı - tekrar denemek aynı sonucu verir
+            self.logger.debug(f"Rank yok: HTTP {response.status_code}")
+            self._set('unranked', dict(EMPTY_RANK), self.UNRANKED_TTL)
+        else:
+            self.logger.debug(f"Rank alınamadı: HTTP {response.status_code}")
+            self._set_error()
+
+    def _apply_data(self, data: Dict[str, Any], stale: bool = False):
+        """MMR verisini (Henrik veya lokal) işle"""
+        rank = parse_mmr(data)
+        if stale:
+            # Henrik 429/5xx verdi veya ulaşılamadı - son bilinen rank, kota açılınca yenilenir
+            self.logger.debug(f"Rank bayat cache'ten: {rank['rank_text'] or 'rank yok'}")
+            self._set_stale(rank, mmr_fingerprint(data))
+        elif rank['rank_text']:
+            self._set('ranked', rank, self.REFRESH_INTERVAL, mmr_fingerprint(data))
+            self.logger.info(f"✅ Rank çekildi: {rank['rank_text']} | Icon: {rank['rank_icon']}")
+        else:
+            self._set('unranked', rank, self.UNRANKED_TTL, mmr_fingerprint(data))
+
+    def _local_mmr(self) -> Optional[Dict[str, Any]]:
+        if self.local is None:
+            return None
+        try:
+            return self.local()
+        except Exception as e:
+            self.logger.debug(f"Lokal MMR alınamadı: {e}")
+            return None
+
+    def _set(self, kind: str, rank: Dict[str, Any], ttl: float, fingerprint: Optional[tuple] = None):
+        with self._lock:
+            self.kind = kind
+            self.rank = rank
+            self.fingerprint = fingerprint
+            self.expires_at = time.time() + ttl
+            self._errors = 0
+
+    def _set_stale(self, rank: Dict[str, Any], fingerprint: Optional[tuple]):
+        """Bayat sonuç - gösterilir, süresi hata gibi kısa ve katlanarak artar"""
+        with self._lock:
+            self.kind = 'stale'
+            self.rank = rank
+            self.fingerprint = fingerprint
+        self._set_error()
+
+    def _set_error(self):
+        """Hata - son bilinen rank korunur, tekrar deneme katlanarak seyrekleşir"""
+        with self._lock:
+            self.stats['errors'] += 1
+            ttl = min(self.ERROR_TTL_MAX, self.ERROR_TTL * (2 ** self._errors))
+            self._errors += 1
+            if self.kind is None:
+                self.kind = 'error'
+            self.expires_at = time.time() + ttl
+
+    def _refresh_async(self):
+        """Yenilemeyi arka planda başlat (aynı anda tek yenileme)"""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def worker():
+            try:
+                self._refresh()
+            except Exception as e:
+                self.logger.debug(f"Rank yenilemesi başarısız: {e}")
+                self._set_error()
+            finally:
+                self._refresh_done()
+
+        threading.Thread(target=worker, name='RankRefresh', daemon=True).start()
+
+    def _refresh_done(self):
+        with self._lock:
+            self._refreshing = False
+            self._idle.notify_all()
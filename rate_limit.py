@@ -0,0 +1,78 @@
+"""
+Hız sınırlama yardımcıları
+"""
+
+import random
+import threading
+import time
+from typing import Optional, Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    `capacity` token ile başlar, her `period` saniyede `capacity` token
+    (sürekli olarak) yenilenir.
+    """
+
+    def __init__(self, capacity: float, period: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(capacity)
+        self.period = float(period)
+        self.rate = self.capacity / self.period  # token/saniye
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: Optional[float] = None):
+        now = self.clock() if now is None else now
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def consume(self, amount: float = 1) -> bool:
+        """Yeterli token varsa harca ve True döndür"""
+        with self._lock:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return True
+            return False
+
+    def set_tokens(self, tokens: float):
+        """Token sayısını dışarıdan düzelt (ör. sunucunun bildirdiği kalan kota)"""
+        with self._lock:
+            self._refill()
+            self.tokens = max(0.0, min(self.capacity, float(tokens)))
+
+    def time_until(self, amount: float = 1) -> float:
+        """`amount` token birikene kadar kalan süre (saniye)"""
+        with self._lock:
+            self._refill()
+            missing = amount - self.tokens
+            return max(0.0, missing / self.rate)
+
+
+class ExponentialBackoff:
+    """Jitter'lı üstel bekleme süresi hesaplayıcı
+
+    Her başarısız denemede süre `factor` katına çıkar (en fazla `maximum`).
+    Aynı anda yeniden deneyen istemciler çakışmasın diye sürenin yarısı
+    rastgeledir ("equal jitter").
+    """
+
+    def __init__(self, base: float = 1.0, maximum: float = 60.0, factor: float = 2.0):
+        self.base = base
+        self.maximum = maximum
+        self.factor = factor
+        self.attempts = 0
+
+    def next_delay(self) -> float:
+        """Bir sonraki denemeden önce beklenecek süre"""
+        delay = min(self.maximum, self.base * (self.factor ** self.attempts))
+        self.attempts += 1
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def reset(self):
+        """Başarılı denemeden sonra baştan başla"""
+        self.attempts = 0
@@ -0,0 +1,186 @@
+"""
+Riot Client lockfile yardımcıları
+Lokal API'nin portu ve şifresi bu dosyada tutulur
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Callable
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    logging.debug("watchdog kütüphanesi bulunamadı, lockfile stat ile izlenecek (pip install watchdog)")
+    Observer = None
+    FileSystemEventHandler = object
+
+logger = logging.getLogger(__name__)
+
+LOCKFILE_KEYS = ['name', 'pid', 'port', 'password', 'protocol']
+
+
+def get_lockfile_path() -> str:
+    """Riot Client lockfile yolunu al (LocalAppData)"""
+    appdata = os.getenv('LOCALAPPDATA')
+    if appdata:
+        return str(Path(appdata) / 'Riot Games' / 'Riot Client' / 'Config' / 'lockfile')
+
+    # Fallback: Mevcut dizin (test ve geliştirme için)
+    return 'lockfile'
+
+
+def read_lockfile(path: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """
+    Lockfile'ı oku ve parçala
+
+    Format: name:pid:port:password:protocol
+
+    Returns:
+        Lockfile alanları veya dosya yoksa/bozuksa None
+    """
+    path = path or get_lockfile_path()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            parts = f.read().strip().split(':')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    if len(parts) != len(LOCKFILE_KEYS):
+        logger.debug(f"Lockfile formatı beklenmedik: {len(parts)} alan")
+        return None
+
+    return dict(zip(LOCKFILE_KEYS, parts))
+
+
+class _LockfileEventHandler(FileSystemEventHandler):
+    """watchdog olaylarını sadece lockfile için watcher'a ilet"""
+
+    def __init__(self, watcher: 'LockfileWatcher'):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        paths = {getattr(event, 'src_path', ''), getattr(event, 'dest_path', '')}
+        if any(os.path.basename(p) == os.path.basename(self.watcher.path) for p in paths if p):
+            self.watcher.check()
+
+
+class LockfileWatcher:
+    """Riot Client lockfile'ını izler, oluşunca attach, silinince detach bildirir
+
+    watchdog yüklüyse ve klasör varsa işletim sistemi dosya bildirimlerini
+    kullanır; yoksa (veya ek güvenlik olarak) lockfile'ı os.stat ile poll eder.
+    Stat çağrısı çok ucuzdur, Client oluşturup activate() denemekten farklı
+    olarak oyun kapalıyken hiçbir ağ isteği yapılmaz.
+
+    Callback: on_change(lockfile) - attach'te lockfile dict'i, detach'te None
+    """
+
+    POLL_INTERVAL = 1.0          # watchdog yokken
+    SAFETY_POLL_INTERVAL = 10.0  # watchdog varken kaçan olaylar için
+
+    def __init__(self, path: Optional[str] = None,
+                 on_change: Optional[Callable[[Optional[Dict[str, str]]], None]] = None):
+        self.path = path or get_lockfile_path()
+        self.on_change = on_change
+        self.lockfile: Optional[Dict[str, str]] = None
+        self.running = False
+
+        self._signature = None
+        self._observer = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def present(self) -> bool:
+        """Lockfile şu an mevcut ve geçerli mi?"""
+        return self.lockfile is not None
+
+    def start(self):
+        """İzlemeyi başlat (ilk kontrol hemen yapılır)"""
+        if self.running:
+            return
+        self.running = True
+        self._stop.clear()
+        self.check()
+
+        interval = self.POLL_INTERVAL
+        if self._start_observer():
+            interval = self.SAFETY_POLL_INTERVAL
+
+        self._thread = threading.Thread(target=self._poll_loop, args=(interval,),
+                                        name='LockfileWatcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """İzlemeyi durdur"""
+        self.running = False
+        self._stop.set()
+        if self._observer:
+            try:
+                self._observer.stop()
+            except Exception:
+                pass
+            self._observer = None
+
+    def check(self):
+        """Lockfile'ı stat ile kontrol et, değiştiyse oku ve bildir"""
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+                signature = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                signature = None
+
+            if signature == self._signature:
+                return
+            self._signature = signature
+
+            lockfile = read_lockfile(self.path) if signature else None
+            if signature and lockfile is None:
+                # Dosya var ama yarım yazılmış (yeniden yazılırken boşaltıldı) -
+                # detach sayılmaz, yazma bitince gelen olayda tekrar okunur
+                return
+            if lockfile == self.lockfile:
+                return
+            self.lockfile = lockfile
+
+        if lockfile:
+            logger.info(f"🔓 Riot Client lockfile bulundu (port {lockfile['port']})")
+        else:
+            logger.info("🔒 Riot Client lockfile kaldırıldı")
+
+        if self.on_change:
+            try:
+                self.on_change(lockfile)
+            except Exception as e:
+                logger.error(f"Lockfile callback hatası: {e}")
+
+    def _start_observer(self) -> bool:
+        """watchdog observer'ını lockfile klasörü için başlat"""
+        if Observer is None:
+            return False
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(directory):
+            # Riot Client hiç kurulmamış/çalışmamış - stat poll'a devam
+            return False
+
+        try:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.schedule(_LockfileEventHandler(self), directory, recursive=False)
+            self._observer.start()
+            return True
+        except Exception as e:
+            logger.debug(f"Dosya bildirimi başlatılamadı, stat poll kullanılacak: {e}")
+            self._observer = None
+            return False
+
+    def _poll_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            self.check()
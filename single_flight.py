@@ -0,0 +1,61 @@
+"""
+Single-flight - aynı anahtar için aynı anda yapılan çağrıları birleştirir
+İlk çağıran işi yapar, diğerleri bitmesini bekleyip aynı sonucu alır
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """Uçuştaki tek çağrı"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Exception = None
+
+
+class SingleFlight:
+    """Anahtar başına tek uçuştaki çağrı
+
+    Sonuç saklanmaz: çağrı bittikten sonra gelen istek yeniden çalıştırır.
+    Sadece eşzamanlı (reconnect anında GUI + RPC thread'i gibi) çağrılar
+    birleştirilir.
+    """
+
+    def __init__(self):
+        self.stats = {
+            'calls': 0,         # Gerçekten çalıştırılan
+            'deduplicated': 0,  # Başka bir çağrının sonucunu bekleyen
+        }
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """`func`'ı çalıştır ya da aynı anahtarla uçuştaki çağrının sonucunu bekle"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats['calls'] += 1
+            else:
+                self.stats['deduplicated'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
@@ -0,0 +1,156 @@
+"""
+CircuitBreaker testleri - sahte saat ve mock Henrik sunucusu ile
+"""
+
+import time
+
+import pytest
+import requests
+
+from circuit_breaker import (CircuitBreaker, BreakerRegistry, CircuitOpenError, CLOSED, OPEN, HALF_OPEN)
+from http_client import HttpClient
+from mock_henrik_server import MockHenrikServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def fail(breaker, count):
+    for _ in range(count):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_opens_after_threshold_and_fails_fast():
+    clock = FakeClock()
+    breaker = CircuitBreaker('henrik-mmr', failure_threshold=3, reset_timeout=10, clock=clock)
+    changes = []
+    breaker.subscribe(lambda b: changes.append(b.state))
+
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+    fail(breaker, 1)
+    assert breaker.state == OPEN
+    assert changes == [OPEN]
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    assert breaker.stats['rejected'] == 1
+    assert not breaker.available()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker('x', failure_threshold=3, clock=FakeClock())
+    fail(breaker, 2)
+    breaker.before_request()
+    breaker.record_success()
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_single_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker('x', failure_threshold=1, reset_timeout=10, clock=clock)
+    fail(breaker, 1)
+
+    clock.now = 10
+    assert breaker.available()
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # Deneme sürüyor
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_request()
+
+
+def test_failed_probe_doubles_wait():
+    clock = FakeClock()
+    breaker = CircuitBreaker('x', failure_threshold=1, reset_timeout=10, max_reset_timeout=25, clock=clock)
+    fail(breaker, 1)
+
+    clock.now = 10
+    fail(breaker, 1)
+    assert breaker.state == OPEN
+    assert breaker.retry_at == 30
+
+    clock.now = 30
+    fail(breaker, 1)
+    assert breaker.retry_at == 55  # En fazla max_reset_timeout
+
+
+def test_registry_maps_urls_to_endpoints():
+    registry = BreakerRegistry()
+    base = 'http://127.0.0.1:8000/valorant'
+    assert registry.for_url(f'{base}/v1/account/a/b').name == 'henrik-account'
+    assert registry.for_url(f'{base}/v2/by-puuid/mmr/eu/x').name == 'henrik-mmr'
+    assert registry.for_url(f'{base}/v2/match/abc').name == 'henrik-match'
+    assert registry.for_url('https://media.valorant-api.com/agents/x.png').name == 'valorant-api'
+    assert registry.for_url('https://api.github.com/repos/a/b/releases/latest').name == 'github-releases'
+    assert registry.for_url('https://example.com/') is None
+
+
+def test_outage_latency_stays_flat():
+    client = HttpClient(breakers=BreakerRegistry(failure_threshold=2, reset_timeout=60))
+    with MockHenrikServer() as server:
+        url = f"{server.base_url}/v2/match/abc"
+        server.hang_next(1.0, count=100)
+
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                client.get(url, timeout=(1, 0.1))
+        requests_sent = len(server.requests)
+
+        # Devre açık - sunucuya gitmeden hemen hata
+        start = time.monotonic()
+        for _ in range(20):
+            with pytest.raises(CircuitOpenError):
+                client.get(url, timeout=(1, 0.1))
+        assert time.monotonic() - start < 0.1
+        assert len(server.requests) == requests_sent
+
+        # Diğer uç noktalar etkilenmez
+        server.clear_faults()
+        assert client.get(f"{server.base_url}/v1/account/a/b").status_code == 200
+    client.close()
+
+
+def test_only_request_errors_count_as_failures(monkeypatch):
+    client = HttpClient(breakers=BreakerRegistry(failure_threshold=1, reset_timeout=60))
+    url = 'http://127.0.0.1:9/valorant/v1/account/a/b'
+    breaker = client.breakers.for_url(url)
+
+    def interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(client.session, 'get', interrupted)
+    for _ in range(3):
+        with pytest.raises(KeyboardInterrupt):
+            client.get(url)
+    assert breaker.state == CLOSED and breaker.failures == 0
+
+    def refused(*args, **kwargs):
+        raise requests.ConnectionError('refused')
+
+    monkeypatch.setattr(client.session, 'get', refused)
+    with pytest.raises(requests.ConnectionError):
+        client.get(url)
+    assert breaker.state == OPEN
+    client.close()
+
+
+def test_non_request_error_frees_half_open_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker('x', failure_threshold=1, reset_timeout=10, clock=clock)
+    fail(breaker, 1)
+    clock.now = 10
+    breaker.before_request()
+    breaker.release()
+    assert breaker.state == HALF_OPEN
+    breaker.before_request()  # Yeni deneme isteği geçebilir
@@ -0,0 +1,86 @@
+"""
+ContentCatalog testleri - paketle gelen katalog ve geçici dosyalar ile
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from content_catalog import ContentCatalog, CatalogError, KeyMatcher, write_catalog
+from valorant_client_v2 import ValorantClientV2
+
+JETT = 'add6443a-41bd-e414-f6ad-e58d267f4e95'
+LOOKUPS = json.loads((Path(__file__).parent / 'fixtures' / 'content' / 'lookups.json').read_text(encoding='utf-8'))
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    return ContentCatalog.load()
+
+
+def test_agent_indexes(catalog):
+    assert catalog.agent(JETT).name == 'Jett'
+    assert catalog.agent(JETT.upper()).name == 'Jett'
+    assert catalog.agent('Wushu').name == 'Jett'
+    assert catalog.agent('kay/o').name == catalog.agent('KAYO').name == 'KAY/O'
+    assert catalog.agent('unknown') is None
+
+
+def test_map_and_queue_lookups(catalog):
+    assert catalog.map('/Game/Maps/Duality/Duality').name == 'Bind'
+    assert catalog.map('/Game/Maps/HURM/HURM_Helix/HURM_Helix').name == 'Drift'
+    assert catalog.map('icebox').codename == 'Port'
+    assert catalog.queue('competitive').name == 'Rekabetçi'
+    assert catalog.queue_icon(catalog.queue('hurm')).endswith('e086db66-47fd-e791-ca81-06a645ac7661/displayicon.png')
+    assert catalog.queue_icon(catalog.queue('custom')) is None
+    assert catalog.tier(24).name == 'Ölümsüz 1'
+    assert catalog.tier(99) is None
+
+
+@pytest.mark.parametrize('kind', ['maps', 'queues'])
+def test_recorded_lookups_resolve(catalog, kind):
+    resolve = catalog.map if kind == 'maps' else catalog.queue
+    for value, expected in LOOKUPS[kind]:
+        found = resolve(value)
+        assert (found.name if found else None) == expected, value
+
+
+def test_matcher_prefers_longest_whole_word():
+    matcher = KeyMatcher({'hurm': 'mode', 'hurm_helix': 'map', 'port': 'icebox'})
+    assert matcher.match('/Game/Maps/HURM/HURM_Helix/HURM_Helix') == 'map'
+    assert matcher.match('/Game/Maps/HURM/Other') == 'mode'
+    assert matcher.match('/Game/Maps/Portal/Portal') is None
+    assert KeyMatcher({}).match('anything') is None
+
+
+def test_resolution_is_memoized(catalog):
+    catalog.map('/Game/Maps/Bonsai/Bonsai')
+    before = catalog._resolve_map.cache_info().hits
+    assert catalog.map('/Game/Maps/Bonsai/Bonsai').name == 'Split'
+    assert catalog._resolve_map.cache_info().hits == before + 1
+
+
+def test_client_uses_catalog():
+    client = ValorantClientV2()
+    assert client.get_agent_display_name(JETT) == 'Jett'
+    assert client.get_map_display_name('/Game/Maps/Port/Port') == 'Icebox'
+    assert client.get_map_display_name('/Game/Maps/Yeni/Yeni') == 'Bilinmeyen Harita'
+    assert client.get_queue_display_name('') == 'Menü'
+    assert client.get_queue_display_name('bilinmeyen') == 'Özel Oyun'
+    # Katalogda olmayan yeni ajan UUID'si için CDN adresi
+    assert client.get_agent_icon_url('0' * 36).endswith(f"{'0' * 36}/displayicon.png")
+
+
+def test_round_trip_and_schema_check(catalog, tmp_path):
+    path = tmp_path / 'catalog.json'
+    write_catalog(catalog.to_dict(), str(path))
+    assert ContentCatalog.load(str(path)).to_dict() == catalog.to_dict()
+
+    data = json.loads(path.read_text(encoding='utf-8'))
+    data['schema'] = 99
+    path.write_text(json.dumps(data), encoding='utf-8')
+    with pytest.raises(CatalogError):
+        ContentCatalog.load(str(path))
+    with pytest.raises(CatalogError):
+        ContentCatalog.load(str(tmp_path / 'missing.json'))
@@ -0,0 +1,116 @@
+"""
+ContentUpdater testleri - ETag destekli sahte valorant-api sunucusu ile, ağ gerektirmez
+"""
+
+import hashlib
+import json
+from urllib.parse import urlparse
+
+import pytest
+
+import content_catalog
+import http_client
+from content_catalog import CatalogError, ContentCatalog, load_newest
+from content_updater import QUEUES, ContentUpdater, build_queues
+from http_client import HttpClient
+
+NEW_AGENT = '00000000-1111-2222-3333-444444444444'
+
+
+def api_payloads(catalog: ContentCatalog):
+    """Katalogdan valorant-api cevap biçimi"""
+    return {
+        'version': {'riotClientVersion': 'release-01', 'version': '01'},
+        'agents': [{'uuid': a.uuid, 'developerName': a.codename, 'displayName': a.name, 'displayIcon': a.icon}
+                   for a in catalog.agents],
+        'maps': [{'uuid': m.uuid, 'displayName': m.name, 'mapUrl': m.path, 'splash': m.icon} for m in catalog.maps],
+        'gamemodes': [{'uuid': m.uuid, 'displayName': m.name, 'displayIcon': m.icon,
+                       'assetPath': f'ShooterGame/Content/GameModes/{m.codename}/{m.codename}GameMode'}
+                      for m in catalog.modes],
+        'competitivetiers': [{'tiers': [{'tier': t.tier, 'divisionName': t.division, 'tierName': t.name,
+                                         'largeIcon': t.icon} for t in catalog.tiers if t]}],
+    }
+
+
+def respond(handler):
+    name = urlparse(handler.path).path.rsplit('/', 1)[-1]
+    handler.server.requests.append(name)
+    body = json.dumps({'status': 200, 'data': handler.server.payloads[name]}).encode()
+    etag = '"' + hashlib.md5(body).hexdigest() + '"'
+    if handler.headers.get('If-None-Match') == etag:
+        return handler.reply(304, headers={'ETag': etag})
+    handler.reply(200, body, {'ETag': etag})
+
+
+@pytest.fixture
+def server(http_server):
+    server = http_server(respond, requests=[], payloads=api_payloads(ContentCatalog.load()))
+    server.url += '/v1'
+    return server
+
+
+@pytest.fixture
+def updater(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(content_catalog, '_catalog', ContentCatalog.load())
+    monkeypatch.setattr(http_client, '_client', HttpClient())
+    return ContentUpdater(path=str(tmp_path / 'content_catalog.json'), api_url=server.url)
+
+
+def test_downloads_only_changed_collections(server, updater):
+    assert updater.check()                      # İlk kontrol - ETag yok, hepsi iner
+    assert updater.stats['downloaded'] == 4
+
+    server.requests.clear()
+    server.payloads['version'] = {'riotClientVersion': 'release-02'}
+    server.payloads['agents'] = server.payloads['agents'] + [
+        {'uuid': NEW_AGENT, 'developerName': 'Yeni', 'displayName': 'Yeni Ajan', 'displayIcon': ''}]
+
+    assert updater.check()
+    assert updater.stats['downloaded'] == 5     # Sadece agents tekrar indi
+    assert updater.stats['not_modified'] == 3
+    catalog = content_catalog.get_catalog()
+    assert catalog.version == 'release-02'
+    assert catalog.agent(NEW_AGENT).name == 'Yeni Ajan'
+    # Bir sonraki açılışta indirilen katalog kullanılır
+    assert load_newest(updater.path).agent(NEW_AGENT) is not None
+
+
+def test_same_version_costs_one_request(server, updater):
+    updater.check()
+    server.requests.clear()
+
+    assert not updater.check()
+    assert server.requests == ['version']
+    assert not updater.due()
+    assert updater.due(now=updater._load_state()['checked'] + updater.CHECK_INTERVAL)
+
+
+def test_invalid_payload_keeps_current_catalog(server, updater):
+    before = content_catalog.get_catalog()
+    server.payloads['agents'] = []
+
+    with pytest.raises(CatalogError):
+        updater.check()
+    assert content_catalog.get_catalog() is before
+    # Bozuk indirme diske yazılmadı - paketle gelen katalog kullanılır
+    assert load_newest(updater.path).to_dict() == ContentCatalog.load().to_dict()
+
+
+@pytest.mark.parametrize('language, competitive', [
+    ('tr-TR', 'Rekabetçi'),
+    ('en-US', 'Competitive'),
+    ('xx-XX', 'Rekabetçi'),     # Paketi olmayan dil - varsayılan dil
+])
+def test_queue_names_come_from_locale_pack(server, updater, language, competitive):
+    updater.language = language
+    queues = {queue_id: name for queue_id, _, name in updater.build()['queues']}
+    assert [queue_id for queue_id, _ in QUEUES] == list(queues)
+    assert queues['competitive'] == competitive
+
+
+def test_queue_without_name_falls_back_to_id():
+    modes = [['96bd3920-4f36-d026-2b28-c683eb0bcac5', 'Bomb', 'Standart', '']]
+    queues = build_queues(modes, {'competitive': 'Rekabetçi'})
+    assert queues[0] == ['competitive', '96bd3920-4f36-d026-2b28-c683eb0bcac5', 'Rekabetçi']
+    assert queues[1] == ['competitiveteam', '96bd3920-4f36-d026-2b28-c683eb0bcac5', 'competitiveteam']
+    assert dict((q[0], q[1]) for q in queues)['custom'] == ''
@@ -0,0 +1,128 @@
+"""
+DiscordRPC yayın testleri - tam payload karşılaştırma, birleştirme ve
+20 saniyede 5 güncelleme limiti; sahte saat ile, Discord gerektirmez
+"""
+
+import pytest
+
+from discord_rpc import DiscordRPC
+from rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakePresence:
+    """pypresence.Presence yerine - gönderilen güncellemeleri kaydeder"""
+
+    def __init__(self):
+        self.updates = []
+
+    def update(self, **data):
+        self.updates.append(data)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def rpc(clock):
+    rpc = DiscordRPC('123', clock=clock)
+    rpc.rpc = FakePresence()
+    rpc.connected = True
+    rpc.sent = []
+    rpc.on_sent = rpc.sent.append
+    return rpc
+
+
+def presence(details, **extra):
+    return {'details': details, 'large_image': 'map', 'party_size': (1, 5), 'start': 100, **extra}
+
+
+def test_identical_payload_is_suppressed(rpc):
+    assert rpc.submit(presence('Rekabetçi'))
+    assert rpc.flush()
+
+    # Tuple/list ve None alanları fark yaratmaz
+    assert not rpc.submit({**presence('Rekabetçi'), 'party_size': [1, 5], 'small_image': None})
+    assert not rpc.flush()
+    assert rpc.stats == {'sent': 1, 'coalesced': 0, 'suppressed': 1}
+    assert rpc.sent == [DiscordRPC.clean_presence(presence('Rekabetçi'))]
+
+
+def test_any_field_change_is_sent(rpc):
+    rpc.submit(presence('Rekabetçi'))
+    rpc.flush()
+
+    # Sadece details değil - tüm alanlar karşılaştırılır
+    assert rpc.submit(presence('Rekabetçi', small_text='Elmas 1 - 40 RR'))
+    assert rpc.flush()
+    assert rpc.rpc.updates[-1]['small_text'] == 'Elmas 1 - 40 RR'
+    assert DiscordRPC.diff(rpc.rpc.updates[0], rpc.rpc.updates[1]) == {'small_text': (None, 'Elmas 1 - 40 RR')}
+
+
+def test_rate_limit_five_per_twenty_seconds(rpc, clock):
+    for n in range(5):
+        rpc.submit(presence(f'Maç {n}'))
+        assert rpc.flush()
+
+    rpc.submit(presence('Maç 5'))
+    assert not rpc.flush()
+    assert rpc.has_pending()
+    assert rpc.next_flush_delay() == pytest.approx(4.0)   # 20 / 5 saniyede bir token
+
+    clock.now = 3.9
+    assert not rpc.flush()
+    clock.now = 4.0
+    assert rpc.flush()
+    assert len(rpc.rpc.updates) == 6
+
+
+def test_only_latest_payload_is_sent_when_limited(rpc, clock):
+    for n in range(5):
+        rpc.submit(presence(f'Maç {n}'))
+        rpc.flush()
+
+    for n in range(5, 9):
+        rpc.submit(presence(f'Maç {n}'))
+        rpc.flush()
+    assert rpc.stats['coalesced'] == 3
+
+    clock.now = 4.0
+    assert rpc.flush()
+    assert [p['details'] for p in rpc.sent] == [f'Maç {n}' for n in (0, 1, 2, 3, 4, 8)]
+    # Birleştirilenler hiç gönderilmedi ve bildirilmedi
+    assert len(rpc.rpc.updates) == len(rpc.sent) == 6
+
+
+def test_reverted_pending_change_is_dropped(rpc):
+    for n in range(5):
+        rpc.submit(presence(f'Maç {n}'))
+        rpc.flush()
+
+    rpc.submit(presence('Geçici'))
+    assert rpc.has_pending()
+    # Discord zaten son durumda - bekleyen güncellemeye gerek kalmadı
+    assert rpc.submit(presence('Maç 4'))
+    assert not rpc.has_pending()
+
+
+def test_token_bucket_refills_continuously(clock):
+    bucket = TokenBucket(5, 20, clock=clock)
+    assert all(bucket.consume() for _ in range(5))
+    assert not bucket.consume()
+
+    clock.now = 10
+    assert bucket.time_until() == 0
+    assert bucket.consume() and bucket.consume()
+    assert not bucket.consume()
+
+    clock.now = 1000
+    assert sum(bucket.consume() for _ in range(10)) == 5   # Kapasiteden fazla birikmez
@@ -0,0 +1,87 @@
+"""
+DiscordRPC bağlantı testleri - lokal mock IPC soketi ile, Discord gerektirmez
+"""
+
+import sys
+
+import pytest
+
+if sys.platform == 'win32':
+    pytest.skip("Mock IPC sunucusu unix soketi kullanır", allow_module_level=True)
+
+from discord_rpc import DiscordRPC
+from mock_discord_ipc import MockDiscordIPC
+
+PRESENCE = {'details': 'Rekabetçi - Ascent', 'state': 'Solo'}
+
+
+@pytest.fixture
+def ipc_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    return str(tmp_path)
+
+
+@pytest.fixture
+def discord(ipc_dir):
+    server = MockDiscordIPC(ipc_dir)
+    server.start()
+    yield server
+    server.kill()
+
+
+def test_no_connect_attempt_while_discord_closed(ipc_dir):
+    rpc = DiscordRPC('123')
+
+    assert not rpc.ipc_available()
+    assert not rpc.ensure_connected()
+    assert rpc.rpc is None
+
+
+def test_presence_is_sent(discord):
+    rpc = DiscordRPC('123')
+    assert rpc.ensure_connected()
+    assert discord.handshakes == 1
+
+    assert rpc.submit(PRESENCE)
+    assert rpc.flush()
+    assert discord.wait_for_activity(1)
+    assert discord.activity['details'] == PRESENCE['details']
+    rpc.close()
+
+
+def test_broken_pipe_detected_and_presence_replayed(discord):
+    rpc = DiscordRPC('123')
+    assert rpc.ensure_connected()
+    rpc.submit(PRESENCE)
+    assert rpc.flush()
+
+    discord.kill()
+    rpc.submit({**PRESENCE, 'state': 'Parti (2/5)'})
+    assert not rpc.flush()
+    assert not rpc.connected
+    # Gönderilemeyen en yeni presence kaybolmaz
+    assert rpc.has_pending()
+    assert not rpc.ensure_connected()
+
+    discord.start()
+    assert rpc.ensure_connected()
+    assert discord.wait_for_activity(2)
+    assert discord.activity['state'] == 'Parti (2/5)'
+    assert not rpc.has_pending()
+    rpc.close()
+
+
+def test_restart_without_new_presence_replays_last(discord):
+    rpc = DiscordRPC('123')
+    assert rpc.ensure_connected()
+    rpc.submit(PRESENCE)
+    assert rpc.flush()
+
+    discord.kill()
+    assert not rpc.check_connection()
+
+    discord.start()
+    assert rpc.ensure_connected()
+    assert discord.wait_for_activity(2)
+    assert discord.activity['details'] == PRESENCE['details']
+    rpc.close()
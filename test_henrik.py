@@ -1,35 +1,55 @@
+"""
+Henrik hesap + raw coregame denemesi
+
+Varsayılan olarak lokal mock sunucuya gider; canlı API için:
+    HENRIK_BASE_URL=https://api.henrikdev.xyz/valorant HENRIK_API_KEY=HDEV-... python test_henrik.py
+"""
+
+import os
+
 import requests
 
-# PUUID al
-r = requests.get(
-    'https://api.henrikdev.xyz/valorant/v1/account/yefeblgn/zurna',
-    headers={'Authorization': 'HDEV-730de03e-3e58-4e57-ad55-6ae3ead0edfa'},
-    timeout=5
-)
-print(f"Account API Status: {r.status_code}")
-data = r.json()
-puuid = data.get('data', {}).get('puuid')
-print(f"PUUID: {puuid}")
-
-if puuid:
-    # Şimdi coregame raw API'yi test et
-    print("\n--- Testing RAW API ---")
-    r2 = requests.get(
-        'https://api.henrikdev.xyz/valorant/v1/raw',
-        params={'type': 'coregame', 'value': puuid, 'region': 'eu'},
-        headers={'Authorization': 'HDEV-730de03e-3e58-4e57-ad55-6ae3ead0edfa'},
-        timeout=5
-    )
-    print(f"Raw API Status: {r2.status_code}")
-    print(f"Response: {r2.text[:500]}")
-    
-    if r2.status_code == 200:
-        raw_data = r2.json()
-        coregame = raw_data.get('data', {})
-        teams = coregame.get('Teams', [])
-        print(f"\nTeams found: {len(teams)}")
-        if teams:
-            for i, team in enumerate(teams):
-                print(f"Team {i}: {list(team.keys())}")
-                if 'RoundsWon' in team:
-                    print(f"  RoundsWon: {team['RoundsWon']}")
+from mock_henrik_server import MockHenrikServer
+
+
+def main(base_url: str, api_key: str):
+    headers = {'Authorization': api_key} if api_key else {}
+
+    # PUUID al
+    r = requests.get(f'{base_url}/v1/account/yefeblgn/zurna', headers=headers, timeout=5)
+    print(f"Account API Status: {r.status_code}")
+    data = r.json()
+    puuid = data.get('data', {}).get('puuid')
+    print(f"PUUID: {puuid}")
+
+    if puuid:
+        # Şimdi coregame raw API'yi test et
+        print("\n--- Testing RAW API ---")
+        r2 = requests.get(
+            f'{base_url}/v1/raw',
+            params={'type': 'coregame', 'value': puuid, 'region': 'eu'},
+            headers=headers,
+            timeout=5
+        )
+        print(f"Raw API Status: {r2.status_code}")
+        print(f"Response: {r2.text[:500]}")
+        
+        if r2.status_code == 200:
+            raw_data = r2.json()
+            coregame = raw_data.get('data', {})
+            teams = coregame.get('Teams', [])
+            print(f"\nTeams found: {len(teams)}")
+            if teams:
+                for i, team in enumerate(teams):
+                    print(f"Team {i}: {list(team.keys())}")
+                    if 'RoundsWon' in team:
+                        print(f"  RoundsWon: {team['RoundsWon']}")
+
+
+if __name__ == '__main__':
+    base_url = os.getenv('HENRIK_BASE_URL')
+    if base_url:
+        main(base_url.rstrip('/'), os.getenv('HENRIK_API_KEY', ''))
+    else:
+        with MockHenrikServer() as server:
+            main(server.base_url, '')
@@ -1,38 +1,59 @@
+"""
+Henrik v2 match denemesi - takım skorları
+
+Varsayılan olarak lokal mock sunucuya gider; canlı API için:
+    HENRIK_BASE_URL=https://api.henrikdev.xyz/valorant HENRIK_API_KEY=HDEV-... python test_henrik_match.py
+"""
+
+import os
+
 import requests
 
+from mock_henrik_server import MockHenrikServer
+
 match_id = "deb17ed7-c8f0-457f-81f0-0f64e9911e87"
-api_key = "HDEV-730de03e-3e58-4e57-ad55-6ae3ead0edfa"
-
-print(f"Testing Match ID: {match_id}")
-
-r = requests.get(
-    f'https://api.henrikdev.xyz/valorant/v2/match/{match_id}',
-    headers={'Authorization': api_key},
-    timeout=5
-)
-
-print(f'Status: {r.status_code}')
-
-if r.status_code == 200:
-    data = r.json()
-    print(f'Response keys: {list(data.keys())}')
-    
-    match_data = data.get('data', {})
-    print(f'Match data keys: {list(match_data.keys())}')
-    
-    teams = match_data.get('teams', {})
-    print(f'Teams keys: {list(teams.keys())}')
-    
-    blue = teams.get('blue', {})
-    red = teams.get('red', {})
-    
-    print(f'\nBlue team rounds_won: {blue.get("rounds_won")}')
-    print(f'Red team rounds_won: {red.get("rounds_won")}')
-    
-    # Rounds objesi varsa
-    if 'rounds' in blue:
-        print(f'Blue rounds: {blue["rounds"]}')
-    if 'rounds' in red:
-        print(f'Red rounds: {red["rounds"]}')
-else:
-    print(f'Error: {r.text}')
+
+
+def main(base_url: str, api_key: str):
+    print(f"Testing Match ID: {match_id}")
+
+    r = requests.get(
+        f'{base_url}/v2/match/{match_id}',
+        headers={'Authorization': api_key} if api_key else {},
+        timeout=5
+    )
+
+    print(f'Status: {r.status_code}')
+
+    if r.status_code == 200:
+        data = r.json()
+        print(f'Response keys: {list(data.keys())}')
+        
+        match_data = data.get('data', {})
+        print(f'Match data keys: {list(match_data.keys())}')
+        
+        teams = match_data.get('teams', {})
+        print(f'Teams keys: {list(teams.keys())}')
+        
+        blue = teams.get('blue', {})
+        red = teams.get('red', {})
+        
+        print(f'\nBlue team rounds_won: {blue.get("rounds_won")}')
+        print(f'Red team rounds_won: {red.get("rounds_won")}')
+        
+        # Rounds objesi varsa
+        if 'rounds' in blue:
+            print(f'Blue rounds: {blue["rounds"]}')
+        if 'rounds' in red:
+            print(f'Red rounds: {red["rounds"]}')
+    else:
+        print(f'Error: {r.text}')
+
+
+if __name__ == '__main__':
+    base_url = os.getenv('HENRIK_BASE_URL')
+    if base_url:
+        main(base_url.rstrip('/'), os.getenv('HENRIK_API_KEY', ''))
+    else:
+        with MockHenrikServer() as server:
+            main(server.base_url, '')
@@ -0,0 +1,76 @@
+"""
+HenrikScheduler testleri - mock Henrik sunucusu ile, ağ gerektirmez
+"""
+
+import pytest
+
+from henrik_scheduler import (HenrikScheduler, HenrikRateLimited, PRIORITY_LIVE, PRIORITY_RANK,
+                              PRIORITY_PROFILE, PRIORITY_HISTORY)
+from mock_henrik_server import MockHenrikServer
+
+HEADERS = {'Authorization': 'test-key'}
+
+
+@pytest.fixture
+def server():
+    with MockHenrikServer() as server:
+        server.url = f"{server.base_url}/v1/account/Player/EUW"
+        yield server
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / 'henrik_quota.json')
+
+
+def test_headers_correct_the_local_quota(server, state_path):
+    scheduler = HenrikScheduler(state_path)
+    server.headers = {'x-ratelimit-limit': '90', 'x-ratelimit-remaining': '12', 'x-ratelimit-reset': '40'}
+    scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE)
+
+    scope = scheduler.scope_for(HEADERS)
+    assert scheduler.buckets[scope].capacity == 90
+    assert 12 <= scheduler.remaining(scope) < 13
+
+
+def test_low_priority_is_dropped_before_quota_runs_out(server, state_path):
+    scheduler = HenrikScheduler(state_path)
+    # 30'luk kotadan 6 token kaldı: geçmiş (%50) ve profil (%25) rezervin altında
+    server.headers = {'x-ratelimit-limit': '30', 'x-ratelimit-remaining': '6'}
+    scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE)
+
+    with pytest.raises(HenrikRateLimited):
+        scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_HISTORY)
+    with pytest.raises(HenrikRateLimited):
+        scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_PROFILE)
+
+    assert scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_RANK).status_code == 200
+    assert scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE).status_code == 200
+    assert scheduler.stats['dropped'] == 2
+    assert len(server.requests) == 3
+
+
+def test_429_blocks_until_reset_and_survives_restart(server, state_path):
+    scheduler = HenrikScheduler(state_path)
+    server.fail_next(429, retry_after=120)
+    scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE)
+    assert scheduler.stats['rate_limited'] == 1
+
+    with pytest.raises(HenrikRateLimited):
+        scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE, max_wait=0)
+
+    scheduler.save()
+    restarted = HenrikScheduler(state_path)
+    with pytest.raises(HenrikRateLimited):
+        restarted.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE, max_wait=0)
+    assert len(server.requests) == 1
+
+
+def test_keys_have_separate_quotas(server, state_path):
+    scheduler = HenrikScheduler(state_path)
+    server.headers = {'x-ratelimit-remaining': '0'}
+    scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE)
+
+    with pytest.raises(HenrikRateLimited):
+        scheduler.get(server.url, headers=HEADERS, priority=PRIORITY_LIVE, max_wait=0)
+    assert scheduler.get(server.url, headers={'Authorization': 'other-key'}, priority=PRIORITY_LIVE).status_code == 200
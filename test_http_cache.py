@@ -0,0 +1,118 @@
+"""
+HttpCache testleri - lokal HTTP sunucu ile, ağ gerektirmez
+"""
+
+import threading
+import time
+
+import pytest
+
+from http_cache import HttpCache
+
+
+def respond(handler):
+    server = handler.server
+    server.requests.append(dict(handler.headers))
+    if server.status != 200:
+        return handler.reply(server.status)
+    etag = f'"v{server.version}"'
+    if handler.headers.get('If-None-Match') == etag:
+        return handler.reply(304, headers={'ETag': etag})
+
+    body = f'{{"version": {server.version}, "path": "{handler.path}"}}'.encode() + b' ' * server.padding
+    handler.reply(200, body, {'Content-Type': 'application/json', 'ETag': etag})
+
+
+@pytest.fixture
+def server(http_server):
+    return http_server(respond, requests=[], version=1, padding=0, status=200)
+
+
+def test_fresh_entry_skips_network_and_survives_restart(server, tmp_path):
+    url = server.url + '/account'
+    cache = HttpCache(str(tmp_path))
+    assert cache.get(url, ttl=(60, 0)).json()['version'] == 1
+    hit = cache.get(url, ttl=(60, 0))
+    assert hit.json()['version'] == 1 and not hit.stale
+    assert len(server.requests) == 1
+
+    # Yeni süreç - disk'ten okunur
+    assert HttpCache(str(tmp_path)).get(url, ttl=(60, 0)).json()['version'] == 1
+    assert len(server.requests) == 1
+
+
+def test_auth_scope_separates_entries(server, tmp_path):
+    url = server.url + '/mmr'
+    cache = HttpCache(str(tmp_path))
+    cache.get(url, headers={'Authorization': 'key-a'}, ttl=(60, 0))
+    cache.get(url, headers={'Authorization': 'key-b'}, ttl=(60, 0))
+    cache.get(url, headers={'Authorization': 'key-a'}, ttl=(60, 0))
+
+    assert len(server.requests) == 2
+    assert b'key-a' not in b''.join(p.read_bytes() for p in tmp_path.iterdir())
+
+
+def test_expired_entry_is_revalidated_with_etag(server, tmp_path):
+    url = server.url + '/account'
+    cache = HttpCache(str(tmp_path))
+    cache.get(url, ttl=(0, 0))
+
+    assert cache.get(url, ttl=(0, 0)).json()['version'] == 1
+    assert server.requests[-1].get('If-None-Match') == '"v1"'
+    assert cache.stats['revalidated'] == 1
+
+
+def test_stale_while_revalidate(server, tmp_path):
+    url = server.url + '/card'
+    cache = HttpCache(str(tmp_path))
+    cache.get(url, ttl=(0, 60))
+
+    server.version = 2
+    refreshed = threading.Event()
+    response = cache.get(url, ttl=(0, 60), on_refresh=lambda r: refreshed.set())
+
+    # Bayat cevap beklemeden döner, yenisi arka planda gelir
+    assert response.json()['version'] == 1 and response.stale
+    assert refreshed.wait(5)
+    assert cache.get(url, ttl=(60, 0)).json()['version'] == 2
+
+
+def test_stale_entry_used_when_server_is_down(server, tmp_path):
+    url = server.url + '/account'
+    cache = HttpCache(str(tmp_path))
+    cache.get(url, ttl=(0, 0))
+    server.shutdown()
+    server.server_close()
+
+    assert cache.get(url, ttl=(0, 0)).json()['version'] == 1
+
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_error_reply_serves_entry_marked_stale(server, tmp_path, status):
+    url = server.url + '/mmr'
+    cache = HttpCache(str(tmp_path))
+    assert not getattr(cache.get(url, ttl=(0, 0)), 'stale', False)
+
+    server.status = status
+    response = cache.get(url, ttl=(0, 0))
+    assert response.status_code == 200 and response.json()['version'] == 1
+    assert response.stale
+
+
+def test_lru_eviction_respects_size_bound(server, tmp_path):
+    server.padding = 1000
+    cache = HttpCache(str(tmp_path), max_bytes=2500)
+    cache.get(server.url + '/a', ttl=(60, 0))
+    time.sleep(0.01)
+    cache.get(server.url + '/b', ttl=(60, 0))
+    time.sleep(0.01)
+    cache.get(server.url + '/a', ttl=(60, 0))  # a en son kullanılan
+    time.sleep(0.01)
+    cache.get(server.url + '/c', ttl=(60, 0))
+
+    assert cache.stats['evictions'] == 1
+    requests_before = len(server.requests)
+    cache.get(server.url + '/a', ttl=(60, 0))
+    assert len(server.requests) == requests_before
+    cache.get(server.url + '/b', ttl=(60, 0))
+    assert len(server.requests) == requests_before + 1
@@ -0,0 +1,72 @@
+"""
+HttpClient testleri - lokal HTTP sunucu ile, ağ gerektirmez
+"""
+
+import threading
+import time
+
+import pytest
+
+from http_client import HttpClient, DEFAULT_TIMEOUT
+
+
+def respond(handler):
+    status = 200
+    if handler.path == '/slow':
+        time.sleep(0.2)
+    if handler.path == '/flaky' and handler.server.hits < 3:
+        status = 503
+    handler.reply(status, b'{"status": 200}')
+
+
+@pytest.fixture
+def server(http_server):
+    return http_server(respond)
+
+
+def test_connection_is_reused(server):
+    client = HttpClient()
+    for _ in range(10):
+        assert client.get(server.url + '/account').status_code == 200
+
+    assert server.hits == 10
+    assert server.connections == 1
+    client.close()
+
+
+def test_concurrent_requests_are_deduplicated(server):
+    client = HttpClient()
+    barrier = threading.Barrier(5)
+    responses = []
+
+    def worker():
+        barrier.wait()
+        responses.append(client.get(server.url + '/slow'))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert server.hits == 1
+    assert client.flights.stats['deduplicated'] == 4
+    client.close()
+
+
+def test_transient_5xx_is_retried(server):
+    client = HttpClient()
+    client.session.adapters['http://'].max_retries.backoff_factor = 0
+
+    assert client.get(server.url + '/flaky').status_code == 200
+    assert server.hits == 3
+    client.close()
+
+
+def test_timeout_is_chosen_per_host():
+    client = HttpClient(host_timeouts={'example.invalid': (1, 2)})
+
+    assert client.timeout_for('https://example.invalid/x') == (1, 2)
+    assert client.timeout_for('https://api.henrikdev.xyz/valorant/v1/account/a/b') == (3.05, 5)
+    assert client.timeout_for('https://unknown.host/') == DEFAULT_TIMEOUT
@@ -0,0 +1,78 @@
+"""
+Dil paketi testleri - paketlenmiş tr/en dosyaları ile
+"""
+
+import pytest
+
+import content_catalog
+import i18n
+from content_catalog import ContentCatalog
+from i18n import LocalePack
+from presence_builder_v2 import PresenceBuilderV2
+
+
+@pytest.fixture
+def language(monkeypatch):
+    """Aktif dili test içinde değiştir; katalog ve paket her testte sıfırdan"""
+    loaded = []
+    load = LocalePack.load.__func__
+
+    def record(cls, lang):
+        loaded.append(lang)
+        return load(cls, lang)
+
+    monkeypatch.setattr(LocalePack, 'load', classmethod(record))
+    monkeypatch.setattr(i18n, '_language', i18n.DEFAULT_LANGUAGE)
+    monkeypatch.setattr(i18n, '_locale', None)
+    monkeypatch.setattr(content_catalog, '_catalog', ContentCatalog.load())
+
+    def use(lang):
+        i18n.set_language(lang)
+        return loaded
+    return use
+
+
+def test_only_active_locale_is_read(language):
+    loaded = language('en')
+    assert loaded == []                         # set_language dosya açmaz
+    content_catalog.get_catalog()
+    i18n.t('menu')
+    assert loaded == ['en']
+
+
+def test_catalog_names_follow_locale(language):
+    language('en')
+    catalog = content_catalog.get_catalog()
+    assert catalog.language == 'en'
+    assert catalog.queue('competitive').name == 'Competitive'
+    assert catalog.tier(24).name == 'Immortal 1'
+    assert catalog.map('/Game/Maps/Poveglia/Range').name == 'The Range'
+    assert catalog.map('/Game/Maps/Duality/Duality').name == 'Bind'
+    assert content_catalog.get_catalog() is catalog   # Bir kez çevrilir
+    # Dosyaya yazılan asıl katalog dilden bağımsız kalır
+    assert catalog.base.queue('competitive').name == 'Rekabetçi'
+
+    presence = PresenceBuilderV2().build_presence({'session_state': 'menus', 'level': 42})
+    assert presence['details'] == 'In Menus'
+    assert presence['large_text'] == 'Level 42'
+
+    language('tr')
+    assert content_catalog.get_catalog().queue('competitive').name == 'Rekabetçi'
+    assert i18n.t('level', level=42) == 'Seviye 42'
+
+
+def test_unknown_language_falls_back(language):
+    loaded = language('xx')
+    assert i18n.get_locale().language == i18n.DEFAULT_LANGUAGE
+    assert loaded == ['xx', i18n.DEFAULT_LANGUAGE]
+
+
+@pytest.mark.parametrize('lang', i18n.available_languages())
+def test_packs_cover_catalog(lang):
+    pack = LocalePack.load(lang)
+    default = LocalePack.load(i18n.DEFAULT_LANGUAGE)
+    catalog = ContentCatalog.load()
+    assert pack.language == lang
+    assert set(pack.ui) == set(default.ui)
+    assert set(pack.queues) == {q.id for q in catalog.queues}
+    assert len(pack.tiers) == len(catalog.tiers)
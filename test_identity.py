@@ -0,0 +1,80 @@
+"""
+Kimlik katmanı testleri - mock Henrik sunucusu ile, ağ gerektirmez
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import henrik_scheduler
+import http_cache
+import http_client
+import identity
+from http_client import HttpClient
+from identity import IdentityCache, PlayerIdentity
+from mock_henrik_server import MockHenrikServer
+from valorant_client_v2 import ValorantClientV2
+
+PUUID = '5f1a3b2c-8d4e-4f6a-9b0c-1d2e3f4a5b6c'
+
+
+@pytest.fixture
+def henrik(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, '_cache', http_cache.HttpCache(str(tmp_path / 'cache')))
+    monkeypatch.setattr(identity, '_cache', IdentityCache(str(tmp_path / 'identities.json')))
+    monkeypatch.setattr(henrik_scheduler, '_scheduler',
+                        henrik_scheduler.HenrikScheduler(str(tmp_path / 'henrik_quota.json')))
+    monkeypatch.setattr(http_client, '_client', HttpClient())
+    with MockHenrikServer() as server:
+        yield server
+
+
+def test_paths_prefer_puuid():
+    by_puuid = PlayerIdentity(PUUID, 'Player', 'EUW', 'eu')
+    assert by_puuid.account_path() == f'v1/by-puuid/account/{PUUID}'
+    assert by_puuid.mmr_path() == f'v2/by-puuid/mmr/eu/{PUUID}'
+    assert by_puuid.stored_matches_path() == f'v1/by-puuid/stored-matches/eu/{PUUID}'
+
+    by_name = PlayerIdentity(name='Oyuncu Adı', tag='TR1', region='eu')
+    assert by_name.mmr_path() == 'v2/mmr/eu/Oyuncu%20Ad%C4%B1/TR1'
+    assert not PlayerIdentity().known
+
+
+def test_cache_persists_and_follows_renames(tmp_path):
+    path = str(tmp_path / 'identities.json')
+    cache = IdentityCache(path)
+    cache.remember(PUUID, 'Player', 'EUW')
+    cache.remember(PUUID, 'Renamed', 'EUW')
+
+    reloaded = IdentityCache(path)
+    assert reloaded.puuid_for('renamed', 'euw') == PUUID
+    assert reloaded.puuid_for('Player', 'EUW') is None
+    # Config'teki isim biliniyorsa by-puuid kullanılır
+    assert reloaded.resolve(None, 'Renamed', 'EUW').puuid == PUUID
+    assert reloaded.resolve('other-puuid', 'Renamed', 'EUW').puuid == 'other-puuid'
+
+
+def test_attached_client_queries_by_puuid(henrik):
+    # Config'teki isim eski/yanlış olsa bile PUUID doğru hesabı bulur
+    config = SimpleNamespace(riot_name='Old', riot_tag='NAME')
+    client = ValorantClientV2(henrik_base_url=henrik.base_url, config=config)
+    client.client = SimpleNamespace(puuid=PUUID)
+
+    client._cache_player_info()
+    url, _ = client._mmr_request()
+
+    assert henrik.requests[0] == ('account', f'/valorant/v1/by-puuid/account/{PUUID}')
+    assert client.cache['player_name'] == 'Player'
+    assert client.cache['level'] == 187
+    assert url == f'{henrik.base_url}/v2/by-puuid/mmr/eu/{PUUID}'
+    assert identity.get_identity_cache().puuid_for('Player', 'EUW') == PUUID
+
+
+def test_detached_client_falls_back_to_riot_id(henrik):
+    config = SimpleNamespace(riot_name='Player', riot_tag='EUW')
+    client = ValorantClientV2(henrik_base_url=henrik.base_url, config=config)
+
+    assert client._mmr_request()[0] == f'{henrik.base_url}/v2/mmr/eu/Player/EUW'
+    client._cache_player_info()
+    # Hesap cevabından PUUID öğrenildi - sonraki istekler by-puuid
+    assert client._mmr_request()[0] == f'{henrik.base_url}/v2/by-puuid/mmr/eu/{PUUID}'
@@ -0,0 +1,87 @@
+"""
+FieldExtractor testleri - kayıtlı Henrik cevapları ve mock sunucu ile
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import henrik_scheduler
+import http_cache
+import http_client
+import identity
+import json_extract
+from http_client import HttpClient
+from json_extract import FieldExtractor
+from mock_henrik_server import FIXTURES_DIR, MockHenrikServer
+from valorant_api import MATCH_HISTORY_FIELDS
+from valorant_client_v2 import LIVE_MATCH_FIELDS, ValorantClientV2
+
+PUUID = '5f1a3b2c-8d4e-4f6a-9b0c-1d2e3f4a5b6c'
+
+
+@pytest.fixture
+def henrik(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, '_cache', http_cache.HttpCache(str(tmp_path / 'cache')))
+    monkeypatch.setattr(identity, '_cache', identity.IdentityCache(str(tmp_path / 'identities.json')))
+    monkeypatch.setattr(henrik_scheduler, '_scheduler',
+                        henrik_scheduler.HenrikScheduler(str(tmp_path / 'henrik_quota.json')))
+    # Devre kesici durumu testler arasında taşınmasın
+    monkeypatch.setattr(http_client, '_client', HttpClient())
+    with MockHenrikServer() as server:
+        yield server
+
+
+@pytest.mark.parametrize('extractor, fixture', [
+    (LIVE_MATCH_FIELDS, 'match.json'),
+    (MATCH_HISTORY_FIELDS, 'matches.json'),
+])
+def test_streaming_matches_full_parse(extractor, fixture):
+    body = (FIXTURES_DIR / fixture).read_bytes()
+    assert extractor.extract(body) == extractor.select(json.loads(body))
+
+
+def test_keeps_only_selected_paths():
+    body = json.dumps({
+        'data': {
+            'teams': {'red': {'rounds_won': 9, 'roster': [1, 2]}, 'blue': {'rounds_won': 13}},
+            'players': [{'puuid': 'a', 'team': 'Red', 'stats': {'kills': 3}}, {'puuid': 'b'}],
+            'metadata': {'map': 'Ascent', 'mode': 'Competitive'},
+            'rounds': [{'winning_team': 'Red'}] * 50,
+        },
+    })
+    extractor = FieldExtractor(['data.teams.*.rounds_won', 'data.players.*.team', 'data.players.*.puuid',
+                                'data.metadata'])
+
+    assert extractor.extract(body) == {
+        'data': {
+            'teams': {'red': {'rounds_won': 9}, 'blue': {'rounds_won': 13}},
+            'players': [{'puuid': 'a', 'team': 'Red'}, {'puuid': 'b'}],
+            'metadata': {'map': 'Ascent', 'mode': 'Competitive'},
+        },
+    }
+
+
+def test_falls_back_to_json_without_ijson(monkeypatch):
+    monkeypatch.setattr(json_extract, 'ijson', None)
+    body = (FIXTURES_DIR / 'match.json').read_bytes()
+    data = LIVE_MATCH_FIELDS.extract(body)
+    assert data['data']['teams']['blue']['rounds_won'] == 13
+    assert 'rounds' not in data['data']
+
+
+def test_extracts_from_streamed_response(henrik):
+    response = requests.get(f"{henrik.base_url}/v2/match/abc", stream=True, timeout=5)
+    data = LIVE_MATCH_FIELDS.extract(response)
+    assert len(data['data']['players']['all_players']) == 10
+    assert response.raw.closed
+
+
+def test_live_scores_use_own_team(henrik):
+    client = ValorantClientV2(henrik_base_url=henrik.base_url)
+    client.client = SimpleNamespace(puuid=PUUID)
+
+    # Oyuncu kırmızı takımda: 9-13
+    assert client._fetch_live_match_scores('abc') == (9, 13)
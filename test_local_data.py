@@ -0,0 +1,117 @@
+"""
+LocalDataProvider testleri - sahte valclient ve mock Henrik sunucusu ile
+"""
+
+import pytest
+
+import henrik_scheduler
+import http_cache
+import http_client
+import identity
+from http_client import HttpClient
+from local_data import LocalDataProvider, parse_local_mmr
+from mock_henrik_server import MockHenrikServer
+from rank_service import RankService
+from valorant_client_v2 import ValorantClientV2
+
+PUUID = '5f1a3b2c-8d4e-4f6a-9b0c-1d2e3f4a5b6c'
+ACT = 'act-2'
+CARD = '9fb348bc-41a0-91ad-8a3e-818035c4e561'
+
+
+class FakeValClient:
+    """valclient.Client'ın kullanılan metotları"""
+
+    def __init__(self, fail=()):
+        self.puuid = PUUID
+        self.fail = set(fail)
+        self.calls = []
+
+    def _reply(self, name, data):
+        self.calls.append(name)
+        if name in self.fail:
+            raise ConnectionError(name)
+        return data
+
+    def rnet_fetch_chat_session(self):
+        return self._reply('session', {'puuid': PUUID, 'game_name': 'Local', 'game_tag': 'TR1'})
+
+    def fetch_account_xp(self):
+        return self._reply('xp', {'Progress': {'Level': 212, 'XP': 1500}})
+
+    def fetch_player_loadout(self):
+        return self._reply('loadout', {'Identity': {'PlayerCardID': CARD}})
+
+    def fetch_content(self):
+        return self._reply('content', {'Seasons': [
+            {'ID': 'episode', 'Type': 'episode', 'IsActive': True},
+            {'ID': 'act-1', 'Type': 'act', 'IsActive': False},
+            {'ID': ACT, 'Type': 'act', 'IsActive': True},
+        ]})
+
+    def fetch_mmr(self):
+        return self._reply('mmr', {
+            'QueueSkills': {'competitive': {'SeasonalInfoBySeasonID': {
+                'act-1': {'CompetitiveTier': 12, 'RankedRating': 10},
+                ACT: {'CompetitiveTier': 21, 'RankedRating': 57},
+            }}},
+            'LatestCompetitiveUpdate': {'MatchID': 'm1', 'SeasonID': ACT, 'TierAfterUpdate': 21,
+                                        'RankedRatingAfterUpdate': 57, 'RankedRatingEarned': 18},
+        })
+
+
+@pytest.fixture
+def henrik(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, '_cache', http_cache.HttpCache(str(tmp_path / 'cache')))
+    monkeypatch.setattr(identity, '_cache', identity.IdentityCache(str(tmp_path / 'identities.json')))
+    monkeypatch.setattr(henrik_scheduler, '_scheduler',
+                        henrik_scheduler.HenrikScheduler(str(tmp_path / 'henrik_quota.json')))
+    monkeypatch.setattr(http_client, '_client', HttpClient())
+    with MockHenrikServer() as server:
+        yield server
+
+
+def test_parse_local_mmr_uses_active_act():
+    data = FakeValClient().fetch_mmr()
+    assert parse_local_mmr(data, ACT)['current_data']['currenttier'] == 21
+    # Yeni act'te henüz maç yok - eski act'in rankı gösterilmez
+    current = parse_local_mmr(data, 'act-3')['current_data']
+    assert (current['currenttier'], current['mmr_change_to_last_game']) == (0, None)
+    # Act bilinmiyorsa son maçın sonucu
+    assert parse_local_mmr(data)['current_data']['ranking_in_tier'] == 57
+
+
+def test_rank_prefers_local_client():
+    provider = LocalDataProvider(lambda: FakeValClient())
+    service = RankService(lambda: pytest.fail('Henrik istenmemeli'), local=provider.mmr)
+
+    assert service.refresh()['rank_text'] == 'Yücelik 1 - 57 RR'
+    assert service.stats['local_fetches'] == 1
+
+
+def test_profile_comes_from_local_client(henrik):
+    client = ValorantClientV2(henrik_base_url=henrik.base_url)
+    client.client = FakeValClient()
+
+    client._cache_player_info()
+    client.cache.update(client._rank_fields(client.rank_service.refresh()))
+
+    assert client.cache['player_name'] == 'Local'
+    assert client.cache['level'] == 212
+    assert CARD in client.cache['card_large']
+    assert client.cache['rank_text'] == 'Yücelik 1 - 57 RR'
+    assert henrik.requests == []
+    assert identity.get_identity_cache().puuid_for('Local', 'TR1') == PUUID
+
+
+def test_falls_back_to_henrik(henrik):
+    client = ValorantClientV2(henrik_base_url=henrik.base_url)
+    client.client = FakeValClient(fail={'xp', 'loadout', 'mmr'})
+
+    client._cache_player_info()
+    rank = client.rank_service.refresh()
+
+    assert client.cache['level'] == 187
+    assert rank['tier'] == 15
+    assert [endpoint for endpoint, _ in henrik.requests] == ['account', 'mmr']
+    assert client.local_data.stats['misses'] == 3
@@ -0,0 +1,173 @@
+"""
+MatchStore / MatchSync testleri - sahte Henrik fetch ile, ağ gerektirmez
+"""
+
+import sqlite3
+
+import pytest
+import requests
+
+from identity import PlayerIdentity
+from match_store import MatchStore, MatchSync, parse_stored_match
+
+PUUID = 'me'
+
+
+def stored_match(n, won=True, mode='Competitive'):
+    """n. maç - n büyüdükçe daha yeni"""
+    return {
+        'meta': {
+            'id': f'match-{n}',
+            'map': {'name': 'Ascent'},
+            'mode': mode,
+            'started_at': f'2024-01-01T00:{n // 60:02d}:{n % 60:02d}.000Z',
+        },
+        'stats': {
+            'puuid': PUUID,
+            'team': 'Red',
+            'character': {'name': 'Jett'},
+            'kills': 20, 'deaths': 10, 'assists': 5,
+        },
+        'teams': {'red': 13 if won else 7, 'blue': 7 if won else 13},
+    }
+
+
+class FakeHenrik:
+    """stored-matches ve mmr-history cevaplarını yeniden eskiye sayfalar"""
+
+    def __init__(self, count):
+        self.matches = [stored_match(n) for n in range(count, 0, -1)]
+        self.rr = {}
+        self.calls = []
+        self.fail = False
+        self.error = None      # Bir kez fırlatılır
+
+    def __call__(self, path, params):
+        self.calls.append((path, dict(params)))
+        if self.error:
+            error, self.error = self.error, None
+            raise error
+        if self.fail:
+            raise requests.ConnectionError('down')
+        if 'mmr-history/' in path:
+            return {'data': [{'match_id': k, 'mmr_change_to_last_game': v} for k, v in self.rr.items()]}
+        start = (params['page'] - 1) * params['size']
+        return {'data': self.matches[start:start + params['size']]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MatchStore(str(tmp_path / 'matches.db'))
+    yield store
+    store.close()
+
+
+def make_sync(store, henrik):
+    sync = MatchSync(store, fetch=henrik)
+    sync.configure(PlayerIdentity(PUUID, 'Player', 'TAG', 'eu'))
+    return sync
+
+
+def test_wal_mode_and_compressed_raw(store):
+    mode = store._db.execute('PRAGMA journal_mode').fetchone()[0]
+    assert mode == 'wal'
+
+    item = stored_match(1)
+    assert store.add_matches([item, item]) == 1
+    assert store.raw('match-1') == item
+    raw = sqlite3.connect(store.path).execute("SELECT raw FROM matches").fetchone()[0]
+    assert isinstance(raw, bytes)
+
+
+def test_parse_stored_match():
+    row = parse_stored_match(stored_match(3, won=False))
+    assert row['match_id'] == 'match-3'
+    assert row['map'] == 'Ascent'
+    assert row['mode'] == 'competitive'
+    assert row['agent'] == 'Jett'
+    assert (row['ally_score'], row['enemy_score'], row['won']) == (7, 13, 0)
+
+
+def test_sync_new_stops_at_known_match(store):
+    henrik = FakeHenrik(25)
+    sync = make_sync(store, henrik)
+
+    assert sync.sync_new() == 20
+    assert len(henrik.calls) == 1  # İlk sayfa dolu ama yenisi yok - eski geçmiş sonra
+
+    henrik.matches.insert(0, stored_match(26))
+    henrik.calls.clear()
+    assert sync.sync_new() == 1
+    assert len(henrik.calls) == 1  # Bilinen maça gelince durdu
+
+    # Eski geçmiş kalınan sayfadan devam eder, bitince bir daha istenmez
+    # (yeni maç sayfaları kaydırdığı için bilinen maçlar tekrar gelebilir)
+    while sync.sync_history_page():
+        pass
+    assert store.count(PUUID) == 26
+    henrik.calls.clear()
+    assert sync.sync_history_page() is False
+    assert henrik.calls == []
+
+
+def test_rr_and_stats(store):
+    henrik = FakeHenrik(3)
+    henrik.matches[1] = stored_match(2, won=False)
+    henrik.rr = {'match-3': 18, 'match-2': -15, 'match-1': 20}
+    sync = make_sync(store, henrik)
+    sync.sync_new()
+    assert sync.sync_rr() == 3
+
+    recent = store.recent(PUUID, mode='Competitive', limit=2)
+    assert [m['match_id'] for m in recent] == ['match-3', 'match-2']
+    assert recent[1]['rr_change'] == -15
+
+    stats = store.stats(PUUID)
+    assert stats['matches'] == 3
+    assert (stats['wins'], stats['losses']) == (2, 1)
+    assert stats['rr_total'] == 23
+    assert stats['kd'] == 2.0
+    assert store.stats(PUUID, mode='unrated')['matches'] == 0
+
+
+def test_request_sync_wakes_background_thread(store):
+    henrik = FakeHenrik(1)
+    sync = make_sync(store, henrik)
+    sync.RESYNC_INTERVAL = 60
+    sync.start()
+    try:
+        for _ in range(100):
+            if store.count(PUUID) == 1:
+                break
+            sync._stop.wait(0.02)
+        assert store.count(PUUID) == 1
+
+        henrik.matches.insert(0, stored_match(2))
+        sync.request_sync()
+        for _ in range(100):
+            if store.count(PUUID) == 2:
+                break
+            sync._stop.wait(0.02)
+        assert store.count(PUUID) == 2
+    finally:
+        sync.stop()
+
+
+@pytest.mark.parametrize('error', [KeyError('data'), ValueError('bozuk JSON'),
+                                   sqlite3.OperationalError('database is locked')])
+def test_unexpected_error_does_not_kill_sync_thread(store, error):
+    henrik = FakeHenrik(1)
+    henrik.error = error
+    sync = make_sync(store, henrik)
+    sync.PAGE_DELAY = 0.01
+    sync.start()
+    try:
+        for _ in range(100):
+            if store.count(PUUID) == 1:
+                break
+            sync._stop.wait(0.02)
+        # Hata sonrası kısa beklemeyle tekrar denendi
+        assert store.count(PUUID) == 1
+        assert sync.running
+    finally:
+        sync.stop(timeout=5)
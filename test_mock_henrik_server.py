@@ -0,0 +1,125 @@
+"""
+Mock Henrik sunucusu ile uçtan uca testler - cache, retry, kota ve timeout
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import henrik_scheduler
+import http_cache
+import http_client
+import identity
+from http_client import HttpClient
+from identity import PlayerIdentity
+from match_store import MatchStore, MatchSync
+from mock_henrik_server import MockHenrikServer
+from valorant_api import ValorantAPI
+
+API_KEY = 'HDEV-test'
+
+
+@pytest.fixture
+def henrik(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, '_cache', http_cache.HttpCache(str(tmp_path / 'cache')))
+    monkeypatch.setattr(identity, '_cache', identity.IdentityCache(str(tmp_path / 'identities.json')))
+    monkeypatch.setattr(henrik_scheduler, '_scheduler',
+                        henrik_scheduler.HenrikScheduler(str(tmp_path / 'henrik_quota.json')))
+    # Devre kesici durumu testler arasında taşınmasın
+    monkeypatch.setattr(http_client, '_client', HttpClient())
+    with MockHenrikServer(api_key=API_KEY) as server:
+        yield server
+
+
+@pytest.fixture
+def api(henrik):
+    config = SimpleNamespace(riot_name='Player', riot_tag='EUW', region='eu', henrik_api_key=API_KEY,
+                             henrik_base_url=henrik.base_url)
+    return ValorantAPI(config)
+
+
+def test_player_status_from_fixtures(henrik, api):
+    status = api.get_player_status()
+
+    assert status['missing'] == []
+    assert status['account']['name'] == 'Player'
+    assert status['mmr']['current_data']['currenttier'] == 15
+    assert status['recent_match']['metadata']['mode'] == 'Competitive'
+    assert henrik.counts == {'account': 1, 'mmr': 1, 'matches': 1}
+
+
+def test_wrong_key_is_rejected(henrik):
+    response = requests.get(f"{henrik.base_url}/v1/account/Player/EUW", timeout=2)
+    assert response.status_code == 401
+
+
+def test_5xx_is_retried(henrik, api):
+    henrik.fail_next(503, endpoint='mmr')
+
+    assert api.get_mmr_info()['current_data']['currenttier'] == 15
+    assert henrik.counts['mmr'] == 2
+
+
+def test_429_blocks_further_requests(henrik, api):
+    henrik.fail_next(429, endpoint='matches', retry_after=30)
+
+    assert api.get_match_history() is None
+    # Kota reset'e kadar kapalı - istek sunucuya hiç gitmez
+    assert api.get_match_history() is None
+    assert henrik.counts['matches'] == 1
+
+
+def test_hang_hits_client_timeout(henrik):
+    client = HttpClient()
+    url = f"{henrik.base_url}/v2/match/abc"
+    headers = {'Authorization': API_KEY}
+
+    # Okuma timeout'u bir kez tekrar denenir
+    henrik.hang_next(1.0)
+    assert client.get(url, headers=headers, timeout=(1, 0.2)).status_code == 200
+    assert henrik.counts['match'] == 2
+
+    # requests, retry'ları tükenen okuma timeout'unu ConnectionError olarak verir
+    henrik.hang_next(1.0, count=2)
+    with pytest.raises(requests.ConnectionError, match='Read timed out'):
+        client.get(url, headers=headers, timeout=(1, 0.2))
+    client.close()
+
+
+
+def test_extra_headers_and_gzip(henrik):
+    henrik.headers = {'x-ratelimit-remaining': '7'}
+    henrik.compress = True
+    response = requests.get(f"{henrik.base_url}/v1/account/Player/EUW", headers={'Authorization': API_KEY},
+                            timeout=2)
+
+    assert response.headers['x-ratelimit-remaining'] == '7'
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.json()['data']['name'] == 'Player'
+    assert henrik.connections == 1
+
+def test_cached_account_revalidates_with_etag(henrik, api):
+    cache = http_cache.get_http_cache()
+    url = f"{henrik.base_url}/v1/account/Player/EUW"
+    headers = {'Authorization': API_KEY}
+
+    assert cache.get(url, headers=headers).status_code == 200
+    assert cache.get(url, headers=headers, ttl=(0, 0)).status_code == 200
+    assert cache.stats['revalidated'] == 1
+    assert henrik.counts['account'] == 2
+
+
+def test_match_sync_against_mock(henrik, tmp_path):
+    store = MatchStore(str(tmp_path / 'matches.db'))
+    sync = MatchSync(store)
+    sync.configure(PlayerIdentity(name='Player', tag='EUW', region='eu'), api_key=API_KEY, base_url=henrik.base_url)
+
+    assert sync.sync_new() == 20
+    while sync.sync_history_page():
+        pass
+    assert sync.sync_rr() == 30
+
+    puuid = store.recent('5f1a3b2c-8d4e-4f6a-9b0c-1d2e3f4a5b6c', limit=1)[0]['puuid']
+    assert store.stats(puuid)['matches'] == 30
+    store.close()
@@ -0,0 +1,88 @@
+"""
+PollScheduler testleri - saat gerektirmez, aralıklar doğrudan hesaplanır
+"""
+
+import pytest
+
+from poll_scheduler import PollScheduler
+
+
+def intervals(scheduler, state, count, changed=False, round_key=None):
+    return [scheduler.next_interval(state, changed, round_key) for _ in range(count)]
+
+
+def settle(scheduler, state):
+    """Session geçişi ve sonrasındaki hızlı poll'ları tüket"""
+    return intervals(scheduler, state, PollScheduler.BURST_POLLS + 1)
+
+
+@pytest.mark.parametrize('state, expected', [
+    ('menus', [2.0, 4.0, 8.0, 16.0, 20.0, 20.0]),
+    ('ingame', [2.0, 3.0, 4.5, 6.75, 10.0, 10.0]),
+    ('pregame', [1.0] * 6),
+    (None, [2.0, 4.0, 8.0, 16.0, 20.0, 20.0]),   # Durum alınamadı - menü gibi
+])
+def test_backoff_per_state(state, expected):
+    scheduler = PollScheduler(max_interval=20)
+    assert settle(scheduler, state) == [1.0] * (PollScheduler.BURST_POLLS + 1)
+    assert intervals(scheduler, state, 6) == expected
+
+
+def test_burst_after_change():
+    scheduler = PollScheduler(max_interval=20)
+    settle(scheduler, 'menus')
+    intervals(scheduler, 'menus', 5)
+    assert scheduler.interval == 20.0
+
+    assert scheduler.next_interval('menus', True) == 1.0
+    assert intervals(scheduler, 'menus', PollScheduler.BURST_POLLS) == [1.0] * PollScheduler.BURST_POLLS
+    assert scheduler.next_interval('menus', False) == 2.0
+
+    # Session geçişi değişiklik sayılır
+    assert scheduler.next_interval('pregame', False) == 1.0
+
+
+def test_round_transition_polls_fast():
+    scheduler = PollScheduler(max_interval=20)
+    settle(scheduler, 'ingame')
+    assert intervals(scheduler, 'ingame', 5, round_key='Skor: 3 - 2')[-1] == 10.0
+
+    assert scheduler.next_interval('ingame', False, 'Skor: 4 - 2') == 1.0
+    assert intervals(scheduler, 'ingame', PollScheduler.BURST_POLLS, round_key='Skor: 4 - 2') == \
+        [1.0] * PollScheduler.BURST_POLLS
+    assert scheduler.next_interval('ingame', False, 'Skor: 4 - 2') == 2.0
+
+
+@pytest.mark.parametrize('max_interval, menus, ingame', [
+    (5, 5.0, 5.0),       # Kullanıcı tavanı maç içi tavanından küçük
+    (60, 60.0, 10.0),
+    (0, 1.0, 1.0),       # Geçersiz değer - en az MIN_INTERVAL
+])
+def test_ceiling_clamp(max_interval, menus, ingame):
+    scheduler = PollScheduler(max_interval=max_interval)
+    settle(scheduler, 'menus')
+    assert max(intervals(scheduler, 'menus', 20)) == menus
+    settle(scheduler, 'ingame')
+    assert max(intervals(scheduler, 'ingame', 20)) == ingame
+
+
+def test_reset_starts_over():
+    scheduler = PollScheduler(max_interval=20)
+    settle(scheduler, 'ingame')
+    intervals(scheduler, 'ingame', 5, round_key='Skor: 1 - 0')
+
+    scheduler.reset()
+    assert scheduler.session_state is None and scheduler.round_key is None
+    # Aynı state'e dönülse de yeni bağlantı hızlı başlar
+    assert scheduler.next_interval('ingame', False, 'Skor: 1 - 0') == 1.0
+    assert scheduler.burst_remaining == PollScheduler.BURST_POLLS
+
+
+def test_idle_hour_in_menus_polls_far_less():
+    """Eski sabit 2 saniyelik döngüye göre boşta bir saatte en az 5 kat az poll"""
+    scheduler = PollScheduler(max_interval=20)
+    elapsed = polls = 0
+    while elapsed < 3600:
+        elapsed += scheduler.next_interval('menus', False)
+        polls += 1
+    assert polls * 5 <= 3600 / 2
@@ -0,0 +1,80 @@
+"""
+StateDebouncer testleri - kayıtlı state dizileri üzerinde replay
+"""
+
+from pathlib import Path
+
+from presence_debouncer import StateDebouncer, load_recording, replay
+
+# ValorantClientV2.record_path ile kaydedilmiş rekabetçi maç (JSONL ham presence)
+RECORDING = str(Path(__file__).parent / 'fixtures' / 'presence' / 'competitive_match.jsonl')
+
+
+def status(state, score=None):
+    result = {'session_state': state}
+    if score:
+        result['round_info'] = f"Skor: {score}"
+    return result
+
+
+def test_flapping_during_queue_pop_is_absorbed():
+    # Sıra bulundu: menus/pregame birkaç saniye ileri geri zıplar
+    sequence = [
+        (0.0, status('menus')),
+        (0.5, status('pregame')),
+        (1.0, status('menus')),
+        (1.5, status('pregame')),
+        (2.0, status('menus')),
+        (2.5, status('pregame')),
+        (3.0, status('pregame')),
+        (4.0, status('pregame')),
+        (5.0, status('pregame')),
+    ]
+
+    result = replay(sequence, window=1.5)
+
+    assert result['raw_transitions'] == 5
+    assert result['debounced_transitions'] == 1
+    assert result['dropped'] >= 2
+
+
+def test_transition_commits_after_stable_window():
+    debouncer = StateDebouncer(window=2)
+    debouncer.feed(status('menus'), now=0)
+
+    assert debouncer.feed(status('pregame'), now=1)['session_state'] == 'menus'
+    assert debouncer.pending_for(now=2) == 1
+    assert debouncer.feed(status('pregame'), now=3)['session_state'] == 'pregame'
+    assert debouncer.pending_for() is None
+
+
+def test_score_changes_pass_through_immediately():
+    debouncer = StateDebouncer(window=5)
+    debouncer.feed(status('ingame', '0 - 0'), now=0)
+
+    out = debouncer.feed(status('ingame', '1 - 0'), now=0.1)
+
+    assert out['round_info'] == "Skor: 1 - 0"
+    assert debouncer.stats['held'] == 0
+
+
+def test_recorded_match_replay():
+    # Lobi -> sıra bulma (menus/pregame zıplar) -> ajan seçimi -> yükleme
+    # (ingame/pregame zıplar) -> 13-7 biten maç -> lobi
+    result = replay(load_recording(RECORDING), window=1.5)
+
+    assert result['inputs'] == 36
+    assert result['raw_transitions'] == 9
+    assert result['debounced_transitions'] == 3
+    assert result['dropped'] == 3
+
+
+def test_recorded_scores_are_not_held():
+    debouncer = StateDebouncer(window=1.5)
+    outputs = [debouncer.feed(status, now=timestamp) for timestamp, status in load_recording(RECORDING)]
+
+    scores = list(dict.fromkeys(out['round_info'] for out in outputs if out['session_state'] == 'ingame'))
+    # 0 - 0 yükleme sonrası pencere dolmadan geldi; sonraki her skor anında geçer
+    assert scores[0] == "Skor: 1 - 0" and scores[-1] == "Skor: 13 - 7"
+    assert len(scores) == 20
+    assert outputs[-1]['session_state'] == 'menus'
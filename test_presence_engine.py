@@ -0,0 +1,233 @@
+"""
+PresenceEngine testleri - başlat/durdur/yeniden başlat; mock Riot
+websocket'i ve mock Discord IPC ile, Valorant ve Discord gerektirmez
+"""
+
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+if sys.platform == 'win32':
+    pytest.skip("Mock IPC sunucusu unix soketi kullanır", allow_module_level=True)
+
+pytest.importorskip('websocket')
+
+import i18n
+from config import Config
+from conftest import wait_until
+from content_updater import ContentUpdater
+from mock_discord_ipc import MockDiscordIPC
+from mock_riot_socket import MockRiotSocket
+from presence_engine import PresenceEngine
+from riot_lockfile import LockfileWatcher
+
+PUUID = 'test-puuid'
+MENUS = {'isValid': True, 'queueId': 'competitive', 'partySize': 1, 'maxPartySize': 5,
+         'matchPresenceData': {'sessionLoopState': 'MENUS', 'matchMap': '', 'queueId': 'competitive'}}
+
+
+class FakeRiotClient:
+    """valclient.Client yerine - presence sadece websocket'ten gelir"""
+
+    puuid = PUUID
+
+    def fetch_presence(self):
+        return None
+
+    def close(self):
+        pass
+
+
+class Recorder:
+    """Motor olaylarını sırasıyla kaydeder"""
+
+    def __init__(self):
+        self.events = []
+        self.stopped = threading.Event()
+
+    def __call__(self, event, data):
+        self.events.append((event, data))
+        if event == 'stopped':
+            self.stopped.set()
+
+    def names(self):
+        return [event for event, _ in self.events]
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    monkeypatch.setattr(i18n, '_language', i18n.DEFAULT_LANGUAGE)
+    monkeypatch.setattr(i18n, '_locale', None)
+    monkeypatch.setattr(ContentUpdater, 'start', lambda self: None)
+
+
+@pytest.fixture
+def discord(tmp_path):
+    server = MockDiscordIPC(str(tmp_path))
+    server.start()
+    yield server
+    server.kill()
+
+
+@pytest.fixture
+def riot(tmp_path):
+    server = MockRiotSocket()
+    server.start()
+    server.lockfile = str(tmp_path / 'lockfile')
+    server.write_lockfile(server.lockfile)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_engine(tmp_path, riot):
+    engines = []
+
+    def make():
+        config = Config(str(tmp_path / 'config.json'))
+        config.discord_client_id = '123'
+        engine = PresenceEngine(config)
+        engine.lockfile_watcher = LockfileWatcher(path=riot.lockfile, on_change=engine._on_lockfile_change)
+
+        client = engine.client
+        client.rank_service.get = lambda now=None: {'rank_text': '', 'rank_icon': None}
+
+        def connect():
+            client.client = FakeRiotClient()
+            client.presence_socket.puuid = PUUID
+            client.presence_socket.lockfile_path = riot.lockfile
+            client.presence_socket.use_tls = False
+            client.presence_socket.start()
+            client.connected = True
+            return True
+
+        client.connect = connect
+        engine.recorder = Recorder()
+        engine.subscribe(engine.recorder)
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.stop()
+        if engine._thread:
+            engine._thread.join(5)
+
+
+def run_until_published(engine, riot, discord, count):
+    """Motoru başlat, websocket'e presence gönder, Discord'a ulaşmasını bekle"""
+    engine.start()
+    assert wait_until(lambda: engine.client.connected)
+    assert riot.wait_for_subscriber()
+    riot.push_presence(PUUID, MENUS)
+    assert discord.wait_for_activity(count)
+    assert wait_until(lambda: engine.update_count == 1)
+
+
+def test_start_publishes_and_stop_cleans_up(make_engine, riot, discord):
+    engine = make_engine()
+    run_until_published(engine, riot, discord, 1)
+    assert discord.activity['details']
+    assert 'presence' in engine.recorder.names()
+
+    engine.stop()
+    assert engine.recorder.stopped.wait(5)
+    engine._thread.join(5)
+    assert not engine.running
+    assert not engine.client.presence_socket.running
+    assert engine.rpc.on_sent is None
+    assert engine.recorder.names()[-1] == 'stopped'
+
+
+def test_restart_with_fresh_engine_ignores_previous_run(make_engine, riot, discord):
+    first = make_engine()
+    run_until_published(first, riot, discord, 1)
+
+    # Durdurup hemen yeniden başlat - eski çalışma hâlâ kapanıyor olabilir
+    first.stop()
+    second = make_engine()
+    run_until_published(second, riot, discord, 2)
+
+    assert first.recorder.stopped.wait(5)
+    assert 'stopped' not in second.recorder.names()
+    assert second.running and second.client.presence_socket.running
+
+    # Yeni çalışma eski motorun kapanışından etkilenmeden yayına devam eder
+    riot.push_presence(PUUID, {**MENUS, 'partySize': 2})
+    assert discord.wait_for_activity(3)
+    assert wait_until(lambda: second.update_count == 2)
+    assert first.update_count == 1
+
+
+def test_same_engine_cannot_start_twice_while_running(make_engine, riot, discord):
+    engine = make_engine()
+    run_until_published(engine, riot, discord, 1)
+    with pytest.raises(RuntimeError):
+        engine.start()
+
+    engine.stop()
+    engine._thread.join(5)
+    # Tamamen durduktan sonra tekrar başlatılabilir
+    engine.recorder.stopped.clear()
+    engine.update_count = 0
+    run_until_published(engine, riot, discord, 2)
+
+
+async def connect_valorant(engine):
+    """Sadece bağlantı döngüsünü çalıştır"""
+    engine._loop = asyncio.get_running_loop()
+    engine._lockfile_changed = asyncio.Event()
+    with ThreadPoolExecutor(max_workers=1) as engine._valorant_executor:
+        return await engine._connect_valorant()
+
+
+def test_connect_retries_back_off_while_valorant_closed(make_engine, riot):
+    """Riot Client açık (lockfile var) ama Valorant kapalı - denemeler seyrekleşir"""
+    engine = make_engine()
+    engine.lockfile_watcher.check()
+    assert engine.lockfile_watcher.present
+
+    attempts = []
+    waits = []
+
+    def connect():
+        attempts.append(len(waits))
+        return len(attempts) > 7
+
+    async def wait_event(event, timeout):
+        waits.append(timeout)
+        # Dördüncü beklemede Riot Client yeniden başladı (lockfile değişti)
+        return len(waits) == 4
+
+    engine.client.connect = connect
+    engine._wait_event = wait_event
+
+    assert asyncio.run(connect_valorant(engine))
+    assert len(attempts) == 8 and len(waits) == 7
+
+    # Eşit jitter: her bekleme üst sınırının yarısı ile kendisi arasında
+    ceilings = [5, 10, 20, 40, 5, 10, 20]
+    for wait, ceiling in zip(waits, ceilings):
+        assert ceiling / 2 <= wait <= ceiling
+    assert 'valorant' in engine.recorder.names()
+
+
+def test_connect_backoff_is_capped(make_engine):
+    engine = make_engine()
+    engine.lockfile_watcher.check()
+    waits = []
+
+    async def wait_event(event, timeout):
+        waits.append(timeout)
+        return False
+
+    engine.client.connect = lambda: len(waits) >= 10
+    engine._wait_event = wait_event
+
+    asyncio.run(connect_valorant(engine))
+    assert max(waits) <= PresenceEngine.VALORANT_BACKOFF_MAX
+    assert waits[-1] >= PresenceEngine.VALORANT_BACKOFF_MAX / 2
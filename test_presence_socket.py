@@ -0,0 +1,67 @@
+"""
+PresenceSocket testleri - lokal mock websocket ile, Valorant gerektirmez
+"""
+
+import pytest
+
+pytest.importorskip('websocket')
+
+from conftest import wait_until
+from mock_riot_socket import MockRiotSocket
+from presence_socket import PresenceSocket
+
+PUUID = 'test-puuid'
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = MockRiotSocket()
+    server.start()
+    server.lockfile = str(tmp_path / 'lockfile')
+    server.write_lockfile(server.lockfile)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def listener(server):
+    listener = PresenceSocket(puuid=PUUID, lockfile_path=server.lockfile, use_tls=False)
+    listener.RECONNECT_DELAY = 0.1
+    listener.start()
+    assert server.wait_for_subscriber()
+    assert wait_until(lambda: listener.connected)
+    yield listener
+    listener.stop()
+
+
+def test_presence_event_is_decoded(server, listener):
+    server.push_presence(PUUID, {'queueId': 'competitive', 'partySize': 2})
+
+    assert listener.wait(5)
+    assert listener.get_presence() == {'queueId': 'competitive', 'partySize': 2}
+
+
+def test_duplicate_and_foreign_presences_are_ignored(server, listener):
+    server.push_presence(PUUID, {'queueId': 'unrated'})
+    assert wait_until(lambda: listener.event_count == 1)
+
+    server.push_presence(PUUID, {'queueId': 'unrated'})
+    server.push_presence('someone-else', {'queueId': 'deathmatch'})
+    server.push_presence(PUUID, {'queueId': 'swiftplay'})
+
+    assert wait_until(lambda: listener.event_count == 2)
+    assert listener.get_presence() == {'queueId': 'swiftplay'}
+
+
+def test_drop_falls_back_and_reconnects(server, listener):
+    server.push_presence(PUUID, {'queueId': 'unrated'})
+    assert wait_until(lambda: listener.event_count == 1)
+
+    server.drop_clients()
+    assert wait_until(lambda: not listener.connected)
+    assert listener.get_presence() is None
+
+    assert wait_until(lambda: listener.connected)
+    # Yeniden bağlandıktan sonra ilk olaya kadar seed edilen değer kullanılır
+    listener.seed({'queueId': 'polled'})
+    assert listener.get_presence() == {'queueId': 'polled'}
@@ -0,0 +1,181 @@
+"""
+RankService testleri - mock Henrik sunucusu ile, ağ gerektirmez
+"""
+
+import threading
+import time
+
+import pytest
+
+import henrik_scheduler
+import http_cache
+import http_client
+from conftest import wait_until
+from http_client import HttpClient
+from mock_henrik_server import MockHenrikServer
+from rank_service import RankService, parse_mmr
+
+
+def mmr(tier, rr=0):
+    return {'status': 200, 'data': {'current_data': {'currenttier': tier, 'ranking_in_tier': rr}}}
+
+
+@pytest.fixture
+def server():
+    with MockHenrikServer() as server:
+        server.overrides['mmr'] = mmr(0)
+        server.url = f"{server.base_url}/v2/mmr/eu/Player/EUW"
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, '_cache', http_cache.HttpCache(str(tmp_path / 'cache')))
+    monkeypatch.setattr(henrik_scheduler, '_scheduler',
+                        henrik_scheduler.HenrikScheduler(str(tmp_path / 'henrik_quota.json')))
+    monkeypatch.setattr(http_client, '_client', HttpClient())
+
+
+@pytest.fixture
+def service(server, monkeypatch):
+    # http_cache süreleri kapalı - RankService'in kendi süreleri test edilir
+    monkeypatch.setattr(http_cache, 'ttl_for', lambda url: None)
+    return RankService(lambda: (server.url, {}))
+
+
+def test_parse_mmr():
+    assert parse_mmr({'current_data': {'currenttier': 24, 'ranking_in_tier': 57}})['rank_text'] == 'Ölümsüz 1 - 57 RR'
+    assert parse_mmr({'current_data': {'currenttier': 0}})['rank_text'] == ''
+    assert parse_mmr({})['rank_icon'] is None
+
+
+def test_unranked_result_is_negatively_cached(server, service):
+    service.refresh()
+    for _ in range(100):
+        assert service.get()['rank_text'] == ''
+
+    assert len(server.requests) == 1
+    assert service.stats['negative_hits'] == 100
+    assert service.stats['misses'] == 0
+
+
+def test_error_is_cached_and_keeps_last_rank(server, service):
+    server.overrides['mmr'] = mmr(15, 40)
+    service.refresh()
+    assert service.get()['rank_text'] == 'Platin 1 - 40 RR'
+
+    server.fail_next(503, count=100)
+    service.refresh(force=True)
+
+    assert service.stats['errors'] == 1
+    assert service.get()['rank_text'] == 'Platin 1 - 40 RR'
+    requests_before = len(server.requests)
+    for _ in range(10):
+        service.get()
+    assert len(server.requests) == requests_before
+
+
+def test_stale_cache_on_rate_limit_is_refreshed_later(server, tmp_path, monkeypatch):
+    # http_cache süreleri açık - 429'da disk cache'teki eski kayıt döner
+    service = RankService(lambda: (server.url, {}))
+    server.overrides['mmr'] = mmr(24, 57)
+    service.refresh()
+    assert service.kind == 'ranked'
+
+    server.fail_next(429, count=100)
+    start = time.time()
+    service.refresh(force=True)
+
+    # Son bilinen rank gösterilir ama taze sayılmaz
+    assert service.kind == 'stale'
+    assert service.get(now=start)['rank_text'] == 'Ölümsüz 1 - 57 RR'
+    assert service.expires_at <= start + RankService.ERROR_TTL + 1
+    assert service.stats['errors'] == 1
+
+    # Kota açıldı, cache kaydı da eskidi - süre dolunca yenilenir
+    monkeypatch.setattr(henrik_scheduler, '_scheduler',
+                        henrik_scheduler.HenrikScheduler(str(tmp_path / 'henrik_quota_reset.json')))
+    cache = http_cache.get_http_cache()
+    for entry in cache._entries.values():
+        entry['stored_at'] -= 3600
+    server.clear_faults()
+    server.overrides['mmr'] = mmr(24, 80)
+    service.get(now=service.expires_at)
+    assert wait_until(lambda: service.kind == 'ranked')
+    assert service.get()['rank_text'] == 'Ölümsüz 1 - 80 RR'
+
+
+def test_expired_rank_refreshes_in_background(server, service):
+    server.overrides['mmr'] = mmr(15, 40)
+    service.refresh()
+    assert service.stats['hits'] == 0
+    service.get()
+    assert service.stats['hits'] == 1
+
+    server.overrides['mmr'] = mmr(15, 58)
+    # get() beklemez - eski değer döner, yenisi arka planda gelir
+    assert service.get(now=service.expires_at)['rank_text'] == 'Platin 1 - 40 RR'
+
+    assert wait_until(lambda: service.get()['rank_text'] == 'Platin 1 - 58 RR')
+
+
+def test_refresh_after_match_retries_until_rank_changes(server, service):
+    service.MATCH_REFRESH_DELAY = 0.02
+    server.overrides['mmr'] = mmr(15, 40)
+    service.refresh()
+
+    # Henrik maçı henüz işlemedi - aynı veri dönüyor
+    service.refresh_after_match()
+    assert wait_until(lambda: service.stats['match_refreshes'] >= 3)
+    server.overrides['mmr'] = mmr(15, 58)
+    assert wait_until(lambda: service.get()['rank_text'] == 'Platin 1 - 58 RR')
+
+    # Değişince durur
+    requests_after = len(server.requests)
+    time.sleep(0.3)
+    assert len(server.requests) == requests_after
+
+
+def test_refresh_after_match_gives_up(server, service):
+    service.MATCH_REFRESH_DELAY = 0.01
+    service.MATCH_REFRESH_ATTEMPTS = 3
+    server.overrides['mmr'] = mmr(15, 40)
+    service.refresh()
+
+    service.refresh_after_match()
+    assert wait_until(lambda: service.stats['match_refreshes'] == 3)
+    time.sleep(0.2)
+    assert service.stats['match_refreshes'] == 3
+    assert len(server.requests) == 4
+
+
+def test_missing_riot_id_never_requests():
+    service = RankService(lambda: None)
+    service.refresh()
+    assert service.get()['rank_text'] == ''
+    assert service.stats['fetches'] == 0
+
+
+def test_refreshes_never_overlap(server):
+    active = []
+    overlaps = []
+
+    def local():
+        active.append(1)
+        overlaps.append(len(active))
+        time.sleep(0.05)
+        active.pop()
+        return {'current_data': {'currenttier': 15, 'ranking_in_tier': 40}}
+
+    service = RankService(lambda: (server.url, {}), local=local)
+    # Arka plan yenilemesi sürerken maç sonrası yenilemesi ve elle yenileme
+    service.get()
+    threads = [threading.Thread(target=service.refresh, kwargs={'force': True}) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert wait_until(lambda: len(overlaps) == 4)
+    assert max(overlaps) == 1
+    assert service.stats['local_fetches'] == 4
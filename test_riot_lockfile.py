@@ -0,0 +1,103 @@
+"""
+LockfileWatcher testleri - geçici klasörde lockfile oluşturma, silme ve
+yeniden yazma; watchdog bildirimleriyle ve os.stat poll yedeğiyle
+"""
+
+import os
+import queue
+
+import pytest
+
+import riot_lockfile
+from riot_lockfile import LockfileWatcher, read_lockfile
+
+
+def write(path, port, password):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"Riot Client:1234:{port}:{password}:https")
+
+
+@pytest.fixture(params=['watchdog', 'stat'])
+def mode(request, monkeypatch):
+    if request.param == 'watchdog':
+        if riot_lockfile.Observer is None:
+            pytest.skip("watchdog yüklü değil")
+        # Olaylar yedek poll'dan değil dosya bildiriminden gelmeli
+        monkeypatch.setattr(LockfileWatcher, 'SAFETY_POLL_INTERVAL', 60.0)
+    else:
+        monkeypatch.setattr(riot_lockfile, 'Observer', None)
+        monkeypatch.setattr(LockfileWatcher, 'POLL_INTERVAL', 0.02)
+    return request.param
+
+
+@pytest.fixture
+def changes():
+    return queue.Queue()
+
+
+@pytest.fixture
+def watcher(tmp_path, mode, changes):
+    watcher = LockfileWatcher(path=str(tmp_path / 'lockfile'), on_change=changes.put)
+    watcher.start()
+    yield watcher
+    watcher.stop()
+
+
+def next_change(changes):
+    return changes.get(timeout=5)
+
+
+def test_lockfile_created_attaches(watcher, changes, mode):
+    assert not watcher.present
+    assert (watcher._observer is not None) == (mode == 'watchdog')
+
+    write(watcher.path, 50000, 'secret')
+    lockfile = next_change(changes)
+    assert lockfile['port'] == '50000' and lockfile['password'] == 'secret'
+    assert watcher.present and watcher.lockfile == lockfile
+
+
+def test_lockfile_deleted_detaches(watcher, changes):
+    write(watcher.path, 50000, 'secret')
+    assert next_change(changes)
+
+    os.remove(watcher.path)
+    assert next_change(changes) is None
+    assert not watcher.present
+
+
+def test_lockfile_rewritten_reattaches(watcher, changes):
+    write(watcher.path, 50000, 'secret')
+    assert next_change(changes)['port'] == '50000'
+
+    # Riot Client yeniden başladı - yeni port ve şifre
+    write(watcher.path, 61234, 'another-secret')
+    lockfile = next_change(changes)
+    assert lockfile == {'name': 'Riot Client', 'pid': '1234', 'port': '61234',
+                        'password': 'another-secret', 'protocol': 'https'}
+    assert watcher.lockfile == lockfile
+
+
+def test_existing_lockfile_reported_on_start(tmp_path, changes):
+    path = str(tmp_path / 'lockfile')
+    write(path, 50000, 'secret')
+
+    watcher = LockfileWatcher(path=path, on_change=changes.put)
+    watcher.start()
+    try:
+        assert changes.get_nowait()['port'] == '50000'
+        # Değişmeyen dosya tekrar bildirilmez
+        watcher.check()
+        assert changes.empty()
+    finally:
+        watcher.stop()
+
+
+def test_malformed_lockfile_is_not_present(tmp_path):
+    path = tmp_path / 'lockfile'
+    path.write_text('Riot Client:1234', encoding='utf-8')
+    assert read_lockfile(str(path)) is None
+
+    watcher = LockfileWatcher(path=str(path))
+    watcher.check()
+    assert not watcher.present
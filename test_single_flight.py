@@ -0,0 +1,67 @@
+"""
+SingleFlight testleri
+"""
+
+import threading
+import time
+
+from single_flight import SingleFlight
+
+
+def run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    executions = []
+
+    def fetch():
+        executions.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results = run_concurrently(8, lambda: flights.do('card', fetch))
+
+    assert len(executions) == 1
+    assert all(r is results[0] for r in results)
+    assert flights.stats == {'calls': 1, 'deduplicated': 7}
+
+
+def test_error_is_shared_and_next_call_retries():
+    flights = SingleFlight()
+
+    def fail():
+        time.sleep(0.2)
+        raise ValueError('down')
+
+    results = run_concurrently(4, lambda: flights.do('mmr', fail))
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flights.stats['calls'] == 1
+
+    # Uçuş bitti - sonraki çağrı yeniden çalışır
+    assert flights.do('mmr', lambda: 42) == 42
+    assert flights.stats['calls'] == 2
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    flights = SingleFlight()
+    results = run_concurrently(2, lambda: flights.do(threading.get_ident(), lambda: time.sleep(0.1) or 1))
+
+    assert results == [1, 1]
+    assert flights.stats == {'calls': 2, 'deduplicated': 0}
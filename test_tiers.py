@@ -0,0 +1,78 @@
+"""
+Tier tablosu testleri - her tier numarası tüm giriş noktalarında aynı çözülmeli
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import content_catalog
+import i18n
+import tiers
+import utils
+from asset_manager import AssetManager
+from content_catalog import ContentCatalog
+from presence_builder_v2 import PresenceBuilderV2
+from rank_service import parse_mmr
+
+
+@pytest.fixture(autouse=True)
+def fresh_catalog(monkeypatch):
+    monkeypatch.setattr(i18n, '_language', i18n.DEFAULT_LANGUAGE)
+    monkeypatch.setattr(i18n, '_locale', None)
+    monkeypatch.setattr(content_catalog, '_catalog', ContentCatalog.load())
+    monkeypatch.setattr(tiers, '_table', None)
+
+
+def numbers():
+    """Tablodaki tüm tier'lar ve her iki taraftaki sınır dışı değerler"""
+    return [None, -1] + list(range(len(tiers.get_tiers()) + 4))
+
+
+def test_every_tier_resolves_the_same_everywhere():
+    assets = AssetManager(SimpleNamespace(use_local_assets=False))
+    for number in numbers():
+        info = tiers.tier(number)
+        assert utils.get_rank_name(number or 0) == info.name, number
+        assert utils.get_rank_icon_key(number or 0) == info.asset_key, number
+        assert assets.get_rank_asset(number or 0) == info.asset_key, number
+        assert Path(info.local_path).is_file(), info
+
+        rank = parse_mmr({'current_data': {'currenttier': number, 'ranking_in_tier': 12}})
+        if info.ranked:
+            assert rank['rank_text'] == f"{info.name} - 12 RR"
+            assert rank['rank_icon'] == info.icon_url
+        else:
+            assert rank['rank_text'] == '' and rank['rank_icon'] is None
+
+    presence = PresenceBuilderV2().build_presence({'session_state': 'pregame'})
+    assert presence['small_image'] == tiers.tier(0).icon_url
+
+
+def test_table_matches_catalog():
+    catalog = content_catalog.get_catalog()
+    table = tiers.get_tiers()
+    assert [t.tier for t in table] == list(range(len(table)))
+    for row in catalog.tiers:
+        if row and row.tier >= tiers.FIRST_RANKED:
+            assert table.get(row.tier)[:3] == (row.tier, row.name, row.division)
+            assert table.get(row.tier).icon_url == row.icon
+    # Eski bölümlerin 28-30 Radiant'ı ve kullanılmayan tier'lar
+    radiant = table.get(len(table) - 1)
+    assert radiant.asset_key == 'radiant'
+    assert table.get(30)[1:] == radiant[1:]
+    assert not table.get(1).ranked and table.get(1).asset_key == 'unranked'
+    assert table.get(24).local_path.endswith('Immortal_1_Rank.png')
+    assert radiant.local_path.endswith('Radiant_Rank.png')
+
+
+def test_table_follows_catalog_language():
+    assert tiers.tier(24).name == 'Ölümsüz 1'
+    table = tiers.get_tiers()
+    assert tiers.get_tiers() is table          # Katalog değişmedikçe tekrar kurulmaz
+
+    i18n.set_language('en')
+    assert tiers.tier(24).name == 'Immortal 1'
+    assert utils.get_rank_name(24) == 'Immortal 1'
+    assert tiers.get_tiers() is not table
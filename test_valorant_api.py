@@ -0,0 +1,128 @@
+"""
+ValorantAPI testleri - mock Henrik sunucusu ile, ağ gerektirmez
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import henrik_scheduler
+import http_cache
+import http_client
+import identity
+from http_client import HttpClient
+from match_store import MatchStore
+from mock_henrik_server import FIXTURES_DIR, MockHenrikServer
+from valorant_api import ValorantAPI
+
+
+@pytest.fixture
+def server():
+    with MockHenrikServer() as server:
+        yield server
+
+
+@pytest.fixture
+def api(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, '_cache', http_cache.HttpCache(str(tmp_path / 'cache')))
+    monkeypatch.setattr(identity, '_cache', identity.IdentityCache(str(tmp_path / 'identities.json')))
+    monkeypatch.setattr(henrik_scheduler, '_scheduler',
+                        henrik_scheduler.HenrikScheduler(str(tmp_path / 'henrik_quota.json')))
+    monkeypatch.setattr(http_client, '_client', HttpClient())
+    config = SimpleNamespace(riot_name='Player', riot_tag='EUW', region='eu', henrik_api_key='',
+                             henrik_base_url=server.base_url)
+    return ValorantAPI(config)
+
+
+def test_calls_run_in_parallel(server, api):
+    for endpoint in ('account', 'mmr', 'matches'):
+        server.hang_next(0.3, endpoint=endpoint)
+
+    start = time.monotonic()
+    status = api.get_player_status()
+    elapsed = time.monotonic() - start
+
+    assert status['missing'] == []
+    assert status['account']['account_level'] == 187
+    assert status['recent_match']['metadata']['map'] == 'Ascent'
+    assert elapsed < 0.6
+
+
+def test_deadline_returns_partial_result(server, api):
+    server.hang_next(2.0, endpoint='matches')
+
+    start = time.monotonic()
+    status = api.get_player_status(deadline=0.5)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.0
+    assert status['missing'] == ['recent_match']
+    assert status['recent_match'] is None
+    assert status['mmr']['current_data']['currenttier'] == 15
+
+
+def test_empty_result_is_not_missing(server, api):
+    server.overrides['matches'] = {'status': 200, 'data': []}
+
+    status = api.get_player_status()
+    assert status['missing'] == []
+    assert status['recent_match'] is None
+
+
+def test_failed_request_is_missing_and_uses_last_result(server, api):
+    server.fail_next(500, count=100, endpoint='mmr')
+    api.cache['mmr'] = {'current_data': {'currenttier': 12}}
+
+    first = api.get_player_status()
+    assert first['missing'] == ['mmr']
+    assert first['mmr'] == {'current_data': {'currenttier': 12}}
+    assert first['recent_match']['metadata']['map'] == 'Ascent'
+
+    server.clear_faults()
+    server.fail_next(429, count=100, endpoint='matches')
+    status = api.get_player_status()
+    assert status['missing'] == ['recent_match']
+    # Son başarılı maç döner - maç yokmuş gibi davranılmaz
+    assert status['recent_match'] == first['recent_match']
+    assert status['account']['account_level'] == 187
+
+
+def test_close_stops_request_threads(server, api):
+    api.get_player_status()
+    api.close()
+    with pytest.raises(RuntimeError):
+        api._executor.submit(api.get_account_info)
+
+
+def test_history_and_stats_from_store(server, api, tmp_path):
+    store = MatchStore(str(tmp_path / 'matches.db'))
+    api = ValorantAPI(api.config, match_store=store)
+    api.match_sync.fetch = lambda path, params: {'data': []}
+
+    # PUUID bilinmiyor / depo boş - API'ye düşülür
+    matches = json.loads((FIXTURES_DIR / 'matches.json').read_text(encoding='utf-8'))['data']
+    assert [m['metadata']['matchid'] for m in api.get_match_history()] == [m['metadata']['matchid'] for m in matches]
+    assert api.get_match_stats() is None
+    assert server.counts == {'matches': 1}
+
+    identity.get_identity_cache().remember('me', 'Player', 'EUW')
+    store.add_matches([{
+        'meta': {'id': 'match-1', 'map': {'name': 'Bind'}, 'mode': 'Competitive',
+                 'started_at': '2024-01-01T10:00:00.000Z'},
+        'stats': {'puuid': 'me', 'team': 'Red', 'character': {'name': 'Jett'},
+                  'kills': 20, 'deaths': 10, 'assists': 5},
+        'teams': {'red': 13, 'blue': 7},
+    }])
+
+    history = api.get_match_history()
+    assert history[0]['metadata'] == {'matchid': 'match-1', 'map': 'Bind', 'mode': 'competitive',
+                                      'game_start': '2024-01-01T10:00:00Z'}
+    assert api.get_match_stats()['wins'] == 1
+    assert server.counts == {'matches': 1}  # Depodan okundu, istek atılmadı
+    assert api.match_sync.running
+
+    api.close()
+    assert not api.match_sync.running
+    store.close()
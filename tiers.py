@@ -0,0 +1,118 @@
+"""
+Rekabetçi tier tablosu - rank adı, bölüm, Discord asset key'i, lokal
+asset yolu ve CDN icon adresi tek yerde
+
+Tablo içerik kataloğundaki (aktif dile çevrilmiş) tier satırlarından bir
+kez kurulur ve tier numarasıyla indekslenen bir listedir; bir tier'ı
+çözmek tek liste erişimidir. Katalog değişince (content_updater, dil
+değişikliği) bir sonraki erişimde yeniden kurulur.
+"""
+
+import threading
+from pathlib import Path
+from typing import Optional, List, NamedTuple, Iterator
+
+from content_catalog import ContentCatalog, get_catalog
+
+# İlk ranked tier (Demir 1) - altı derecesiz veya kullanılmıyor
+FIRST_RANKED = 3
+
+ICON_URL = "https://media.valorant-api.com/competitivetiers/03621f52-342b-cf4e-4f86-9350a49c6d04/{tier}/largeicon.png"
+
+RANKS_DIR = Path(__file__).resolve().parent / 'assets' / 'ranks'
+
+
+class TierInfo(NamedTuple):
+    tier: int
+    name: str           # Aktif dilde 'Ölümsüz 1'
+    division: str       # 'IMMORTAL'
+    asset_key: str      # Discord asset key'i - 'immortal'
+    local_path: str     # assets/ranks/Immortal_1_Rank.png
+    icon_url: str       # valorant-api CDN largeicon
+    ranked: bool
+
+
+def _local_path(division: str, number: int, single: bool) -> str:
+    title = division.title()
+    name = f"{title}_Rank.png" if single else f"{title}_{number}_Rank.png"
+    return str(RANKS_DIR / name)
+
+
+class TierTable:
+    """Tier numarasıyla indekslenen değişmez tablo
+
+    Kullanılmayan tier'lar (1, 2) ve katalogda boşluk kalan numaralar
+    derecesiz satırını kullanır. En yüksek tier'ın üstündeki numaralar
+    (eski bölümlerin 28-30 Radiant'ı) en yüksek tier'a çözülür.
+    """
+
+    def __init__(self, catalog: ContentCatalog):
+        self.catalog = catalog
+        rows = [t for t in catalog.tiers if t is not None]
+        ranked = [t for t in rows if t.tier >= FIRST_RANKED]
+        # Bölüm başına tier sayısı ve ilk tier - 'Demir 2' → Iron_2_Rank.png
+        firsts = {}
+        counts = {}
+        for row in ranked:
+            firsts.setdefault(row.division, row.tier)
+            counts[row.division] = counts.get(row.division, 0) + 1
+
+        base = catalog.tier(0)
+        unranked = TierInfo(
+            tier=0,
+            name=base.name if base else '',
+            division=base.division if base else 'UNRANKED',
+            asset_key='unranked',
+            local_path=str(RANKS_DIR / 'Unranked.png'),
+            icon_url=(base.icon if base else '') or ICON_URL.format(tier=0),
+            ranked=False,
+        )
+        size = max((t.tier for t in rows), default=0) + 1
+        self._tiers: List[TierInfo] = [unranked._replace(tier=n) for n in range(size)]
+        for row in ranked:
+            self._tiers[row.tier] = TierInfo(
+                tier=row.tier,
+                name=row.name,
+                division=row.division,
+                asset_key=row.division.lower(),
+                local_path=_local_path(row.division, row.tier - firsts[row.division] + 1,
+                                       counts[row.division] == 1),
+                icon_url=row.icon or ICON_URL.format(tier=row.tier),
+                ranked=True,
+            )
+
+    def get(self, tier: Optional[int]) -> TierInfo:
+        """Tier numarasından satır - bilinmeyen/negatif derecesiz, fazlası en yüksek tier"""
+        if not tier or tier < 0:
+            return self._tiers[0]
+        if tier >= len(self._tiers):
+            return self._tiers[-1]
+        return self._tiers[tier]
+
+    def __len__(self) -> int:
+        return len(self._tiers)
+
+    def __iter__(self) -> Iterator[TierInfo]:
+        return iter(self._tiers)
+
+
+_table: Optional[TierTable] = None
+_table_lock = threading.Lock()
+
+
+def get_tiers() -> TierTable:
+    """Paylaşılan tier tablosu - katalog değiştiyse yeniden kurulur"""
+    global _table
+    catalog = get_catalog()
+    table = _table
+    if table is None or table.catalog is not catalog:
+        with _table_lock:
+            if _table is None or _table.catalog is not catalog:
+                _table = TierTable(catalog)
+            table = _table
+    return table
+
+
+def tier(number: Optional[int]) -> TierInfo:
+    """Kısayol - get_tiers().get(number)"""
+    return get_tiers().get(number)
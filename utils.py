@@ -7,6 +7,10 @@ import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+import tiers
+from content_catalog import get_catalog
+from i18n import t
+
 def setup_logging(debug: bool = False):
     """Logging yapılandırması"""
     level = logging.DEBUG if debug else logging.INFO
@@ -35,7 +39,7 @@ def get_presence_data(player_data: Dict[str, Any], config) -> Dict[str, Any]:
     recent_match = player_data.get('recent_match')
     
     # Oyuncu adı ve seviye
-    player_name = account.get('name', 'Unknown')
+    player_name = account.get('name', t('unknown'))
     player_tag = account.get('tag', '')
     level = account.get('account_level', 0)
     
@@ -46,7 +50,7 @@ def get_presence_data(player_data: Dict[str, Any], config) -> Dict[str, Any]:
         rank_name = get_rank_name(current_tier)
         rr = mmr.get('ranking_in_tier', 0)
         
-        if rank_name and rank_name != "Unranked":
+        if tiers.tier(current_tier).ranked:
             rank_info = f"{rank_name} - {rr} RR"
             presence['small_image'] = get_rank_icon_key(current_tier)
             presence['small_text'] = rank_info
@@ -54,17 +58,17 @@ def get_presence_data(player_data: Dict[str, Any], config) -> Dict[str, Any]:
     # Detaylı durum bilgisi
     details = f"{player_name}#{player_tag}"
     if config.show_level:
-        details += f" - Level {level}"
+        details += f" - {t('level', level=level)}"
     
     presence['details'] = details
     
     # Oyun durumu
-    state = "In Menus"
+    state = t('in_menus')
     
     if recent_match:
         metadata = recent_match.get('metadata', {})
-        mode = metadata.get('mode', 'Unknown')
-        map_name = metadata.get('map', 'Unknown')
+        mode = metadata.get('mode', t('unknown'))
+        map_name = metadata.get('map', t('unknown'))
         
         # Oyun modu
         mode_display = get_game_mode_name(mode)
@@ -74,93 +78,32 @@ def get_presence_data(player_data: Dict[str, Any], config) -> Dict[str, Any]:
         if config.show_party_size:
             # Party size bilgisi recent match'ten çıkarılabilir
             # Şimdilik basit tutalım
-            state = f"{mode_display} on {map_name}"
+            state = t('mode_on_map', mode=mode_display, map=map_name)
     
     presence['state'] = state
     
     return presence
 
 def get_rank_name(tier: int) -> str:
-    """Tier numarasından rank ismini döndür"""
-    ranks = {
-        0: "Unranked",
-        3: "Iron 1", 4: "Iron 2", 5: "Iron 3",
-        6: "Bronze 1", 7: "Bronze 2", 8: "Bronze 3",
-        9: "Silver 1", 10: "Silver 2", 11: "Silver 3",
-        12: "Gold 1", 13: "Gold 2", 14: "Gold 3",
-        15: "Platinum 1", 16: "Platinum 2", 17: "Platinum 3",
-        18: "Diamond 1", 19: "Diamond 2", 20: "Diamond 3",
-        21: "Ascendant 1", 22: "Ascendant 2", 23: "Ascendant 3",
-        24: "Immortal 1", 25: "Immortal 2", 26: "Immortal 3",
-        27: "Radiant"
-    }
-    return ranks.get(tier, "Unranked")
+    """Tier numarasından rank ismini döndür (aktif dilde)"""
+    return tiers.tier(tier).name
 
 def get_rank_icon_key(tier: int) -> str:
     """Rank tier'ından Discord asset key'i döndür"""
-    if tier == 0:
-        return "unranked"
-    elif 3 <= tier <= 5:
-        return "iron"
-    elif 6 <= tier <= 8:
-        return "bronze"
-    elif 9 <= tier <= 11:
-        return "silver"
-    elif 12 <= tier <= 14:
-        return "gold"
-    elif 15 <= tier <= 17:
-        return "platinum"
-    elif 18 <= tier <= 20:
-        return "diamond"
-    elif 21 <= tier <= 23:
-        return "ascendant"
-    elif 24 <= tier <= 26:
-        return "immortal"
-    elif tier == 27:
-        return "radiant"
-    else:
-        return "unranked"
+    return tiers.tier(tier).asset_key
 
 def get_game_mode_name(mode: str) -> str:
-    """Oyun modu kısa adından tam adını döndür"""
-    modes = {
-        'competitive': 'Competitive',
-        'unrated': 'Unrated',
-        'spikerush': 'Spike Rush',
-        'deathmatch': 'Deathmatch',
-        'ggteam': 'Escalation',
-        'onefa': 'Replication',
-        'newmap': 'New Map',
-        'snowball': 'Snowball Fight',
-        'swiftplay': 'Swiftplay',
-        'custom': 'Custom Game',
-        'premier': 'Premier'
-    }
-    return modes.get(mode.lower(), mode.title())
+    """Oyun modu kısa adından tam adını döndür (aktif dilde)"""
+    queue = get_catalog().queue(mode)
+    return queue.name if queue else mode.title()
 
 def get_map_display_name(map_url: str) -> str:
     """Harita URL'sinden görünen adı çıkar"""
     if not map_url:
-        return "Unknown"
-    
-    # URL'den harita ismini çıkar
-    map_name = map_url.split('/')[-1].lower()
-    
-    map_names = {
-        'ascent': 'Ascent',
-        'bind': 'Bind',
-        'haven': 'Haven',
-        'split': 'Split',
-        'icebox': 'Icebox',
-        'breeze': 'Breeze',
-        'fracture': 'Fracture',
-        'pearl': 'Pearl',
-        'lotus': 'Lotus',
-        'sunset': 'Sunset',
-        'abyss': 'Abyss'
-    }
+        return t('unknown')
     
-    return map_names.get(map_name, map_name.title())
+    map_ = get_catalog().map(map_url)
+    return map_.name if map_ else map_url.split('/')[-1].title()
 
 def format_timestamp(iso_time: str) -> Optional[int]:
     """ISO formatındaki zamanı Unix timestamp'e çevir"""
@@ -3,135 +3,226 @@ Henrik Dev Valorant API entegrasyonu
 API Dokümantasyon: https://docs.henrikdev.xyz/
 """
 
-import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+import requests
+
+import http_cache
+import henrik_scheduler
+from config import DEFAULT_HENRIK_BASE_URL
+from henrik_scheduler import HenrikRateLimited
+from json_extract import FieldExtractor
+from identity import PlayerIdentity, get_identity_cache
+from content_catalog import get_catalog
+from match_store import MatchStore, MatchSync, history_entry
+
+# get_player_status için toplam bekleme süresi (saniye)
+PLAYER_STATUS_DEADLINE = 8.0
+
+# v3 maç geçmişinden kullanılan alanlar - round, kill ve ekonomi detayları okunmaz
+MATCH_HISTORY_FIELDS = FieldExtractor([
+    'status',
+    'data.*.metadata',
+    'data.*.teams.*.rounds_won',
+    'data.*.teams.*.has_won',
+    'data.*.players.all_players.*.puuid',
+    'data.*.players.all_players.*.team',
+    'data.*.players.all_players.*.character',
+])
+
 class ValorantAPI:
     """Valorant API client"""
     
-    BASE_URL = "https://api.henrikdev.xyz/valorant"
+    BASE_URL = DEFAULT_HENRIK_BASE_URL
     
-    def __init__(self, config):
+    def __init__(self, config, match_store: Optional[MatchStore] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Valorant-Discord-RPC/1.0'
-        })
+        # Yerel mock sunucuya yönlendirilebilir
+        self.base_url = (getattr(config, 'henrik_base_url', '') or self.BASE_URL).rstrip('/')
+        # Bağlantılar ortak istemcide; API key sadece Henrik isteklerine eklenir
+        self.headers = {}
         
         # API Key varsa ekle
         if hasattr(config, 'henrik_api_key') and config.henrik_api_key:
-            self.session.headers.update({
-                'Authorization': config.henrik_api_key
-            })
+            self.headers['Authorization'] = config.henrik_api_key
+        
+        # Hesap, MMR ve maç geçmişi istekleri paralel çalışır
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='henrik')
+        
+        # Maç geçmişi ve istatistikler lokal depodan; depo ilk okunduğunda senkronize edilmeye başlar
+        self.match_store = match_store
+        self.match_sync = MatchSync(match_store) if match_store else None
         
         # Cache
         self.cache = {
             'account': None,
             'mmr': None,
-            'last_match': None
+            'recent_match': None
         }
     
-    def get_account_info(self) -> Optional[Dict[str, Any]]:
-        """Hesap bilgilerini al"""
+    def _identity(self, region: str = None) -> PlayerIdentity:
+        """Config'teki Riot ID - PUUID'si daha önce öğrenildiyse by-puuid ile sorgulanır"""
+        return get_identity_cache().resolve(None, self.config.riot_name, self.config.riot_tag,
+                                            region or self.config.region)
+    
+    def _with_cache(self, field: str, fetch) -> Optional[Dict[str, Any]]:
+        """fetch() başarısız olursa son başarılı sonucu döndür"""
         try:
-            url = f"{self.BASE_URL}/v1/account/{self.config.riot_name}/{self.config.riot_tag}"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 429:
-                self.logger.warning("Rate limit aşıldı (429), cache kullanılıyor")
-                return self.cache.get('account')
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data['status'] == 200:
-                    self.cache['account'] = data['data']
-                    return data['data']
-            
-            self.logger.error(f"Hesap bilgisi alınamadı: {response.status_code}")
-            return self.cache.get('account')
-            
+            return fetch()
+        except HenrikRateLimited as e:
+            self.logger.warning(f"{e}, cache kullanılıyor")
         except Exception as e:
-            self.logger.error(f"API hatası (account): {e}")
-            return self.cache.get('account')
+            self.logger.error(f"API hatası ({field}): {e}")
+        return self.cache.get(field)
+    
+    @staticmethod
+    def _check_response(response):
+        """
+        Henrik HTTP cevabını kontrol et
+        
+        Raises:
+            HenrikRateLimited: 429
+            requests.HTTPError: Diğer başarısız durum kodları
+        """
+        if response.status_code == 429:
+            raise HenrikRateLimited("Rate limit aşıldı (429)")
+        if response.status_code != 200:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+    
+    def _henrik_data(self, response) -> Any:
+        """Başarılı Henrik cevabının data alanı"""
+        self._check_response(response)
+        body = response.json()
+        if body.get('status') != 200:
+            raise requests.HTTPError(f"Henrik status {body.get('status')}", response=response)
+        return body['data']
+    
+    def get_account_info(self) -> Optional[Dict[str, Any]]:
+        """Hesap bilgilerini al - hata olursa son başarılı sonuç"""
+        return self._with_cache('account', self._fetch_account)
+    
+    def _fetch_account(self) -> Dict[str, Any]:
+        url = f"{self.base_url}/{self._identity().account_path()}"
+        response = http_cache.get(url, headers=self.headers,
+                                  fetch=henrik_scheduler.fetcher(henrik_scheduler.PRIORITY_PROFILE))
+        data = self._henrik_data(response)
+        self.cache['account'] = data
+        get_identity_cache().remember_account(data)
+        return data
     
     def get_mmr_info(self, region: str = None) -> Optional[Dict[str, Any]]:
-        """MMR/Rank bilgilerini al"""
-        try:
-            region = region or self.config.region
-            url = f"{self.BASE_URL}/v2/mmr/{region}/{self.config.riot_name}/{self.config.riot_tag}"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 429:
-                self.logger.warning("Rate limit aşıldı (429), cache kullanılıyor")
-                return self.cache.get('mmr')
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data['status'] == 200:
-                    self.cache['mmr'] = data['data']
-                    return data['data']
-            
-            return self.cache.get('mmr')
-            
-        except Exception as e:
-            self.logger.error(f"API hatası (mmr): {e}")
-            return self.cache.get('mmr')
+        """MMR/Rank bilgilerini al - hata olursa son başarılı sonuç"""
+        return self._with_cache('mmr', lambda: self._fetch_mmr(region))
+    
+    def _fetch_mmr(self, region: str = None) -> Dict[str, Any]:
+        url = f"{self.base_url}/{self._identity(region).mmr_path()}"
+        response = http_cache.get(url, headers=self.headers,
+                                  fetch=henrik_scheduler.fetcher(henrik_scheduler.PRIORITY_RANK))
+        data = self._henrik_data(response)
+        self.cache['mmr'] = data
+        return data
+    
+    def _stored_matches(self, identity: PlayerIdentity) -> bool:
+        """Oyuncunun depoda maçı var mı? Okuyan olduğu için senkronizasyonu da başlatır"""
+        if not self.match_store or not identity.puuid:
+            return False
+        if not self.match_sync.running:
+            self.match_sync.configure(identity, api_key=self.headers.get('Authorization', ''),
+                                      base_url=self.base_url)
+            self.match_sync.start()
+        return self.match_store.count(identity.puuid) > 0
     
     def get_match_history(self, region: str = None, mode: str = "competitive", size: int = 1) -> Optional[list]:
-        """Maç geçmişini al"""
+        """Maç geçmişini al - depoda maç varsa API'ye gidilmez, hata olursa None"""
         try:
-            region = region or self.config.region
-            url = f"{self.BASE_URL}/v3/matches/{region}/{self.config.riot_name}/{self.config.riot_tag}"
-            params = {
-                'mode': mode,
-                'size': size
-            }
-            response = self.session.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data['status'] == 200:
-                    return data['data']
-            
-            return None
-            
+            return self._fetch_match_history(region, mode, size)
         except Exception as e:
             self.logger.error(f"API hatası (match history): {e}")
             return None
     
-    def get_player_status(self) -> Optional[Dict[str, Any]]:
+    def _fetch_match_history(self, region: str = None, mode: str = "competitive", size: int = 1) -> list:
+        identity = self._identity(region)
+        if self._stored_matches(identity):
+            return [history_entry(row) for row in self.match_store.recent(identity.puuid, mode, size)]
+        
+        url = f"{self.base_url}/{identity.matches_path()}"
+        params = {
+            'mode': mode,
+            'size': size
+        }
+        response = henrik_scheduler.get(url, params=params, headers=self.headers,
+                                        priority=henrik_scheduler.PRIORITY_HISTORY, stream=True)
+        try:
+            self._check_response(response)
+            data = MATCH_HISTORY_FIELDS.extract(response)
+        finally:
+            response.close()
+        if data.get('status') != 200:
+            raise requests.HTTPError(f"Henrik status {data.get('status')}", response=response)
+        return data.get('data') or []
+    
+    def _fetch_recent_match(self) -> Optional[Dict[str, Any]]:
+        """Son maç - hiç maç yoksa None; istek başarısız olursa cache'teki kalır"""
+        matches = self._fetch_match_history(size=1)
+        self.cache['recent_match'] = matches[0] if matches else None
+        return self.cache['recent_match']
+    
+    def get_match_stats(self, region: str = None, mode: Optional[str] = "competitive",
+                        since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Galibiyet, K/D ve RR özeti - sadece depodan; depo boşsa None"""
+        identity = self._identity(region)
+        if not self._stored_matches(identity):
+            return None
+        return self.match_store.stats(identity.puuid, mode, since)
+    
+    def close(self):
+        """Arka plan senkronizasyonunu ve istek thread'lerini durdur"""
+        if self.match_sync:
+            self.match_sync.stop(timeout=5)
+        # Süresi dolmuş istekler beklenmez
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_player_status(self, deadline: float = PLAYER_STATUS_DEADLINE) -> Dict[str, Any]:
         """
         Oyuncunun mevcut durumunu al
         Bu fonksiyon hesap bilgisi, rank ve son maç verilerini birleştirir
+        
+        Üç istek paralel çalışır ve toplam `deadline` saniye beklenir. Süre
+        dolduğunda veya istek başarısız olduğunda alanın adı `missing`
+        listesine eklenir ve değeri son başarılı sonuç (yoksa None) olur.
+        Başarılı ama boş sonuç (ör. hiç maç yok) eksik sayılmaz.
         """
-        try:
-            # Hesap bilgilerini al
-            account = self.get_account_info()
-            if not account:
-                return None
-            
-            # MMR bilgilerini al
-            mmr = self.get_mmr_info()
-            
-            # Son maç bilgisini al (opsiyonel)
-            recent_matches = self.get_match_history(size=1)
-            
-            # Tüm verileri birleştir
-            player_data = {
-                'account': account,
-                'mmr': mmr,
-                'recent_match': recent_matches[0] if recent_matches else None,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            return player_data
-            
-        except Exception as e:
-            self.logger.error(f"Oyuncu durumu alınamadı: {e}")
-            return None
+        requests_by_field = {
+            'account': self._fetch_account,
+            'mmr': self._fetch_mmr,
+            'recent_match': self._fetch_recent_match,
+        }
+        futures = {field: self._executor.submit(func) for field, func in requests_by_field.items()}
+        wait(futures.values(), timeout=deadline)
+        
+        player_data = {'missing': []}
+        for field, future in futures.items():
+            if future.done() and not future.cancelled():
+                try:
+                    value = future.result()
+                except Exception as e:
+                    self.logger.error(f"Oyuncu durumu alınamadı ({field}): {e}")
+                    player_data['missing'].append(field)
+                    value = self.cache.get(field)
+            else:
+                # Geç kalan istek arka planda biter, sonucu bir sonraki çağrıda cache'ten gelir
+                self.logger.warning(f"Oyuncu durumu: {field} {deadline} saniyede gelmedi")
+                player_data['missing'].append(field)
+                value = self.cache.get(field)
+            
+            player_data[field] = value
+        
+        player_data['timestamp'] = datetime.now().isoformat()
+        return player_data
     
     def is_in_game(self, player_data: Dict[str, Any]) -> bool:
         """Oyuncu oyunda mı kontrol et"""
@@ -156,17 +247,6 @@ class ValorantAPI:
         return False
     
     def get_game_mode_display_name(self, mode: str) -> str:
-        """Oyun modu görünen adını al"""
-        mode_names = {
-            'competitive': 'Competitive',
-            'unrated': 'Unrated',
-            'spikerush': 'Spike Rush',
-            'deathmatch': 'Deathmatch',
-            'ggteam': 'Escalation',
-            'onefa': 'Replication',
-            'newmap': 'New Map',
-            'custom': 'Custom Game',
-            'swiftplay': 'Swiftplay',
-            'premier': 'Premier'
-        }
-        return mode_names.get(mode.lower(), mode.title())
+        """Oyun modu görünen adını al (aktif dilde)"""
+        queue = get_catalog().queue(mode)
+        return queue.name if queue else mode.title()